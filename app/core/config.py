@@ -12,6 +12,10 @@ class DATABASE_CONFIG:
     DATABASE_PORT = os.getenv("DATABASE_PORT", "3306")
     DATABASE_NAME = os.getenv("DATABASE_NAME", "default_dbname")
 
+    # 커넥션 풀 (프로세스별로 생성되므로 API / 워커 프로세스마다 다르게 지정 가능)
+    POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "10"))
+    MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", "20"))
+
     # MySQL 연결 문자열 예시 (pymysql 사용)
     DATABASE_URL = (
         f"mysql+pymysql://{DATABASE_USER}:{DATABASE_PASSWORD}@"
@@ -38,4 +42,132 @@ class GMAIL_CONFIG:
     MAIL_FROM = os.getenv("MAIL_FROM", GMAIL_ID or "")
     MAIL_FROM_NAME = os.getenv("MAIL_FROM_NAME", "Mailer")
     MAIL_TIMEOUT = int(os.getenv("MAIL_TIMEOUT", "30"))
-    MAIL_RETRY = int(os.getenv("MAIL_RETRY", "2"))
\ No newline at end of file
+    MAIL_RETRY = int(os.getenv("MAIL_RETRY", "2"))
+
+class SYNC_1688_CONFIG:
+    # 1688 물류 상태 동기화 동시 처리 설정
+    CONCURRENCY_PER_ACCOUNT = int(os.getenv("SYNC_1688_CONCURRENCY_PER_ACCOUNT", "5"))  # 계정별 동시 호출 수
+    APPLY_BATCH_SIZE = int(os.getenv("SYNC_1688_APPLY_BATCH_SIZE", "200"))  # DB 반영 배치 크기
+    # 증분 동기화 (종료 상태 제외, 최근 변경 주문 우선)
+    TERMINAL_DELIVERY_STATUSES = tuple(
+        status.strip() for status in os.getenv("SYNC_1688_TERMINAL_STATUSES", "SIGN,CANCEL").split(",") if status.strip()
+    )
+    ACTIVE_INTERVAL_MINUTES = int(os.getenv("SYNC_1688_ACTIVE_INTERVAL_MINUTES", "120"))  # 최근 변경/신규 주문 조회 주기
+    MAX_INTERVAL_MINUTES = int(os.getenv("SYNC_1688_MAX_INTERVAL_MINUTES", "1440"))  # 오래 변화 없는 주문 최대 조회 주기
+    MAX_ORDERS_PER_RUN = int(os.getenv("SYNC_1688_MAX_ORDERS_PER_RUN", "0"))  # 1회 최대 조회 건수 (0: 제한 없음)
+    # 스케줄 주기
+    ORDER_STATUS_INTERVAL_MINUTES = int(os.getenv("SYNC_1688_ORDER_STATUS_INTERVAL_MINUTES", "120"))
+    PAYMENT_LINK_INTERVAL_MINUTES = int(os.getenv("SYNC_1688_PAYMENT_LINK_INTERVAL_MINUTES", "30"))
+    PAYMENT_LINK_BATCH_SIZE = int(os.getenv("SYNC_1688_PAYMENT_LINK_BATCH_SIZE", "20"))  # grouppay 1회 최대 주문 수
+
+class HTTP_1688_CONFIG:
+    # 1688 공용 HTTP 클라이언트 (keep-alive 커넥션 풀) 설정
+    MAX_CONNECTIONS = int(os.getenv("HTTP_1688_MAX_CONNECTIONS", "100"))
+    MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_1688_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    KEEPALIVE_EXPIRY = float(os.getenv("HTTP_1688_KEEPALIVE_EXPIRY", "30"))
+    CONNECT_TIMEOUT = float(os.getenv("HTTP_1688_CONNECT_TIMEOUT", "5"))
+    TIMEOUT = float(os.getenv("HTTP_1688_TIMEOUT", "30"))
+    HTTP2 = os.getenv("HTTP_1688_HTTP2", "false").lower() == "true"  # h2 패키지 필요 (pip install httpx[http2])
+    RECORD_DIR = os.getenv("RECORD_1688_DIR")  # 설정 시 응답을 JSONL로 녹화 (fake_1688_server 재생용)
+
+class ORDER_1688_CONFIG:
+    # 1688 주문 생성 시 판매자별 동시 호출 수
+    CREATE_CONCURRENCY = int(os.getenv("ORDER_1688_CREATE_CONCURRENCY", "8"))
+
+class PRODUCT_OPTION_CACHE_CONFIG:
+    # 1688 상품 옵션(SKU) 조회 캐시 - 메모리 LRU + DB
+    MEMORY_MAX_ENTRIES = int(os.getenv("PRODUCT_OPTION_CACHE_MEMORY_MAX_ENTRIES", "5000"))
+    MEMORY_TTL_SECONDS = int(os.getenv("PRODUCT_OPTION_CACHE_MEMORY_TTL_SECONDS", "600"))
+    DB_TTL_SECONDS = int(os.getenv("PRODUCT_OPTION_CACHE_DB_TTL_SECONDS", "86400"))
+    NEGATIVE_TTL_SECONDS = int(os.getenv("PRODUCT_OPTION_CACHE_NEGATIVE_TTL_SECONDS", "3600"))  # 조회 불가 상품 재확인 주기
+    BATCH_MAX_OFFERS = int(os.getenv("PRODUCT_OPTION_BATCH_MAX_OFFERS", "500"))  # 일괄 조회 요청당 최대 상품 수
+    BATCH_CONCURRENCY = int(os.getenv("PRODUCT_OPTION_BATCH_CONCURRENCY", "8"))  # 캐시 미스 동시 조회 수
+
+class TRANSLATION_CONFIG:
+    # 번역 서비스 (google: googletrans, local: 로컬 사전 - 오프라인 테스트용)
+    BACKEND = os.getenv("TRANSLATION_BACKEND", "google")
+    LOCAL_DICTIONARY_PATH = os.getenv("TRANSLATION_LOCAL_DICTIONARY_PATH")  # {"원문": "번역"} JSON 파일
+    MEMORY_MAX_ENTRIES = int(os.getenv("TRANSLATION_MEMORY_MAX_ENTRIES", "10000"))
+    MEMORY_TTL_SECONDS = int(os.getenv("TRANSLATION_MEMORY_TTL_SECONDS", "86400"))
+    BATCH_SIZE = int(os.getenv("TRANSLATION_BATCH_SIZE", "50"))  # 백엔드 1회 호출당 문장 수
+    BACKEND_CONCURRENCY = int(os.getenv("TRANSLATION_BACKEND_CONCURRENCY", "4"))
+    MAX_BATCH_TEXTS = int(os.getenv("TRANSLATION_MAX_BATCH_TEXTS", "1000"))  # API 요청당 최대 문장 수
+
+class CJ_LOGISTICS_CONFIG:
+    # CJ대한통운 API 설정
+    BASE_URL = os.getenv("CJ_LOGISTICS_BASE_URL", "")
+    CUST_ID = os.getenv("CJ_LOGISTICS_CUST_ID", "")
+    BIZ_REG_NUM = os.getenv("CJ_LOGISTICS_BIZ_REG_NUM", "")
+    MAX_CONNECTIONS = int(os.getenv("CJ_LOGISTICS_MAX_CONNECTIONS", "20"))
+    TIMEOUT = float(os.getenv("CJ_LOGISTICS_TIMEOUT", "30"))
+    PER_SECOND = float(os.getenv("CJ_LOGISTICS_PER_SECOND", "5"))  # 초당 호출 수 (0: 제한 없음)
+    BURST = int(os.getenv("CJ_LOGISTICS_BURST", "5"))  # 순간 최대 호출 수
+    ISSUE_CONCURRENCY = int(os.getenv("CJ_LOGISTICS_ISSUE_CONCURRENCY", "8"))  # 운송장 동시 발급 수
+    TOKEN_EXPIRY_MARGIN_SECONDS = int(os.getenv("CJ_LOGISTICS_TOKEN_EXPIRY_MARGIN_SECONDS", "300"))  # 만료 N초 전부터 갱신 대상
+    TOKEN_PROACTIVE_REFRESH_SECONDS = int(os.getenv("CJ_LOGISTICS_TOKEN_PROACTIVE_REFRESH_SECONDS", "1800"))  # 만료 N초 전 백그라운드 갱신
+    TOKEN_RETRY_INTERVAL_SECONDS = int(os.getenv("CJ_LOGISTICS_TOKEN_RETRY_INTERVAL_SECONDS", "60"))  # 백그라운드 갱신 실패 시 재시도 주기
+    TRACKING_PROCESS = os.getenv("CJ_LOGISTICS_TRACKING_PROCESS", "ReqOneGdsTrc")  # 운송장 배송 추적 API
+
+class SYNC_CJ_CONFIG:
+    # CJ 배송 추적 동기화 (종료 상태 제외, 최근 변경 박스 우선)
+    CONCURRENCY = int(os.getenv("SYNC_CJ_CONCURRENCY", "4"))  # 동시 조회 수 (호출 한도는 CJ_LOGISTICS_PER_SECOND)
+    BATCH_SIZE = int(os.getenv("SYNC_CJ_BATCH_SIZE", "100"))  # 조회 / DB 반영 배치 크기
+    TERMINAL_STATUSES = tuple(
+        status.strip() for status in os.getenv("SYNC_CJ_TERMINAL_STATUSES", "91").split(",") if status.strip()
+    )  # CJ 화물 상태 코드 (91: 배달완료)
+    ACTIVE_INTERVAL_MINUTES = int(os.getenv("SYNC_CJ_ACTIVE_INTERVAL_MINUTES", "60"))
+    MAX_INTERVAL_MINUTES = int(os.getenv("SYNC_CJ_MAX_INTERVAL_MINUTES", "720"))
+    STALE_INTERVAL_RATIO = float(os.getenv("SYNC_CJ_STALE_INTERVAL_RATIO", "0.25"))  # 변화 없는 기간 대비 다음 조회 주기 비율
+    MAX_BOXES_PER_RUN = int(os.getenv("SYNC_CJ_MAX_BOXES_PER_RUN", "0"))  # 1회 최대 조회 건수 (0: 제한 없음)
+    INTERVAL_MINUTES = int(os.getenv("SYNC_CJ_INTERVAL_MINUTES", "30"))  # 스케줄 주기
+
+class EXCEL_EXPORT_CONFIG:
+    # 엑셀 다운로드 (write-only 워크북 + 서버 측 커서)
+    YIELD_PER = int(os.getenv("EXCEL_EXPORT_YIELD_PER", "1000"))  # DB 조회 시 한 번에 가져오는 행 수
+    # 생성된 파일 캐시 (조회 조건 + 원본 데이터 변경 시각 기준 키, 데이터가 같으면 재생성 없이 재사용)
+    # DB(COM_EXPORT_ARTIFACT) 저장이라 작업 워커와 다운로드 API가 다른 호스트여도 공유
+    ARTIFACT_CHUNK_SIZE = int(os.getenv("EXCEL_EXPORT_ARTIFACT_CHUNK_SIZE", "1048576"))  # DB 저장 / 응답 전송 단위 (bytes)
+    ARTIFACT_TTL_SECONDS = int(os.getenv("EXCEL_EXPORT_ARTIFACT_TTL_SECONDS", "21600"))
+    CLEANUP_INTERVAL_MINUTES = int(os.getenv("EXCEL_EXPORT_CLEANUP_INTERVAL_MINUTES", "30"))
+
+class ACCOUNT_1688_CONFIG:
+    # 1688 계정 설정 변경 감시 주기 (access_token 교체 등, 재시작 없이 반영)
+    RELOAD_CHECK_INTERVAL_SECONDS = int(os.getenv("ACCOUNT_1688_RELOAD_CHECK_INTERVAL_SECONDS", "60"))
+
+class RATE_LIMIT_1688_CONFIG:
+    # 1688 계정별 토큰 버킷 기본값 (COM_ACCOUNT_INFO_1688 값이 없을 때 사용)
+    DEFAULT_PER_SECOND = float(os.getenv("RATE_LIMIT_1688_PER_SECOND", "5"))  # 초당 호출 수 (0: 제한 없음)
+    DEFAULT_BURST = int(os.getenv("RATE_LIMIT_1688_BURST", "10"))  # 순간 최대 호출 수
+
+class RESILIENCE_1688_CONFIG:
+    # 1688 API 재시도 / 서킷 브레이커 설정
+    MAX_RETRIES = int(os.getenv("RESILIENCE_1688_MAX_RETRIES", "2"))
+    BACKOFF_BASE_SECONDS = float(os.getenv("RESILIENCE_1688_BACKOFF_BASE_SECONDS", "0.5"))
+    BACKOFF_MAX_SECONDS = float(os.getenv("RESILIENCE_1688_BACKOFF_MAX_SECONDS", "8"))
+    BREAKER_FAILURE_THRESHOLD = int(os.getenv("RESILIENCE_1688_BREAKER_FAILURE_THRESHOLD", "5"))  # 연속 실패 시 차단
+    BREAKER_RESET_SECONDS = float(os.getenv("RESILIENCE_1688_BREAKER_RESET_SECONDS", "30"))  # 차단 후 재시험까지 대기
+
+class JOB_LEASE_CONFIG:
+    # 스케줄 작업 분산 락(리스) 설정 - 워커가 죽으면 TTL 후 다른 워커가 획득
+    TTL_SECONDS = int(os.getenv("JOB_LEASE_TTL_SECONDS", "300"))
+    RENEW_INTERVAL_SECONDS = int(os.getenv("JOB_LEASE_RENEW_INTERVAL_SECONDS", "60"))
+
+class SCHEDULER_CONFIG:
+    # API 프로세스에서 스케줄러 실행 여부 (false면 python -m app.worker 로 별도 실행)
+    RUN_IN_API = os.getenv("SCHEDULER_RUN_IN_API", "true").lower() == "true"
+    RUN_HISTORY_RETENTION_DAYS = int(os.getenv("SCHEDULER_RUN_HISTORY_RETENTION_DAYS", "30"))  # 실행 이력 보관 기간
+
+class WEBHOOK_1688_CONFIG:
+    # 1688 메시지 푸시 수신함 consumer 설정
+    CONSUMER_INTERVAL_SECONDS = int(os.getenv("WEBHOOK_1688_CONSUMER_INTERVAL_SECONDS", "10"))
+    CONSUMER_BATCH_SIZE = int(os.getenv("WEBHOOK_1688_CONSUMER_BATCH_SIZE", "200"))
+    MAX_ATTEMPTS = int(os.getenv("WEBHOOK_1688_MAX_ATTEMPTS", "5"))
+
+class JOB_QUEUE_CONFIG:
+    # 외부 API 작업 큐 (1688 주문 / 결제 링크 / CJ 운송장) 워커 설정
+    CONCURRENCY = int(os.getenv("JOB_QUEUE_CONCURRENCY", "4"))  # 프로세스당 동시 처리 작업 수
+    POLL_INTERVAL_SECONDS = float(os.getenv("JOB_QUEUE_POLL_INTERVAL_SECONDS", "2"))
+    MAX_ATTEMPTS = int(os.getenv("JOB_QUEUE_MAX_ATTEMPTS", "3"))
+    RETRY_DELAY_SECONDS = int(os.getenv("JOB_QUEUE_RETRY_DELAY_SECONDS", "30"))  # 재시도 대기 (시도 횟수만큼 배수)
+    HEARTBEAT_INTERVAL_SECONDS = int(os.getenv("JOB_QUEUE_HEARTBEAT_INTERVAL_SECONDS", "30"))  # 처리 중 locked_at 갱신 주기
+    RUNNING_TIMEOUT_SECONDS = int(os.getenv("JOB_QUEUE_RUNNING_TIMEOUT_SECONDS", "300"))  # 하트비트(locked_at)가 끊긴 작업 회수 기준
@@ -1,68 +1,210 @@
-import random
+from app.core.rate_limiter_1688 import RATE_LIMITER_1688
+from app.core.config import ACCOUNT_1688_CONFIG
+from sqlalchemy import func
+from types import MappingProxyType
+from datetime import datetime
+import asyncio
 import hmac
 import hashlib
 import time
 
+class AccountConfig1688:
+    """1688 계정 설정 레코드 (불변, 기존 dict 방식 config['app_key'] 읽기 지원)"""
+    __slots__ = (
+        'account_no', 'app_key', 'app_secret', 'access_token', 'base_url', 'login_id', 'message',
+        'address_id', 'full_name', 'mobile', 'phone', 'post_code', 'city_text', 'province_text',
+        'area_text', 'town_text', 'address', 'district_code',
+    )
+
+    def __init__(self, **values):
+        for field in self.__slots__:
+            object.__setattr__(self, field, values.get(field, ''))
+
+    def __setattr__(self, key, value):
+        raise AttributeError("AccountConfig1688은 변경할 수 없습니다.")
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
+class AccountRegistrySnapshot1688:
+    """1688 계정 설정 스냅샷 (불변, 재로드 시 통째로 교체)"""
+    __slots__ = ('version', 'configs', 'account_nos', 'source_updated_at', 'loaded_at')
+
+    def __init__(self, version: int, configs: dict, source_updated_at=None):
+        object.__setattr__(self, 'version', version)
+        object.__setattr__(self, 'configs', MappingProxyType(configs))
+        object.__setattr__(self, 'account_nos', tuple(configs.keys()))
+        object.__setattr__(self, 'source_updated_at', source_updated_at)
+        object.__setattr__(self, 'loaded_at', datetime.now())
+
+    def __setattr__(self, key, value):
+        raise AttributeError("AccountRegistrySnapshot1688은 변경할 수 없습니다.")
+
+
 class ALIBABA_1688_API_CONFIG:
-    _all_configs = {}
+    _snapshot = AccountRegistrySnapshot1688(0, {})
+    _watcher_task = None
 
     @classmethod
     def load_all_configs(cls, db_session):
-        """모든 1688 계정 설정을 메모리에 로드"""
+        """모든 1688 계정 설정을 새 스냅샷으로 로드 후 교체 (요청 처리 중에도 안전)"""
         from app.modules.common.models import ComAccountInfo1688
 
         accounts = db_session.query(ComAccountInfo1688).all()
 
-        cls._all_configs = {}
+        configs = {}
         for account in accounts:
-            cls._all_configs[account.account_info_no_1688] = {
-                'app_key': account.app_key or '',
-                'app_secret': account.app_secret or '',
-                'access_token': account.access_token or '',
-                'base_url': account.base_url or '',
-                'login_id': account.login_id_1688 or '',
-                'message': account.message or '',
-                'address_id': account.address_id or '',
-                'full_name': account.full_name or '',
-                'mobile': account.mobile or '',
-                'phone': account.phone or '',
-                'post_code': account.post_code or '',
-                'city_text': account.city_text or '',
-                'province_text': account.province_text or '',
-                'area_text': account.area_text or '',
-                'town_text': account.town_text or '',
-                'address': account.address or '',
-                'district_code': account.district_code or '',
-            }
+            configs[account.account_info_no_1688] = AccountConfig1688(
+                account_no=account.account_info_no_1688,
+                app_key=account.app_key or '',
+                app_secret=account.app_secret or '',
+                access_token=account.access_token or '',
+                base_url=account.base_url or '',
+                login_id=account.login_id_1688 or '',
+                message=account.message or '',
+                address_id=account.address_id or '',
+                full_name=account.full_name or '',
+                mobile=account.mobile or '',
+                phone=account.phone or '',
+                post_code=account.post_code or '',
+                city_text=account.city_text or '',
+                province_text=account.province_text or '',
+                area_text=account.area_text or '',
+                town_text=account.town_text or '',
+                address=account.address or '',
+                district_code=account.district_code or '',
+            )
+
+        # 계정별 호출 한도 (토큰 버킷, 재정의 없는 계정은 RATE_LIMIT_1688_CONFIG 기본값)
+        rate_limits, rate_limit_updated_at = cls._load_rate_limits(db_session)
+        RATE_LIMITER_1688.configure({
+            account.account_info_no_1688: rate_limits.get(account.account_info_no_1688, (None, None))
+            for account in accounts
+        })
+
+        # 변경 감지 기준: 계정 / 호출 한도 테이블의 최종 updated_at
+        updated_ats = [account.updated_at for account in accounts if account.updated_at]
+        if rate_limit_updated_at:
+            updated_ats.append(rate_limit_updated_at)
+        source_updated_at = max(updated_ats, default=None)
+
+        # 참조 교체는 원자적이므로 진행 중인 호출은 이전 스냅샷을 그대로 사용
+        cls._snapshot = AccountRegistrySnapshot1688(cls._snapshot.version + 1, configs, source_updated_at)
+
+        return cls._snapshot
+
+    @classmethod
+    def _load_rate_limits(cls, db_session):
+        """
+        계정별 호출 한도 재정의 (COM_ACCOUNT_RATE_LIMIT_1688, 조회 실패 시 전체 기본값)
+
+        Returns:
+            tuple: ({account_no: (초당 호출 수, 순간 최대 호출 수)}, 최종 수정 일시)
+        """
+        from app.modules.common.models import ComAccountRateLimit1688
+
+        try:
+            rate_limits = db_session.query(ComAccountRateLimit1688).all()
+        except Exception as e:
+            # 테이블 생성 전(API 최초 기동 전 워커 실행 등)에도 계정 설정 로드는 계속 진행
+            db_session.rollback()
+            print(f"1688 계정별 호출 한도 조회 실패, 기본값 사용: {str(e)}")
+            return {}, None
+
+        return (
+            {
+                rate_limit.account_info_no_1688: (rate_limit.rate_limit_per_second, rate_limit.rate_limit_burst)
+                for rate_limit in rate_limits
+            },
+            max((rate_limit.updated_at for rate_limit in rate_limits if rate_limit.updated_at), default=None)
+        )
+
+    @classmethod
+    def get_snapshot(cls):
+        return cls._snapshot
+
+    @classmethod
+    def reload_if_changed(cls, db_session) -> bool:
+        """계정 / 호출 한도 테이블 변경(updated_at / 건수) 감지 시에만 재로드"""
+        from app.modules.common.models import ComAccountInfo1688, ComAccountRateLimit1688
+
+        source_updated_at, account_count = db_session.query(
+            func.max(ComAccountInfo1688.updated_at),
+            func.count(ComAccountInfo1688.account_info_no_1688)
+        ).one()
+
+        try:
+            rate_limit_updated_at = db_session.query(func.max(ComAccountRateLimit1688.updated_at)).scalar()
+        except Exception:
+            db_session.rollback()
+            rate_limit_updated_at = None
+        if rate_limit_updated_at and (source_updated_at is None or rate_limit_updated_at > source_updated_at):
+            source_updated_at = rate_limit_updated_at
+
+        snapshot = cls._snapshot
+        if snapshot.version and source_updated_at == snapshot.source_updated_at and account_count == len(snapshot.account_nos):
+            return False
+
+        cls.load_all_configs(db_session)
+        print(f"✅ 1688 계정 설정 재로드 (version={cls._snapshot.version}, 계정 {account_count}개)")
+        return True
+
+    @classmethod
+    async def _watch_account_changes(cls, session_factory):
+        while True:
+            await asyncio.sleep(ACCOUNT_1688_CONFIG.RELOAD_CHECK_INTERVAL_SECONDS)
+
+            db = session_factory()
+            try:
+                cls.reload_if_changed(db)
+            except Exception as e:
+                print(f"1688 계정 설정 변경 확인 실패: {str(e)}")
+            finally:
+                db.close()
+
+    @classmethod
+    def start_watcher(cls, session_factory):
+        """계정 설정 변경 감시 시작 (프로세스마다 실행, 토큰 교체 시 재시작 불필요)"""
+        if cls._watcher_task is None or cls._watcher_task.done():
+            cls._watcher_task = asyncio.create_task(cls._watch_account_changes(session_factory))
+
+    @classmethod
+    async def stop_watcher(cls):
+        if cls._watcher_task is not None:
+            cls._watcher_task.cancel()
+            await asyncio.gather(cls._watcher_task, return_exceptions=True)
+            cls._watcher_task = None
 
     @classmethod
     def _get_random_account_config(cls):
-        """매번 랜덤 계정 선택"""
-        if not cls._all_configs:
+        """호출 여유(토큰)가 가장 많은 계정 선택 (동률이면 랜덤)"""
+        snapshot = cls._snapshot
+        if not snapshot.account_nos:
             raise ValueError("설정이 로드되지 않았습니다. load_all_configs()를 먼저 호출하세요.")
 
-        account_no = random.choice(list(cls._all_configs.keys()))
-        config = cls._all_configs[account_no].copy()
-        config['account_no'] = account_no
-
-        return config
+        return snapshot.configs[RATE_LIMITER_1688.pick_account(snapshot.account_nos)]
 
     @classmethod
     def _get_account_config(cls, account_no=None):
-        """계정 설정 가져오기 (account_no 없으면 랜덤)"""
-        if not cls._all_configs:
+        """계정 설정 가져오기 (account_no 없으면 호출 여유가 가장 많은 계정)"""
+        snapshot = cls._snapshot
+        if not snapshot.account_nos:
             raise ValueError("설정이 로드되지 않았습니다. load_all_configs()를 먼저 호출하세요.")
 
         if account_no is None:
-            # 랜덤 선택
-            account_no = random.choice(list(cls._all_configs.keys()))
-        elif account_no not in cls._all_configs:
+            # 호출 여유가 가장 많은 계정 선택
+            account_no = RATE_LIMITER_1688.pick_account(snapshot.account_nos)
+        elif account_no not in snapshot.configs:
             raise ValueError(f"계정 번호 {account_no}를 찾을 수 없습니다.")
 
-        config = cls._all_configs[account_no].copy()
-        config['account_no'] = account_no
-
-        return config
+        return snapshot.configs[account_no]
 
     @classmethod
     def generate_signature(cls, url_path, params, config):
@@ -9,8 +9,8 @@ engine = create_engine(
     DATABASE_CONFIG.DATABASE_URL,
     connect_args={"check_same_thread": False} if "sqlite" in DATABASE_CONFIG.DATABASE_URL else {},
     poolclass=QueuePool,
-    pool_size=10,  # 기본 연결 풀 크기
-    max_overflow=20,  # 추가로 생성 가능한 연결 수
+    pool_size=DATABASE_CONFIG.POOL_SIZE,  # 기본 연결 풀 크기
+    max_overflow=DATABASE_CONFIG.MAX_OVERFLOW,  # 추가로 생성 가능한 연결 수
     pool_pre_ping=True,  # 쿼리 실행 전 연결 확인 (중요!)
     pool_recycle=3600,  # 1시간(3600초)마다 연결 재생성
     echo=False,  # True로 설정하면 SQL 로그 출력
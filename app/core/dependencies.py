@@ -22,7 +22,8 @@ EXCLUDED_PATHS = [
     r"^/openapi\.json$",
     r"^/redoc.*",
     r"^/$",
-    r"^/health$"
+    r"^/health$",
+    r"^/webhooks/1688/\d+$"  # 1688 메시지 푸시 (서명으로 검증)
 ]
 
 security = HTTPBearer(auto_error=False)
@@ -0,0 +1,49 @@
+# app/core/http_client_1688.py
+import importlib.util
+import httpx
+from app.core.config import HTTP_1688_CONFIG
+
+
+class HTTP_CLIENT_1688:
+    """1688 API 공용 HTTP 클라이언트 (lifespan에서 생성/종료)"""
+    _client = None
+
+    @classmethod
+    def _build_client(cls):
+        http2 = HTTP_1688_CONFIG.HTTP2
+        if http2:
+            if importlib.util.find_spec("h2") is None:
+                print("⚠️ h2 패키지가 없어 HTTP/1.1로 동작합니다. (pip install httpx[http2])")
+                http2 = False
+
+        return httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=HTTP_1688_CONFIG.MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_1688_CONFIG.MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_1688_CONFIG.KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(
+                HTTP_1688_CONFIG.TIMEOUT,
+                connect=HTTP_1688_CONFIG.CONNECT_TIMEOUT,
+            ),
+        )
+
+    @classmethod
+    def start(cls):
+        """공용 클라이언트 생성 (이미 있으면 재사용)"""
+        if cls._client is None or cls._client.is_closed:
+            cls._client = cls._build_client()
+        return cls._client
+
+    @classmethod
+    def get_client(cls):
+        """공용 클라이언트 반환 (lifespan 밖에서 호출된 경우 지연 생성)"""
+        return cls.start()
+
+    @classmethod
+    async def close(cls):
+        """공용 클라이언트 종료"""
+        if cls._client is not None and not cls._client.is_closed:
+            await cls._client.aclose()
+        cls._client = None
@@ -0,0 +1,37 @@
+# app/core/http_client_cj.py
+import httpx
+from app.core.config import CJ_LOGISTICS_CONFIG
+
+
+class HTTP_CLIENT_CJ:
+    """CJ대한통운 API 공용 HTTP 클라이언트 (lifespan에서 생성/종료)"""
+    _client = None
+
+    @classmethod
+    def _build_client(cls):
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=CJ_LOGISTICS_CONFIG.MAX_CONNECTIONS,
+                max_keepalive_connections=CJ_LOGISTICS_CONFIG.MAX_CONNECTIONS,
+            ),
+            timeout=httpx.Timeout(CJ_LOGISTICS_CONFIG.TIMEOUT),
+        )
+
+    @classmethod
+    def start(cls):
+        """공용 클라이언트 생성 (이미 있으면 재사용)"""
+        if cls._client is None or cls._client.is_closed:
+            cls._client = cls._build_client()
+        return cls._client
+
+    @classmethod
+    def get_client(cls):
+        """공용 클라이언트 반환 (lifespan 밖에서 호출된 경우 지연 생성)"""
+        return cls.start()
+
+    @classmethod
+    async def close(cls):
+        """공용 클라이언트 종료"""
+        if cls._client is not None and not cls._client.is_closed:
+            await cls._client.aclose()
+        cls._client = None
@@ -0,0 +1,85 @@
+# app/core/rate_limiter_1688.py
+import asyncio
+import random
+import time
+from app.core.config import RATE_LIMIT_1688_CONFIG
+
+
+class TokenBucket:
+    """토큰 버킷 (초당 rate개 충전, 최대 capacity개 보관)"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def available(self) -> float:
+        """현재 사용 가능한 토큰 수"""
+        self._refill()
+        return self.tokens
+
+    async def acquire(self):
+        """토큰 1개 획득 (부족하면 충전될 때까지 대기)"""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class RATE_LIMITER_1688:
+    """1688 계정(account_info_no_1688)별 토큰 버킷 레지스트리"""
+    _buckets = {}
+
+    @classmethod
+    def configure(cls, limits: dict):
+        """
+        계정별 한도 설정 (한도가 바뀌지 않은 계정은 기존 버킷 상태 유지)
+
+        Args:
+            limits: {account_no: (초당 호출 수, 순간 최대 호출 수)} - 값이 None이면 기본값 사용
+        """
+        buckets = {}
+        for account_no, (per_second, burst) in limits.items():
+            rate = float(per_second) if per_second is not None else RATE_LIMIT_1688_CONFIG.DEFAULT_PER_SECOND
+            capacity = int(burst) if burst is not None else RATE_LIMIT_1688_CONFIG.DEFAULT_BURST
+
+            if rate <= 0:
+                continue  # 제한 없음
+
+            bucket = cls._buckets.get(account_no)
+            if bucket is None or bucket.rate != rate or bucket.capacity != max(capacity, 1):
+                bucket = TokenBucket(rate, capacity)
+            buckets[account_no] = bucket
+
+        cls._buckets = buckets
+
+    @classmethod
+    def available(cls, account_no) -> float:
+        """계정의 사용 가능한 호출 수 (제한 없는 계정은 무한대)"""
+        bucket = cls._buckets.get(account_no)
+        return bucket.available() if bucket else float("inf")
+
+    @classmethod
+    def pick_account(cls, account_nos):
+        """사용 가능한 호출 수가 가장 많은 계정 선택 (동률이면 랜덤)"""
+        if not isinstance(account_nos, (list, tuple)):
+            account_nos = list(account_nos)
+        best = max(cls.available(account_no) for account_no in account_nos)
+        return random.choice([account_no for account_no in account_nos if cls.available(account_no) >= best])
+
+    @classmethod
+    async def acquire(cls, account_no):
+        """계정 호출 한도 획득 (초과 시 실패하지 않고 대기)"""
+        bucket = cls._buckets.get(account_no)
+        if bucket:
+            await bucket.acquire()
@@ -1,5 +1,6 @@
 
-from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, DECIMAL, ForeignKey, func, Text
+from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, DECIMAL, ForeignKey, func, Text, LargeBinary
+from sqlalchemy.dialects.mysql import LONGBLOB
 from app.core.database import Base
 
 
@@ -85,4 +86,83 @@ class ComToken(Base):
     token = Column(String(100), nullable=True, default="", comment="토큰")
     token_expire_date = Column(String(100), nullable=True,  comment='토큰만료일')
     created_at = Column(DateTime, default=func.now(), nullable=False)
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
\ No newline at end of file
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+
+class ComAccountRateLimit1688(Base):
+    __tablename__ = "COM_ACCOUNT_RATE_LIMIT_1688"
+
+    account_info_no_1688 = Column(Integer, primary_key=True, comment='1688 계정 정보 번호')
+    rate_limit_per_second = Column(DECIMAL(10, 2), nullable=True, comment='초당 API 호출 한도 (NULL: 기본값, 0: 제한 없음)')
+    rate_limit_burst = Column(Integer, nullable=True, comment='순간 최대 API 호출 수 (NULL: 기본값)')
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+
+class ComJobLease(Base):
+    __tablename__ = "COM_JOB_LEASE"
+
+    job_id = Column(String(100), primary_key=True, comment='스케줄 작업 ID')
+    holder = Column(String(200), nullable=True, comment='리스 보유 워커 (host:pid)')
+    lease_until = Column(DateTime, nullable=True, comment='리스 만료 일시')
+    acquired_at = Column(DateTime, nullable=True, comment='리스 획득 일시')
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+
+class ComSyncRunHistory(Base):
+    __tablename__ = "COM_SYNC_RUN_HISTORY"
+
+    run_no = Column(Integer, primary_key=True, autoincrement=True, comment='실행 번호')
+    job_id = Column(String(100), nullable=False, index=True, comment='스케줄 작업 ID')
+    worker_id = Column(String(200), nullable=True, comment='실행 워커 (host:pid)')
+    status = Column(String(20), nullable=False, default='RUNNING', comment='상태(RUNNING, SUCCESS, FAILED)')
+    started_at = Column(DateTime, nullable=False, comment='시작 일시')
+    finished_at = Column(DateTime, nullable=True, comment='종료 일시')
+    duration_ms = Column(Integer, nullable=True, comment='소요 시간(ms)')
+    target_count = Column(Integer, nullable=False, default=0, comment='대상 건수')
+    success_count = Column(Integer, nullable=False, default=0, comment='성공 건수')
+    not_shipped_count = Column(Integer, nullable=False, default=0, comment='미발송 건수 (500_2)')
+    no_info_count = Column(Integer, nullable=False, default=0, comment='물류 정보 없음 건수')
+    failed_count = Column(Integer, nullable=False, default=0, comment='실패 건수')
+    rows_updated = Column(Integer, nullable=False, default=0, comment='DB 반영 행 수')
+    api_call_count = Column(Integer, nullable=False, default=0, comment='1688 API 호출 수')
+    account_calls = Column(Text, nullable=True, comment='계정별 호출 수(JSON)')
+    latency_p50_ms = Column(Integer, nullable=True, comment='1688 응답 시간 p50(ms)')
+    latency_p95_ms = Column(Integer, nullable=True, comment='1688 응답 시간 p95(ms)')
+    latency_max_ms = Column(Integer, nullable=True, comment='1688 응답 시간 최대(ms)')
+    error_message = Column(String(1000), nullable=True, comment='실패 사유')
+
+class ComProductOptionCache1688(Base):
+    __tablename__ = "COM_PRODUCT_OPTION_CACHE_1688"
+
+    offer_id = Column(String(50), primary_key=True, comment='1688 상품 ID (offerId)')
+    status = Column(String(20), nullable=False, comment='상태(OK, INVALID: 조회 불가 상품 - 네거티브 캐시)')
+    options = Column(Text, nullable=True, comment='정규화된 옵션 목록(JSON)')
+    error_message = Column(String(1000), nullable=True, comment='조회 실패 메시지 (INVALID)')
+    fetched_at = Column(DateTime, nullable=False, comment='1688 조회 일시')
+    expires_at = Column(DateTime, nullable=False, comment='캐시 만료 일시')
+
+class ComTranslationCache(Base):
+    __tablename__ = "COM_TRANSLATION_CACHE"
+
+    text_hash = Column(String(64), primary_key=True, comment='SHA-256(원문 언어 + 번역 언어 + 원문)')
+    src_lang = Column(String(10), nullable=False, comment='원문 언어')
+    dest_lang = Column(String(10), nullable=False, comment='번역 언어')
+    source_text = Column(Text, nullable=False, comment='원문')
+    translated_text = Column(Text, nullable=False, comment='번역문')
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+
+class ComExportArtifact(Base):
+    __tablename__ = "COM_EXPORT_ARTIFACT"
+
+    cache_key = Column(String(64), primary_key=True, comment='캐시 키 (SHA-256: 다운로드 종류 + 조회 조건 + 원본 데이터 버전)')
+    file_name = Column(String(255), nullable=False, comment='다운로드 파일명')
+    file_size = Column(Integer, nullable=False, comment='파일 크기(bytes)')
+    chunk_count = Column(Integer, nullable=False, default=0, comment='저장 청크 수')
+    meta = Column(Text, nullable=True, comment='생성 정보(JSON)')
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True, comment='만료 일시')
+
+class ComExportArtifactChunk(Base):
+    __tablename__ = "COM_EXPORT_ARTIFACT_CHUNK"
+
+    cache_key = Column(String(64), primary_key=True, comment='캐시 키')
+    seq = Column(Integer, primary_key=True, comment='청크 순번 (0부터)')
+    data = Column(LargeBinary().with_variant(LONGBLOB, 'mysql'), nullable=False, comment='파일 내용 조각')
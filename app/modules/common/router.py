@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Path, Request
+from fastapi import APIRouter, Depends, Path, Request, Query
 from app.common.response import ApiResponse, PageResponse
 from typing import Union
 from app.modules.common import service as common_service
@@ -9,8 +9,27 @@ from app.modules.common import schemas as common_schemas
 common_router = APIRouter()
 
 @common_router.get("/products/{offer_id}/options")
-async def fetch_alibaba_product_options(offer_id: Union[str, int] = Path(...),) -> ApiResponse[list]:
-    return await common_service.fetch_alibaba_product_options(offer_id)
+async def fetch_alibaba_product_options(
+        offer_id: Union[str, int] = Path(...),
+        refresh: bool = Query(False, description="캐시 무시하고 1688에서 다시 조회"),
+        db: Session = Depends(get_db)
+) -> ApiResponse[list]:
+    return await common_service.fetch_alibaba_product_options(offer_id, db, refresh)
+
+@common_router.post("/products/options/batch")
+async def fetch_alibaba_product_options_batch(
+        batch_request: common_schemas.ProductOptionsBatchRequest,
+        db: Session = Depends(get_db)
+) -> ApiResponse[dict]:
+    return await common_service.fetch_alibaba_product_options_batch(batch_request, db)
+
+@common_router.post("/translations")
+async def translate_texts(translation_request: common_schemas.TranslationBatchRequest) -> ApiResponse[dict]:
+    return await common_service.translate_texts(translation_request)
+
+@common_router.get("/products/options/cache-stats")
+def fetch_product_option_cache_stats() -> ApiResponse[dict]:
+    return common_service.fetch_product_option_cache_stats()
 
 
 @common_router.get("/codes/{parent_com_code}")
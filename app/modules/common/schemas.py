@@ -20,6 +20,15 @@ class LinkedOptionsRequest(BaseModel):
     linked_sku_id: Optional[int] = None
     linked_open_uid: Optional[str] = None
 
+class ProductOptionsBatchRequest(BaseModel):
+    offer_ids: List[str]  # 1688 상품 ID 목록 (중복 허용, 서버에서 제거)
+    refresh: Optional[bool] = False  # 캐시 무시하고 1688에서 다시 조회
+
+class TranslationBatchRequest(BaseModel):
+    texts: List[str]
+    src: Optional[str] = "zh-cn"
+    dest: Optional[str] = "ko"
+
 class ComHsCodeResponse(BaseModel):
     hs_code: str
     apply_start_date: date
@@ -7,63 +7,289 @@ from io import BytesIO, StringIO
 import numpy as np
 from app.utils import file_util
 from sqlalchemy.orm import Session
-from datetime import datetime
+from datetime import datetime, timedelta
 from app.common.response import ApiResponse
 from app.modules.common import models as common_models
 from app.modules.common import schemas as common_schemas
 from app.modules.auth import models as auth_models
 from app.modules.setting.models import SetSku
 from app.utils.auth_util import get_authenticated_user_no
-from app.core.config import GMAIL_CONFIG
+from app.core.config import GMAIL_CONFIG, PRODUCT_OPTION_CACHE_CONFIG, TRANSLATION_CONFIG
+from app.utils.translation_util import TRANSLATION_SERVICE
+from app.utils.cache_util import TTLCache
 from email.message import EmailMessage
 import aiosmtplib
 import ssl
 import certifi
 import json
+import asyncio
 from app.core.config_1688 import ALIBABA_1688_API_CONFIG
 
-async def fetch_alibaba_product_options(offer_id: Union[str, int]) -> dict:
-    response_data = await alibaba_1688_util.get_product_sku_info(str(offer_id))
+# 1688 상품 옵션 캐시 (메모리 LRU → DB → 1688 API 순으로 조회)
+PRODUCT_OPTION_MEMORY_CACHE = TTLCache(
+    PRODUCT_OPTION_CACHE_CONFIG.MEMORY_MAX_ENTRIES,
+    PRODUCT_OPTION_CACHE_CONFIG.MEMORY_TTL_SECONDS
+)
+PRODUCT_OPTION_CACHE_STATS = {"db_hits": 0, "db_misses": 0, "api_calls": 0, "negative_hits": 0, "refreshes": 0}
+
+
+def _format_alibaba_sku_options(result: dict) -> list:
+    """skuinfo.get 결과를 연동 옵션 목록으로 정규화"""
+    formatted_data = []
+    sku_simple_infos = result["skuSimpleInfos"]
+    open_uid = result["openUid"]
+
+    for item in sku_simple_infos:
+        sku_id = item["skuId"]
+        spec_id = item["specId"]
+        option_value = ", ".join(
+            attr["attributeValue"]
+            for attr in item["attributes"]
+        )
+
+        linked_option = ", ".join(
+            f'{attr["attributeName"]}: {attr["attributeValue"]}'
+            for attr in item["attributes"]
+        )
+
+        formatted_data.append({
+            "linked_spec_id": spec_id,
+            "linked_sku_id": sku_id,
+            "linked_open_uid": open_uid,
+            "linked_option": linked_option,
+            "option_value": option_value
+        })
+
+    return formatted_data
+
+
+def _load_product_option_cache(offer_id: str, db: Session) -> Union[dict, None]:
+    """DB 캐시 조회 (만료 전 항목만), 메모리 캐시에 남은 유효시간만큼 적재"""
+    now = datetime.now()
+    cached = db.query(common_models.ComProductOptionCache1688).filter(
+        common_models.ComProductOptionCache1688.offer_id == offer_id,
+        common_models.ComProductOptionCache1688.expires_at > now
+    ).first()
+
+    if not cached:
+        PRODUCT_OPTION_CACHE_STATS["db_misses"] += 1
+        return None
+
+    PRODUCT_OPTION_CACHE_STATS["db_hits"] += 1
+    entry = {
+        "status": cached.status,
+        "options": json.loads(cached.options) if cached.options else [],
+        "error": cached.error_message
+    }
+    remaining = (cached.expires_at - now).total_seconds()
+    PRODUCT_OPTION_MEMORY_CACHE.set(offer_id, entry, min(remaining, PRODUCT_OPTION_CACHE_CONFIG.MEMORY_TTL_SECONDS))
+
+    return entry
+
+
+def _save_product_option_cache(offer_id: str, entry: dict, db: Session):
+    """조회 결과를 메모리 / DB 캐시에 저장 (조회 불가 상품은 짧은 TTL)"""
+    negative = entry["status"] != "OK"
+    db_ttl = PRODUCT_OPTION_CACHE_CONFIG.NEGATIVE_TTL_SECONDS if negative else PRODUCT_OPTION_CACHE_CONFIG.DB_TTL_SECONDS
+    now = datetime.now()
+
+    PRODUCT_OPTION_MEMORY_CACHE.set(offer_id, entry, min(db_ttl, PRODUCT_OPTION_CACHE_CONFIG.MEMORY_TTL_SECONDS))
+
+    try:
+        db.merge(common_models.ComProductOptionCache1688(
+            offer_id=offer_id,
+            status=entry["status"],
+            options=json.dumps(entry["options"], ensure_ascii=False),
+            error_message=entry["error"],
+            fetched_at=now,
+            expires_at=now + timedelta(seconds=db_ttl)
+        ))
+        db.commit()
+    except Exception as e:
+        # 캐시 저장 실패는 조회 결과에 영향 없음 (동시 저장 충돌 등)
+        db.rollback()
+        print(f"상품 옵션 캐시 저장 실패 (offer_id={offer_id}): {str(e)}")
+
+
+async def get_alibaba_product_options_cached(offer_id: Union[str, int], db: Session, refresh: bool = False) -> dict:
+    """
+    1688 상품 옵션 조회 (캐시 적용)
+
+    Args:
+        refresh: True면 캐시를 무시하고 1688에서 다시 조회해 캐시 갱신
+
+    Returns:
+        dict: {"status": "OK" | "INVALID", "options": [...], "error": 실패 메시지}
+        일시적 오류(통신 실패, 호출 한도 등)는 캐시하지 않고 HTTPException 발생
+    """
+    offer_id = str(offer_id)
+
+    if refresh:
+        PRODUCT_OPTION_CACHE_STATS["refreshes"] += 1
+    else:
+        entry = _get_cached_product_options(offer_id, db)
+        if entry is not None:
+            return entry
+
+    return await _fetch_product_options_from_1688(offer_id, db)
+
+
+def _get_cached_product_options(offer_id: str, db: Session) -> Union[dict, None]:
+    """메모리 → DB 캐시 순으로 조회 (없으면 None)"""
+    entry = PRODUCT_OPTION_MEMORY_CACHE.get(offer_id)
+    if entry is None:
+        entry = _load_product_option_cache(offer_id, db)
+    if entry is not None and entry["status"] != "OK":
+        PRODUCT_OPTION_CACHE_STATS["negative_hits"] += 1
+
+    return entry
+
+
+async def _fetch_product_options_from_1688(offer_id: str, db: Session) -> dict:
+    """1688 skuinfo.get 조회 후 캐시 저장 (일시적 오류는 HTTPException, 캐시 안 함)"""
+    PRODUCT_OPTION_CACHE_STATS["api_calls"] += 1
+    response_data = await alibaba_1688_util.get_product_sku_info(offer_id)
 
     if "error" in response_data:
         raise HTTPException(status_code=400, detail=response_data["error"])
-    formatted_data = []
+    if "result" not in response_data:
+        raise HTTPException(
+            status_code=400,
+            detail=f"연동옵션 불러오는데 실패했습니다.\n({response_data.get('error_code') or response_data.get('error_message')})"
+        )
+
     if response_data["result"]["success"]:
-        result = response_data["result"]["result"]
-        sku_simple_infos = result["skuSimpleInfos"]
-        open_uid = result["openUid"]
-
-        for item in sku_simple_infos:
-            sku_id = item["skuId"]
-            spec_id = item["specId"]
-            option_value = ", ".join(
-                attr["attributeValue"]
-                for attr in item["attributes"]
-            )
+        entry = {
+            "status": "OK",
+            "options": _format_alibaba_sku_options(response_data["result"]["result"]),
+            "error": None
+        }
+    else:
+        entry = {
+            "status": "INVALID",
+            "options": [],
+            "error": f"연동옵션 불러오는데 실패했습니다.\n({response_data['result']['code']})"
+        }
 
-            linked_option = ", ".join(
-                f'{attr["attributeName"]}: {attr["attributeValue"]}'
-                for attr in item["attributes"]
-            )
+    _save_product_option_cache(offer_id, entry, db)
 
-            formatted_data.append({
-                "linked_spec_id": spec_id,
-                "linked_sku_id": sku_id,
-                "linked_open_uid": open_uid,
-                "linked_option": linked_option,
-                "option_value": option_value
-            })
+    return entry
 
-        return ResponseBuilder.success(
-            data=formatted_data,
-            message="SKU 상세 조회가 완료되었습니다."
+
+async def fetch_alibaba_product_options(offer_id: Union[str, int], db: Session, refresh: bool = False) -> dict:
+    entry = await get_alibaba_product_options_cached(offer_id, db, refresh)
+
+    if entry["status"] != "OK":
+        raise HTTPException(status_code=400, detail=entry["error"])
+
+    return ResponseBuilder.success(
+        data=entry["options"],
+        message="SKU 상세 조회가 완료되었습니다."
+    )
+
+
+async def fetch_alibaba_product_options_batch(
+        batch_request: common_schemas.ProductOptionsBatchRequest,
+        db: Session
+) -> ApiResponse[dict]:
+    """
+    여러 1688 상품 옵션 일괄 조회
+
+    중복 제거 후 캐시 적중분은 바로 반환하고, 미스만 동시 호출 수 제한 내에서 1688 조회.
+    상품별 실패는 전체 요청을 실패시키지 않고 결과에 error로 담는다.
+    """
+    offer_ids = list(dict.fromkeys(
+        str(offer_id).strip() for offer_id in batch_request.offer_ids if str(offer_id).strip()
+    ))
+
+    if not offer_ids:
+        raise HTTPException(status_code=400, detail="조회할 상품 ID가 필요합니다.")
+    if len(offer_ids) > PRODUCT_OPTION_CACHE_CONFIG.BATCH_MAX_OFFERS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {PRODUCT_OPTION_CACHE_CONFIG.BATCH_MAX_OFFERS}개 상품까지 조회할 수 있습니다."
         )
-    else:
+
+    entries = {}
+    missed_offer_ids = []
+    for offer_id in offer_ids:
+        entry = None if batch_request.refresh else _get_cached_product_options(offer_id, db)
+        if entry is None:
+            missed_offer_ids.append(offer_id)
+        else:
+            entries[offer_id] = entry
+
+    if batch_request.refresh:
+        PRODUCT_OPTION_CACHE_STATS["refreshes"] += len(offer_ids)
+
+    semaphore = asyncio.Semaphore(PRODUCT_OPTION_CACHE_CONFIG.BATCH_CONCURRENCY)
+
+    async def fetch(offer_id):
+        async with semaphore:
+            try:
+                entries[offer_id] = await _fetch_product_options_from_1688(offer_id, db)
+            except HTTPException as e:
+                entries[offer_id] = {"status": "ERROR", "options": [], "error": e.detail}
+            except Exception as e:
+                entries[offer_id] = {"status": "ERROR", "options": [], "error": str(e)}
+
+    await asyncio.gather(*[fetch(offer_id) for offer_id in missed_offer_ids])
+
+    results = {}
+    error_count = 0
+    for offer_id in offer_ids:
+        entry = entries[offer_id]
+        if entry["status"] == "OK":
+            results[offer_id] = {"success": True, "options": entry["options"], "error": None}
+        else:
+            results[offer_id] = {"success": False, "options": [], "error": entry["error"]}
+            error_count += 1
+
+    return ResponseBuilder.success(
+        data={
+            "results": results,
+            "requested_count": len(batch_request.offer_ids),
+            "unique_count": len(offer_ids),
+            "cache_hit_count": len(offer_ids) - len(missed_offer_ids),
+            "fetched_count": len(missed_offer_ids),
+            "error_count": error_count
+        },
+        message=f"SKU 일괄 조회가 완료되었습니다. (성공: {len(offer_ids) - error_count}개, 실패: {error_count}개)"
+    )
+
+
+async def translate_texts(translation_request: common_schemas.TranslationBatchRequest) -> ApiResponse[dict]:
+    """여러 문장 일괄 번역 (SetSku.cn_name 등 대량 번역용, 번역 캐시 적용)"""
+    if len(translation_request.texts) > TRANSLATION_CONFIG.MAX_BATCH_TEXTS:
         raise HTTPException(
             status_code=400,
-            detail=f"연동옵션 불러오는데 실패했습니다.\n({response_data['result']['code']})"
+            detail=f"한 번에 최대 {TRANSLATION_CONFIG.MAX_BATCH_TEXTS}개 문장까지 번역할 수 있습니다."
         )
 
+    translated_texts = await TRANSLATION_SERVICE.translate_many(
+        translation_request.texts,
+        src=translation_request.src,
+        dest=translation_request.dest
+    )
+
+    return ResponseBuilder.success(
+        data={
+            "translations": [
+                {"source_text": source_text, "translated_text": translated_text}
+                for source_text, translated_text in zip(translation_request.texts, translated_texts)
+            ],
+            "stats": TRANSLATION_SERVICE.get_stats()
+        },
+        message="번역이 완료되었습니다."
+    )
+
+
+def fetch_product_option_cache_stats() -> ApiResponse[dict]:
+    """상품 옵션 캐시 적중 / 미스 현황"""
+    return ResponseBuilder.success(
+        data={"memory": PRODUCT_OPTION_MEMORY_CACHE.stats(), **PRODUCT_OPTION_CACHE_STATS},
+        message="상품 옵션 캐시 현황을 조회했습니다."
+    )
 
 async def read_excel_file(
         file: UploadFile,
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text, func, Index
+from app.core.database import Base
+
+
+class ComJobQueue(Base):
+    __tablename__ = "COM_JOB_QUEUE"
+    __table_args__ = (
+        Index('IX_COM_JOB_QUEUE_STATUS', 'status', 'run_after'),
+    )
+
+    job_no = Column(Integer, primary_key=True, autoincrement=True, comment='작업 번호')
+    job_type = Column(String(50), nullable=False, comment='작업 유형(PURCHASE_1688_ORDER 등)')
+    status = Column(String(20), nullable=False, default='PENDING', comment='상태(PENDING, RUNNING, DONE, FAILED)')
+    payload = Column(Text, nullable=False, comment='요청 데이터(JSON)')
+    result = Column(Text, nullable=True, comment='처리 결과(JSON)')
+    attempts = Column(Integer, nullable=False, default=0, comment='처리 시도 횟수')
+    max_attempts = Column(Integer, nullable=False, default=3, comment='최대 시도 횟수')
+    progress_total = Column(Integer, nullable=False, default=0, comment='진행 전체 건수')
+    progress_done = Column(Integer, nullable=False, default=0, comment='진행 완료 건수')
+    error_message = Column(String(1000), nullable=True, comment='마지막 처리 오류')
+    locked_by = Column(String(200), nullable=True, comment='처리 중인 워커 (host:pid)')
+    locked_at = Column(DateTime, nullable=True, comment='처리 시작 일시')
+    run_after = Column(DateTime, nullable=False, default=func.now(), comment='처리 가능 일시 (재시도 대기)')
+    finished_at = Column(DateTime, nullable=True, comment='처리 완료 일시')
+    created_by = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, Path
+from sqlalchemy.orm import Session
+from app.core.database import get_db
+from app.common.response import ApiResponse
+from app.modules.job import service as job_service
+
+job_router = APIRouter()
+
+
+# 작업 상태 / 결과 조회
+@job_router.get("/{job_no}")
+def get_job(
+        job_no: int = Path(..., description="작업 번호"),
+        db: Session = Depends(get_db)
+) -> ApiResponse[dict]:
+    return job_service.get_job(job_no, db)
+
+
+# 작업 진행률 조회 (폴링용)
+@job_router.get("/{job_no}/progress")
+def get_job_progress(
+        job_no: int = Path(..., description="작업 번호"),
+        db: Session = Depends(get_db)
+) -> ApiResponse[dict]:
+    return job_service.get_job_progress(job_no, db)
@@ -0,0 +1,361 @@
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, or_
+from app.common.response import ApiResponse, ResponseBuilder
+from app.core.database import SessionLocal
+from app.core.config import JOB_QUEUE_CONFIG
+from app.modules.job.models import ComJobQueue
+from app.scheduler.job_lease import WORKER_ID
+from datetime import datetime, timedelta
+from typing import Optional
+import asyncio
+import json
+
+# 작업 유형별 처리 함수 (job_type -> async handler(payload, context))
+JOB_HANDLERS = {}
+
+
+def register_job_handler(job_type: str, func):
+    """
+    작업 처리 함수 등록 (각 모듈의 register_job_handlers 에서 호출)
+
+    처리 함수는 같은 payload로 여러 번 실행될 수 있으므로(워커 중단 / 재시도) 멱등하게 작성한다.
+    """
+    JOB_HANDLERS[job_type] = func
+
+
+class JobContext:
+    """처리 함수에 전달되는 작업 정보 (진행률 기록용)"""
+
+    def __init__(self, job_no: int, created_by: int):
+        self.job_no = job_no
+        self.created_by = created_by
+
+    def update_progress(self, done: int, total: int = None):
+        """진행률 기록 (처리 함수의 DB 세션과 분리된 별도 세션으로 즉시 커밋, 하트비트 겸용)"""
+        values = {'progress_done': done, 'locked_at': datetime.now()}
+        if total is not None:
+            values['progress_total'] = total
+
+        db = SessionLocal()
+        try:
+            db.query(ComJobQueue).filter(ComJobQueue.job_no == self.job_no).update(values, synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"[{datetime.now()}] 작업 진행률 기록 실패 (job_no={self.job_no}): {str(e)}")
+        finally:
+            db.close()
+
+
+def enqueue_job(db: Session, job_type: str, payload: dict, user_no: int, progress_total: int = 0) -> ComJobQueue:
+    """작업 등록 (워커가 비동기로 처리)"""
+    if job_type not in JOB_HANDLERS:
+        raise ValueError(f"등록되지 않은 작업 유형입니다: {job_type}")
+
+    job = ComJobQueue(
+        job_type=job_type,
+        status='PENDING',
+        payload=json.dumps(jsonable_encoder(payload), ensure_ascii=False),
+        attempts=0,
+        max_attempts=JOB_QUEUE_CONFIG.MAX_ATTEMPTS,
+        progress_total=progress_total,
+        progress_done=0,
+        run_after=datetime.now(),
+        created_by=user_no
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+
+    return job
+
+
+def _job_progress_data(job: ComJobQueue) -> dict:
+    percent = 0
+    if job.status == 'DONE':
+        percent = 100
+    elif job.progress_total:
+        percent = min(99, int(job.progress_done * 100 / job.progress_total))
+
+    return {
+        'job_no': job.job_no,
+        'job_type': job.job_type,
+        'status': job.status,
+        'attempts': job.attempts,
+        'progress_total': job.progress_total,
+        'progress_done': job.progress_done,
+        'progress_percent': percent,
+    }
+
+
+def _get_job_or_404(job_no: int, db: Session) -> ComJobQueue:
+    job = db.query(ComJobQueue).filter(ComJobQueue.job_no == job_no).first()
+    if not job:
+        raise HTTPException(status_code=404, detail=f"작업 번호 {job_no}를 찾을 수 없습니다.")
+    return job
+
+
+def get_job(job_no: int, db: Session) -> ApiResponse[dict]:
+    """작업 상태 / 결과 조회"""
+    job = _get_job_or_404(job_no, db)
+
+    data = _job_progress_data(job)
+    data.update({
+        'result': json.loads(job.result) if job.result else None,
+        'error_message': job.error_message,
+        'created_by': job.created_by,
+        'created_at': job.created_at,
+        'locked_at': job.locked_at,
+        'finished_at': job.finished_at,
+    })
+
+    return ResponseBuilder.success(data=data, message="작업 정보를 조회했습니다.")
+
+
+def get_job_progress(job_no: int, db: Session) -> ApiResponse[dict]:
+    """작업 진행률 조회 (폴링용, 결과 본문 제외)"""
+    job = _get_job_or_404(job_no, db)
+
+    return ResponseBuilder.success(data=_job_progress_data(job), message="작업 진행률을 조회했습니다.")
+
+
+def claim_next_job(db: Session, now: datetime = None) -> Optional[ComJobQueue]:
+    """
+    처리할 작업 1건 선점 (PENDING → RUNNING)
+
+    조건부 UPDATE로 선점하므로 여러 워커 / 프로세스가 동시에 호출해도 한 곳만 성공한다.
+    """
+    now = now or datetime.now()
+
+    candidates = db.query(ComJobQueue.job_no).filter(
+        and_(
+            ComJobQueue.status == 'PENDING',
+            ComJobQueue.run_after <= now
+        )
+    ).order_by(ComJobQueue.run_after, ComJobQueue.job_no).limit(5).all()
+
+    for (job_no,) in candidates:
+        claimed = db.query(ComJobQueue).filter(
+            and_(
+                ComJobQueue.job_no == job_no,
+                ComJobQueue.status == 'PENDING'
+            )
+        ).update({
+            'status': 'RUNNING',
+            'attempts': ComJobQueue.attempts + 1,
+            'locked_by': WORKER_ID,
+            'locked_at': now,
+            'error_message': None
+        }, synchronize_session=False)
+        db.commit()
+
+        if claimed:
+            return db.query(ComJobQueue).filter(ComJobQueue.job_no == job_no).first()
+
+    return None
+
+
+def _owned_job_filter(job_no: int, attempts: int):
+    """
+    내가 선점한 실행 건 조건
+
+    같은 프로세스가 회수된 작업을 다시 선점해도 구분되도록 선점 시 증가하는 attempts 를 펜싱 토큰으로 사용
+    """
+    return and_(
+        ComJobQueue.job_no == job_no,
+        ComJobQueue.status == 'RUNNING',
+        ComJobQueue.locked_by == WORKER_ID,
+        ComJobQueue.attempts == attempts
+    )
+
+
+def touch_job(db: Session, job_no: int, attempts: int) -> bool:
+    """처리 중인 작업의 하트비트(locked_at) 갱신 (회수되어 다른 실행으로 넘어갔으면 False)"""
+    updated = db.query(ComJobQueue).filter(
+        _owned_job_filter(job_no, attempts)
+    ).update({'locked_at': datetime.now()}, synchronize_session=False)
+    db.commit()
+
+    return bool(updated)
+
+
+async def _keep_job_alive(job_no: int, attempts: int, handler_task: asyncio.Task) -> bool:
+    """
+    작업 실행 중 주기적으로 하트비트 갱신 (실행 시간이 길어도 회수 대상이 되지 않도록)
+
+    소유권을 잃으면(회수 후 다른 실행이 선점) 처리 함수를 취소하고 True 반환
+    """
+    while True:
+        await asyncio.sleep(JOB_QUEUE_CONFIG.HEARTBEAT_INTERVAL_SECONDS)
+
+        db = SessionLocal()
+        try:
+            owned = touch_job(db, job_no, attempts)
+        except Exception as e:
+            db.rollback()
+            print(f"[{datetime.now()}] 작업 하트비트 갱신 실패 (job_no={job_no}): {str(e)}")
+            continue
+        finally:
+            db.close()
+
+        if not owned:
+            print(f"[{datetime.now()}] 작업 소유권을 잃어 실행을 중단합니다. (job_no={job_no})")
+            handler_task.cancel()
+            return True
+
+
+def recover_stale_jobs(db: Session, now: datetime = None) -> int:
+    """
+    워커 중단으로 RUNNING 상태에 방치된 작업을 재시도 대기(또는 실패)로 회수
+
+    처리 중인 작업은 HEARTBEAT_INTERVAL_SECONDS 마다 locked_at 을 갱신하므로,
+    RUNNING_TIMEOUT_SECONDS 동안 갱신이 없는 작업만 중단된 것으로 본다.
+    """
+    now = now or datetime.now()
+    stale_before = now - timedelta(seconds=JOB_QUEUE_CONFIG.RUNNING_TIMEOUT_SECONDS)
+    stale_filter = and_(
+        ComJobQueue.status == 'RUNNING',
+        or_(ComJobQueue.locked_at.is_(None), ComJobQueue.locked_at < stale_before)
+    )
+
+    failed = db.query(ComJobQueue).filter(
+        stale_filter,
+        ComJobQueue.attempts >= ComJobQueue.max_attempts
+    ).update({
+        'status': 'FAILED',
+        'error_message': '처리 시간 초과 (워커 중단)',
+        'finished_at': now
+    }, synchronize_session=False)
+
+    requeued = db.query(ComJobQueue).filter(stale_filter).update({
+        'status': 'PENDING',
+        'run_after': now,
+        'locked_by': None
+    }, synchronize_session=False)
+    db.commit()
+
+    return failed + requeued
+
+
+def _finish_job(job_no: int, attempts: int, values: dict) -> bool:
+    """실행 결과 기록 (소유권을 잃은 실행은 새 소유자의 상태를 덮어쓰지 않음)"""
+    db = SessionLocal()
+    try:
+        updated = db.query(ComJobQueue).filter(
+            _owned_job_filter(job_no, attempts)
+        ).update(values, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+    if not updated:
+        print(f"[{datetime.now()}] 작업 소유권이 없어 결과를 기록하지 않습니다. (job_no={job_no})")
+    return bool(updated)
+
+
+async def run_job(job: ComJobQueue):
+    """선점한 작업 1건 실행 후 결과 기록 (실패 시 재시도 대기 또는 FAILED)"""
+    handler = JOB_HANDLERS.get(job.job_type)
+    context = JobContext(job.job_no, job.created_by)
+    heartbeat_task = None
+
+    try:
+        if handler is None:
+            raise HTTPException(status_code=500, detail=f"등록되지 않은 작업 유형입니다: {job.job_type}")
+
+        handler_task = asyncio.ensure_future(handler(json.loads(job.payload), context))
+        heartbeat_task = asyncio.create_task(_keep_job_alive(job.job_no, job.attempts, handler_task))
+        result = await handler_task
+
+        finished = _finish_job(job.job_no, job.attempts, {
+            'status': 'DONE',
+            'result': json.dumps(jsonable_encoder(result), ensure_ascii=False) if result is not None else None,
+            'progress_done': ComJobQueue.progress_total,
+            'locked_by': None,
+            'finished_at': datetime.now()
+        })
+        if finished:
+            print(f"[{datetime.now()}] 작업 완료 (job_no={job.job_no}, {job.job_type})")
+
+    except asyncio.CancelledError:
+        if heartbeat_task is not None and heartbeat_task.done() and not heartbeat_task.cancelled() \
+                and heartbeat_task.result():
+            # 소유권을 잃어 처리 함수만 취소된 경우 → 새 소유자에게 맡기고 워커 루프는 계속
+            return
+
+        # 종료 중 취소된 작업은 바로 재처리 가능하도록 되돌림
+        _finish_job(job.job_no, job.attempts, {'status': 'PENDING', 'run_after': datetime.now(), 'locked_by': None})
+        raise
+
+    except Exception as e:
+        # 요청 자체가 잘못된 경우(HTTPException)는 재시도하지 않음
+        error_message = e.detail if isinstance(e, HTTPException) else str(e)
+        retryable = not isinstance(e, HTTPException) and job.attempts < job.max_attempts
+
+        if retryable:
+            _finish_job(job.job_no, job.attempts, {
+                'status': 'PENDING',
+                'run_after': datetime.now() + timedelta(seconds=JOB_QUEUE_CONFIG.RETRY_DELAY_SECONDS * job.attempts),
+                'error_message': str(error_message)[:1000],
+                'locked_by': None
+            })
+        else:
+            _finish_job(job.job_no, job.attempts, {
+                'status': 'FAILED',
+                'error_message': str(error_message)[:1000],
+                'locked_by': None,
+                'finished_at': datetime.now()
+            })
+        print(f"[{datetime.now()}] 작업 실패 (job_no={job.job_no}, {job.job_type}, 재시도={retryable}): {error_message}")
+
+    finally:
+        if heartbeat_task is not None:
+            heartbeat_task.cancel()
+
+
+class JOB_WORKER_POOL:
+    """작업 큐 워커 풀 (프로세스당 CONCURRENCY개의 처리 루프)"""
+    _tasks = []
+
+    @classmethod
+    async def _worker_loop(cls, worker_index: int):
+        while True:
+            db = SessionLocal()
+            try:
+                # 방치 작업 회수는 첫 번째 루프에서만
+                if worker_index == 0:
+                    recover_stale_jobs(db)
+                job = claim_next_job(db)
+                if job is not None:
+                    db.expunge(job)
+            except Exception as e:
+                db.rollback()
+                job = None
+                print(f"[{datetime.now()}] 작업 선점 실패: {str(e)}")
+            finally:
+                db.close()
+
+            if job is None:
+                await asyncio.sleep(JOB_QUEUE_CONFIG.POLL_INTERVAL_SECONDS)
+                continue
+
+            await run_job(job)
+
+    @classmethod
+    def start(cls, concurrency: int = None):
+        """워커 루프 시작 (이미 실행 중이면 무시)"""
+        if cls._tasks:
+            return
+
+        concurrency = concurrency or JOB_QUEUE_CONFIG.CONCURRENCY
+        cls._tasks = [asyncio.create_task(cls._worker_loop(index)) for index in range(concurrency)]
+
+    @classmethod
+    async def stop(cls):
+        """워커 루프 종료 (처리 중인 작업은 PENDING으로 되돌림)"""
+        for task in cls._tasks:
+            task.cancel()
+        await asyncio.gather(*cls._tasks, return_exceptions=True)
+        cls._tasks = []
@@ -1,9 +1,9 @@
 from sqlalchemy import Column, Integer, String, DECIMAL, CHAR, DateTime, func, ForeignKey
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, DECIMAL, ForeignKey, func
-from app.core.database import Base
+from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, DECIMAL, ForeignKey, func, Text, UniqueConstraint
+from app.core.database import Base as CoreBase
 
-Base = declarative_base()
+Base = declarative_base()  # 신규 테이블은 main.py create_all 대상인 CoreBase 에 선언
 
 class OrderMst(Base):
     __tablename__ = "ORDER_MST"
@@ -268,3 +268,52 @@ class OrderShipmentEstimateBox(Base):
     updated_at = Column(DateTime, nullable=True, default=func.now(), onupdate=func.now(), comment='수정일시')
     updated_by = Column(Integer, nullable=True, comment='수정자ID')
 
+
+class OrderPurchaseSync1688(CoreBase):
+    __tablename__ = "ORDER_PURCHASE_SYNC_1688"
+
+    purchase_order_number = Column(String(100), primary_key=True, comment='1688 구매 번호')
+    account_info_no_1688 = Column(Integer, nullable=True, comment='1688 계정 정보 번호')
+    tracking_number = Column(String(100), nullable=True, comment='마지막 확인 1688 운송장 번호')
+    delivery_status = Column(String(50), nullable=True, comment='마지막 확인 배송상태')
+    terminal_yn = Column(Integer, nullable=False, default=0, comment='종료 상태 여부(0: 진행중, 1: 종료 - 더 이상 조회 안함)')
+    sync_fail_count = Column(Integer, nullable=False, default=0, comment='연속 조회 실패 횟수')
+    last_synced_at = Column(DateTime, nullable=True, comment='마지막 조회 일시')
+    last_changed_at = Column(DateTime, nullable=True, comment='마지막 상태 변경 일시')
+    next_sync_at = Column(DateTime, nullable=True, comment='다음 조회 예정 일시')
+    created_at = Column(DateTime, nullable=False, default=func.now(), comment='생성일시')
+    updated_at = Column(DateTime, nullable=True, default=func.now(), onupdate=func.now(), comment='수정일시')
+
+
+class OrderShipmentPackingSyncCj(CoreBase):
+    __tablename__ = "ORDER_SHIPMENT_PACKING_SYNC_CJ"
+
+    tracking_number = Column(String(100), primary_key=True, comment='CJ 송장번호')
+    delivery_status = Column(String(20), nullable=True, comment='마지막 확인 CJ 화물 상태 코드')
+    terminal_yn = Column(Integer, nullable=False, default=0, comment='종료 상태 여부(0: 진행중, 1: 종료 - 더 이상 조회 안함)')
+    sync_fail_count = Column(Integer, nullable=False, default=0, comment='연속 조회 실패 횟수')
+    last_synced_at = Column(DateTime, nullable=True, comment='마지막 조회 일시')
+    last_changed_at = Column(DateTime, nullable=True, comment='마지막 상태 변경 일시')
+    next_sync_at = Column(DateTime, nullable=True, comment='다음 조회 예정 일시')
+    created_at = Column(DateTime, nullable=False, default=func.now(), comment='생성일시')
+    updated_at = Column(DateTime, nullable=True, default=func.now(), onupdate=func.now(), comment='수정일시')
+
+
+class OrderPurchaseIdempotency1688(CoreBase):
+    __tablename__ = "ORDER_PURCHASE_IDEMPOTENCY_1688"
+    __table_args__ = (
+        UniqueConstraint('request_hash', name='UK_ORDER_PURCHASE_IDEMPOTENCY_1688'),
+    )
+
+    idempotency_no = Column(Integer, primary_key=True, autoincrement=True, comment='멱등 원장 번호')
+    idempotency_key = Column(String(200), nullable=False, comment='클라이언트 Idempotency-Key')
+    open_uid = Column(String(100), nullable=False, comment='1688 판매자 open_uid')
+    dtl_nos = Column(Text, nullable=False, comment='쉽먼트 DTL 번호 (정렬, 콤마 구분)')
+    request_hash = Column(String(64), nullable=False, comment='SHA-256(키 + open_uid + dtl_nos)')
+    status = Column(String(20), nullable=False, default='PENDING', comment='상태(PENDING: 처리 중/결과 불명, SUCCESS, FAILED)')
+    out_order_id = Column(String(100), nullable=True, comment='1688 outOrderId')
+    order_1688_id = Column(String(100), nullable=True, comment='1688 주문 ID')
+    response = Column(Text, nullable=True, comment='1688 응답 원문(JSON)')
+    created_by = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
@@ -2,12 +2,12 @@ from fastapi import APIRouter
 from app.modules.purchase import models
 from app.modules.purchase import schemas as purchase_schemas
 from app.modules.purchase import service as purchase_service
-from fastapi import APIRouter, Depends, Path, Request, UploadFile, File
+from fastapi import APIRouter, Depends, Path, Request, UploadFile, File, Header
 from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.common.schemas import request as common_schemas
 from app.common.response import ApiResponse, PageResponse
-from typing import Union
+from typing import Union, Optional
 
 purchase_router = APIRouter()
 
@@ -178,13 +178,15 @@ async def issue_cj_tracking_number(
 async def create_1688_order(
     request: Request,
     create_order_request: purchase_schemas.Create1688OrderRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", description="재요청 시 1688 중복 주문 방지 키")
 ) -> ApiResponse[dict]:
     """1688 실제 주문 생성 (DTL 번호 기준)"""
     return await purchase_service.create_1688_order(
         create_order_request,
         request,
-        db
+        db,
+        idempotency_key=idempotency_key
     )
 
 
@@ -201,3 +203,54 @@ async def create_payment_link(
         db
     )
 
+
+# ==================== 작업 큐 (등록 후 /jobs/{job_no} 로 상태 조회) ====================
+
+@purchase_router.post("/jobs/1688-order/create")
+def submit_1688_order_job(
+    request: Request,
+    create_order_request: purchase_schemas.Create1688OrderRequest,
+    db: Session = Depends(get_db)
+) -> ApiResponse[dict]:
+    """1688 주문 생성 작업 등록"""
+    return purchase_service.submit_1688_order_job(create_order_request, request, db)
+
+
+@purchase_router.post("/jobs/payment-link/create")
+def submit_payment_link_job(
+    request: Request,
+    payment_link_request: purchase_schemas.CreatePaymentLinkRequest,
+    db: Session = Depends(get_db)
+) -> ApiResponse[dict]:
+    """결제 링크 생성 작업 등록"""
+    return purchase_service.submit_payment_link_job(payment_link_request, request, db)
+
+
+@purchase_router.post("/jobs/cj-tracking-number/issue")
+def submit_cj_tracking_number_job(
+    request: Request,
+    Issue_tracking_number_request: purchase_schemas.IssueCjTackingNumberRequest,
+    db: Session = Depends(get_db)
+) -> ApiResponse[dict]:
+    """CJ 운송장 번호 발급 작업 등록"""
+    return purchase_service.submit_cj_tracking_number_job(Issue_tracking_number_request, request, db)
+
+
+@purchase_router.post("/jobs/excel-export/create")
+def submit_excel_export_job(
+    request: Request,
+    excel_export_request: purchase_schemas.ExcelExportRequest,
+    db: Session = Depends(get_db)
+) -> ApiResponse[dict]:
+    """엑셀 생성 작업 등록 (대용량 다운로드용)"""
+    return purchase_service.submit_excel_export_job(excel_export_request, request, db)
+
+
+@purchase_router.get("/jobs/excel-export/{job_no}/download")
+def download_excel_export(
+    job_no: int,
+    request: Request,
+    db: Session = Depends(get_db)
+):
+    """엑셀 생성 작업 결과 파일 다운로드"""
+    return purchase_service.download_excel_export(job_no, request, db)
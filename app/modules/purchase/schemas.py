@@ -153,4 +153,10 @@ class Create1688OrderRequest(BaseModel):
 
 class CreatePaymentLinkRequest(BaseModel):
     """결제 링크 생성 요청"""
-    order_shipment_dtl_nos: List[int]
\ No newline at end of file
+    order_shipment_dtl_nos: List[int]
+
+
+class ExcelExportRequest(BaseModel):
+    """엑셀 생성 작업 요청"""
+    export_type: str  # shipment-dtl / shipment-estimate / estimate-product-all
+    order_mst_no: int
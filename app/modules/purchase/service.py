@@ -1,10 +1,11 @@
 from app.modules.purchase import schemas as purchase_schemas
 from fastapi import Depends, Request, HTTPException
 from sqlalchemy.orm import Session
-from app.core.database import get_db
+from app.core.database import get_db, SessionLocal
+from app.core.config import ORDER_1688_CONFIG, CJ_LOGISTICS_CONFIG, EXCEL_EXPORT_CONFIG
 from sqlalchemy import and_
 from app.common import response as common_response
-from typing import Union
+from typing import Union, Optional
 from app.modules.purchase import models as purchase_models
 from app.modules.setting import models as set_models
 from sqlalchemy.orm import aliased
@@ -13,22 +14,26 @@ from app.modules.common import models as common_models
 from app.modules.common import schemas as common_schemas
 from app.common.schemas import request as common_request
 from app.common.response import ApiResponse, PageResponse, ResponseBuilder
-from sqlalchemy import func
+from sqlalchemy import func, case
+from sqlalchemy.exc import IntegrityError
 from app.utils.auth_util import get_authenticated_user_no
 from app.utils import com_code_util
-from fastapi.responses import FileResponse
-from app.utils.cj_logistics_util import request_cj_logistics_api
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-import tempfile
+from fastapi.responses import StreamingResponse
+from app.utils.excel_export_util import ExcelColumn, STYLE_CENTER, STYLE_AMOUNT, write_excel_file, stream_excel_chunks
+from app.utils.export_artifact_util import EXPORT_ARTIFACT_STORE
+from app.utils.cj_logistics_util import CJ_TOKEN_MANAGER, issue_cj_invoice_number
 import os
 from datetime import datetime
 from app.utils import alibaba_1688_util, file_util
+from app.modules.job import service as job_service
+from app.modules.job.models import ComJobQueue
 from collections import defaultdict
-from urllib.parse import quote
 from openpyxl import load_workbook
 from fastapi import UploadFile
 import io
+import asyncio
+import hashlib
+import json
 
 
 def fetch_order_mst_list(
@@ -1377,704 +1382,349 @@ def confirm_estimate_deposit(
         )
 
 
-async def download_shipment_dtl_excel(
-        order_mst_no: Union[str, int],
-        request: Request,
-        db: Session
-) -> FileResponse:
-    """Growth 발주 구매 정보 엑셀 다운로드 - 새 파일 생성"""
-    try:
-        # 발주서 마스터 존재 확인
-        existing_order_mst = db.query(purchase_models.OrderMst).filter(
-            purchase_models.OrderMst.order_mst_no == order_mst_no,
-            purchase_models.OrderMst.del_yn == 0
-        ).first()
-
-        if not existing_order_mst:
-            raise HTTPException(
-                status_code=404,
-                detail="해당 발주서를 찾을 수 없습니다."
-            )
+def _get_existing_order_mst(order_mst_no: Union[str, int], db: Session):
+    """발주서 마스터 존재 확인 (없으면 404)"""
+    existing_order_mst = db.query(purchase_models.OrderMst).filter(
+        purchase_models.OrderMst.order_mst_no == order_mst_no,
+        purchase_models.OrderMst.del_yn == 0
+    ).first()
 
-        # center_name 서브쿼리
-        center_subquery = db.query(set_models.SetCenter.center_name).filter(
-            set_models.SetCenter.center_no == purchase_models.OrderShipmentMst.center_no,
-            set_models.SetCenter.del_yn == 0
-        ).scalar_subquery()
-
-        # 데이터 조회
-        query = db.query(
-            purchase_models.OrderShipmentMst,
-            purchase_models.OrderShipmentDtl,
-            purchase_models.OrderShipmentPackingDtl,
-            purchase_models.OrderShipmentPackingMst,
-            center_subquery.label("center_name")
-        ).join(
-            purchase_models.OrderShipmentDtl,
-            purchase_models.OrderShipmentMst.order_shipment_mst_no == purchase_models.OrderShipmentDtl.order_shipment_mst_no
-        ).outerjoin(
-            purchase_models.OrderShipmentPackingDtl,
-            and_(
-                purchase_models.OrderShipmentDtl.order_shipment_dtl_no == purchase_models.OrderShipmentPackingDtl.order_shipment_dtl_no,
-                purchase_models.OrderShipmentPackingDtl.del_yn == 0
-            )
-        ).outerjoin(
-            purchase_models.OrderShipmentPackingMst,
-            and_(
-                purchase_models.OrderShipmentPackingDtl.order_shipment_packing_mst_no == purchase_models.OrderShipmentPackingMst.order_shipment_packing_mst_no,
-                purchase_models.OrderShipmentPackingMst.del_yn == 0
-            )
-        ).filter(
-            purchase_models.OrderShipmentMst.order_mst_no == order_mst_no,
-            purchase_models.OrderShipmentMst.del_yn == 0,
-            purchase_models.OrderShipmentDtl.del_yn == 0
-        ).order_by(
-            purchase_models.OrderShipmentMst.estimated_yn.desc(),
-            purchase_models.OrderShipmentDtl.created_at.desc()
+    if not existing_order_mst:
+        raise HTTPException(
+            status_code=404,
+            detail="해당 발주서를 찾을 수 없습니다."
         )
 
-        results = query.all()
-
-        if not results:
-            raise HTTPException(
-                status_code=400,
-                detail="다운로드할 데이터가 없습니다."
-            )
-
-        # 새 워크북 생성
-        workbook = Workbook()
-        worksheet = workbook.active
-        worksheet.title = "발주 구매 정보"
-
-        # 스타일 정의
-        header_font = Font(bold=True, size=11, color="FFFFFF")
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        header_alignment = Alignment(horizontal="center", vertical="center")
-
-        cell_alignment = Alignment(horizontal="left", vertical="center")
-        center_alignment = Alignment(horizontal="center", vertical="center")
-
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
+    return existing_order_mst
+
+
+def _amount(value) -> float:
+    return float(value) if value else 0.0
+
+
+def build_shipment_dtl_export(order_mst_no: Union[str, int], db: Session):
+    """Growth 발주 구매 정보 엑셀 (시트명, 열 정의, 조회 쿼리)"""
+    # center_name 서브쿼리
+    center_subquery = db.query(set_models.SetCenter.center_name).filter(
+        set_models.SetCenter.center_no == purchase_models.OrderShipmentMst.center_no,
+        set_models.SetCenter.del_yn == 0
+    ).scalar_subquery()
+
+    query = db.query(
+        purchase_models.OrderShipmentMst,
+        purchase_models.OrderShipmentDtl,
+        purchase_models.OrderShipmentPackingDtl,
+        purchase_models.OrderShipmentPackingMst,
+        center_subquery.label("center_name")
+    ).join(
+        purchase_models.OrderShipmentDtl,
+        purchase_models.OrderShipmentMst.order_shipment_mst_no == purchase_models.OrderShipmentDtl.order_shipment_mst_no
+    ).outerjoin(
+        purchase_models.OrderShipmentPackingDtl,
+        and_(
+            purchase_models.OrderShipmentDtl.order_shipment_dtl_no == purchase_models.OrderShipmentPackingDtl.order_shipment_dtl_no,
+            purchase_models.OrderShipmentPackingDtl.del_yn == 0
         )
-
-        headers = [
-            "발주번호",
-            "물류센터",
-            "상태",
-            "입고유형",
-            "입고예정일",
-            "상품번호(SKU ID)",
-            "상품바코드",
-            "상품이름",
-            "확정수량",
-            "포장수량",
-            "박스명",
-            "1688 송장번호",
-            "CJ 송장번호",
-        ]
-
-        # 공통코드
-        shipment_status_com_code_dict = com_code_util.get_com_code_dict_by_parent_code("ORDER_SHIPMENT_MST_STATUS_CD",
-                                                                                       db)
-
-        # 헤더 작성
-        for col_idx, header in enumerate(headers, start=1):
-            cell = worksheet.cell(row=1, column=col_idx, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-            cell.border = thin_border
-
-        # 데이터 작성
-        for row_idx, (mst, dtl, packing_dtl, packing_mst, center_name) in enumerate(results, start=2):
-            # 발주번호
-            cell = worksheet.cell(row=row_idx, column=1, value=dtl.order_number)
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # 물류센터
-            cell = worksheet.cell(row=row_idx, column=2, value=center_name)
-            cell.alignment = center_alignment
-            cell.border = thin_border
-
-            # 상태
-            com_code = shipment_status_com_code_dict.get(mst.order_shipment_mst_status_cd)
-            cell = worksheet.cell(row=row_idx, column=3, value=com_code.code_name)
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # 입고유형
-            cell = worksheet.cell(row=row_idx, column=4, value=dtl.transport_type)
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # 입고예정일
-            cell = worksheet.cell(row=row_idx, column=5, value=mst.edd)
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # SKU ID
-            cell = worksheet.cell(row=row_idx, column=6, value=dtl.sku_id)
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # 상품바코드
-            cell = worksheet.cell(row=row_idx, column=7, value=dtl.sku_barcode)
-            cell.alignment = center_alignment
-            cell.border = thin_border
-
-            # 상품이름
-            cell = worksheet.cell(row=row_idx, column=8, value=dtl.sku_name)
-            cell.alignment = center_alignment
-            cell.border = thin_border
-
-            # 확정수량
-            cell = worksheet.cell(row=row_idx, column=9, value=dtl.confirmed_quantity)
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # 포장수량
-            packing_qty = packing_dtl.packing_quantity if packing_dtl else None
-            cell = worksheet.cell(row=row_idx, column=10, value=packing_qty)
-            cell.alignment = center_alignment
-            cell.border = thin_border
-
-            # 박스명
-            box_name = packing_mst.box_name if packing_mst else None
-            cell = worksheet.cell(row=row_idx, column=11, value=box_name)
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # 1688 운송장번호
-            cell = worksheet.cell(row=row_idx, column=12, value=dtl.purchase_tracking_number)
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # CJ 운송장번호
-            tracking_number = packing_dtl.tracking_number if packing_dtl else None
-            cell = worksheet.cell(row=row_idx, column=13, value=tracking_number)
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-        # 열 너비 자동 조정
-        column_widths = {
-            1: 15, 2: 12, 3: 20, 4: 20, 5: 20, 6: 40,
-            7: 12, 8: 12, 9: 20, 10: 50, 11: 30, 12: 12, 13: 12,
-        }
-
-        for col, width in column_widths.items():
-            worksheet.column_dimensions[worksheet.cell(row=1, column=col).column_letter].width = width
-
-        # 임시 파일 생성
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp_file:
-            temp_path = tmp_file.name
-
-        # 워크북 저장
-        workbook.save(temp_path)
-        workbook.close()
-
-        # 파일명 생성
-        current_time = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"발주구매정보_{order_mst_no}_{current_time}.xlsx"
-
-        encoded_filename = quote(filename)
-
-        response = FileResponse(
-            path=temp_path,
-            media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            background=None
+    ).outerjoin(
+        purchase_models.OrderShipmentPackingMst,
+        and_(
+            purchase_models.OrderShipmentPackingDtl.order_shipment_packing_mst_no == purchase_models.OrderShipmentPackingMst.order_shipment_packing_mst_no,
+            purchase_models.OrderShipmentPackingMst.del_yn == 0
         )
+    ).filter(
+        purchase_models.OrderShipmentMst.order_mst_no == order_mst_no,
+        purchase_models.OrderShipmentMst.del_yn == 0,
+        purchase_models.OrderShipmentDtl.del_yn == 0
+    ).order_by(
+        purchase_models.OrderShipmentMst.estimated_yn.desc(),
+        purchase_models.OrderShipmentDtl.created_at.desc()
+    )
 
-        response.headers["Content-Disposition"] = f"attachment; filename*=UTF-8''{encoded_filename}"
-
-        return response
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        # 임시 파일 정리
-        if 'temp_path' in locals() and os.path.exists(temp_path):
-            os.unlink(temp_path)
+    # 공통코드 (서버 측 커서 조회 중에는 같은 커넥션으로 다른 쿼리 불가 → 미리 조회)
+    shipment_status_com_code_dict = com_code_util.get_com_code_dict_by_parent_code("ORDER_SHIPMENT_MST_STATUS_CD", db) or {}
+
+    def status_name(row):
+        com_code = shipment_status_com_code_dict.get(row[0].order_shipment_mst_status_cd)
+        return com_code.code_name if com_code else None
+
+    # row: (mst, dtl, packing_dtl, packing_mst, center_name)
+    columns = [
+        ExcelColumn("발주번호", lambda row: row[1].order_number, 15),
+        ExcelColumn("물류센터", lambda row: row[4], 12, STYLE_CENTER),
+        ExcelColumn("상태", status_name, 20),
+        ExcelColumn("입고유형", lambda row: row[1].transport_type, 20),
+        ExcelColumn("입고예정일", lambda row: row[0].edd, 20),
+        ExcelColumn("상품번호(SKU ID)", lambda row: row[1].sku_id, 40),
+        ExcelColumn("상품바코드", lambda row: row[1].sku_barcode, 12, STYLE_CENTER),
+        ExcelColumn("상품이름", lambda row: row[1].sku_name, 12, STYLE_CENTER),
+        ExcelColumn("확정수량", lambda row: row[1].confirmed_quantity, 20),
+        ExcelColumn("포장수량", lambda row: row[2].packing_quantity if row[2] else None, 50, STYLE_CENTER),
+        ExcelColumn("박스명", lambda row: row[3].box_name if row[3] else None, 30),
+        ExcelColumn("1688 송장번호", lambda row: row[1].purchase_tracking_number, 12),
+        ExcelColumn("CJ 송장번호", lambda row: row[2].tracking_number if row[2] else None, 12),
+    ]
+
+    return "발주 구매 정보", columns, query
+
+
+def build_shipment_estimate_export(order_mst_no: Union[str, int], db: Session):
+    """견적 리스트 엑셀 (시트명, 열 정의, 조회 쿼리)"""
+    query = db.query(
+        purchase_models.OrderShipmentEstimate
+    ).filter(
+        purchase_models.OrderShipmentEstimate.order_mst_no == order_mst_no,
+        purchase_models.OrderShipmentEstimate.del_yn == 0,
+    ).order_by(
+        purchase_models.OrderShipmentEstimate.created_at.desc()
+    )
 
-        raise HTTPException(
-            status_code=500,
-            detail=f"엑셀 다운로드 중 오류가 발생했습니다: {str(e)}"
+    columns = [
+        ExcelColumn("견적서 번호", lambda estimate: estimate.estimate_id, 15),
+        ExcelColumn("견적일자", lambda estimate: estimate.estimate_date, 12, STYLE_CENTER),
+        ExcelColumn("견적총액", lambda estimate: estimate.estimate_total_amount, 20),
+    ]
+
+    return "견적 리스트", columns, query
+
+
+def build_shipment_estimate_product_all_export(order_mst_no: Union[str, int], db: Session):
+    """견적 상품 전체 목록 엑셀 (시트명, 열 정의, 조회 쿼리)"""
+    # center_name 서브쿼리
+    center_subquery = db.query(set_models.SetCenter.center_name).filter(
+        set_models.SetCenter.center_no == purchase_models.OrderShipmentMst.center_no,
+        set_models.SetCenter.del_yn == 0
+    ).scalar_subquery()
+
+    # 쉽먼트 상태명 서브쿼리
+    shipment_status_subquery = db.query(common_models.ComCode.code_name).filter(
+        common_models.ComCode.com_code == purchase_models.OrderShipmentMst.order_shipment_mst_status_cd,
+        common_models.ComCode.parent_com_code == 'ORDER_SHIPMENT_MST_STATUS_CD',
+        common_models.ComCode.del_yn == 0,
+        common_models.ComCode.use_yn == 1
+    ).scalar_subquery()
+
+    # 데이터 조회 (fetch_shipment_estimate_product_list_all과 동일)
+    query = (db.query(
+        # EstimateProduct 컬럼
+        purchase_models.OrderShipmentEstimateProduct.order_shipment_estimate_product_no,
+        purchase_models.OrderShipmentEstimateProduct.order_shipment_estimate_no,
+        purchase_models.OrderShipmentEstimateProduct.order_shipment_mst_no,
+        purchase_models.OrderShipmentEstimateProduct.order_shipment_dtl_no,
+        purchase_models.OrderShipmentEstimateProduct.sku_id,
+        purchase_models.OrderShipmentEstimateProduct.sku_name,
+        purchase_models.OrderShipmentEstimateProduct.purchase_quantity,
+        purchase_models.OrderShipmentEstimateProduct.product_unit_price,
+        purchase_models.OrderShipmentEstimateProduct.product_total_amount.label("product_product_total_amount"),
+        purchase_models.OrderShipmentEstimateProduct.package_vinyl_spec_total_amount,
+        purchase_models.OrderShipmentEstimateProduct.total_amount.label("product_total_amount"),
+        purchase_models.OrderShipmentEstimateProduct.remark,
+        purchase_models.OrderShipmentEstimateProduct.fail_yn,
+
+        # Estimate 컬럼
+        purchase_models.OrderShipmentEstimate.estimate_id,
+
+        # ShipmentMst 컬럼
+        purchase_models.OrderShipmentMst.edd,
+        purchase_models.OrderShipmentMst.order_shipment_mst_status_cd,
+        center_subquery.label("center_name"),
+        shipment_status_subquery.label("order_shipment_mst_status_name"),
+
+        # ShipmentDtl 컬럼
+        purchase_models.OrderShipmentDtl.order_number,
+        purchase_models.OrderShipmentDtl.sku_barcode,
+        purchase_models.OrderShipmentDtl.confirmed_quantity.label("dtl_confirmed_quantity"),
+        purchase_models.OrderShipmentDtl.transport_type,
+        purchase_models.OrderShipmentDtl.purchase_tracking_number,
+        purchase_models.OrderShipmentDtl.purchase_order_number,
+        purchase_models.OrderShipmentDtl.delivery_status,
+
+        # PackingDtl 컬럼
+        purchase_models.OrderShipmentPackingDtl.packing_quantity,
+        purchase_models.OrderShipmentPackingDtl.box_name,
+        purchase_models.OrderShipmentPackingDtl.tracking_number
+    ).join(
+        purchase_models.OrderShipmentEstimate,
+        purchase_models.OrderShipmentEstimateProduct.order_shipment_estimate_no == purchase_models.OrderShipmentEstimate.order_shipment_estimate_no
+    ).join(
+        purchase_models.OrderShipmentMst,
+        purchase_models.OrderShipmentEstimateProduct.order_shipment_mst_no == purchase_models.OrderShipmentMst.order_shipment_mst_no
+    ).outerjoin(
+        purchase_models.OrderShipmentDtl,
+        and_(
+            purchase_models.OrderShipmentEstimateProduct.order_shipment_dtl_no == purchase_models.OrderShipmentDtl.order_shipment_dtl_no,
+            purchase_models.OrderShipmentDtl.del_yn == 0
         )
+    ).outerjoin(
+        purchase_models.OrderShipmentPackingDtl,
+        and_(
+            purchase_models.OrderShipmentDtl.order_shipment_dtl_no == purchase_models.OrderShipmentPackingDtl.order_shipment_dtl_no,
+            purchase_models.OrderShipmentPackingDtl.del_yn == 0
+        )
+    ).filter(
+        purchase_models.OrderShipmentEstimate.order_mst_no == order_mst_no,
+        purchase_models.OrderShipmentEstimateProduct.del_yn == 0,
+        purchase_models.OrderShipmentEstimate.del_yn == 0,
+        purchase_models.OrderShipmentMst.del_yn == 0
+    ).order_by(
+        purchase_models.OrderShipmentMst.estimated_yn.desc(),
+        purchase_models.OrderShipmentEstimateProduct.created_at.desc()
+    ))
+
+    columns = [
+        ExcelColumn("견적서 번호", lambda row: row.estimate_id, 20),
+        ExcelColumn(
+            "구매번호", lambda row: row.purchase_order_number, 20,
+            highlight=lambda row: row.order_shipment_mst_status_cd == "PAYMENT_COMPLETED" and row.fail_yn == 0
+        ),
+        ExcelColumn("발주번호", lambda row: row.order_number, 15),
+        ExcelColumn("물류센터", lambda row: row.center_name, 15),
+        ExcelColumn("상태", lambda row: row.order_shipment_mst_status_name, 15, STYLE_CENTER),
+        ExcelColumn("배송상태", lambda row: row.delivery_status, 12, STYLE_CENTER),
+        ExcelColumn("입고유형", lambda row: row.transport_type, 12, STYLE_CENTER),
+        ExcelColumn("입고예정일", lambda row: row.edd, 20, STYLE_CENTER),
+        ExcelColumn("상품번호(SKU ID)", lambda row: row.sku_id, 20),
+        ExcelColumn("상품바코드", lambda row: row.sku_barcode, 40),
+        ExcelColumn("상품이름", lambda row: row.sku_name, 12),
+        ExcelColumn("확정수량", lambda row: row.dtl_confirmed_quantity, 12, STYLE_CENTER),
+        ExcelColumn("포장수량", lambda row: row.packing_quantity, 25, STYLE_CENTER),
+        ExcelColumn("박스명", lambda row: row.box_name, 20),
+        ExcelColumn("1688 운송장번호", lambda row: row.purchase_tracking_number, 30),
+        ExcelColumn("CJ 운송장번호", lambda row: row.tracking_number, 12),
+        ExcelColumn("비고", lambda row: row.remark, 12),
+        ExcelColumn("단가", lambda row: _amount(row.product_unit_price), 12, STYLE_AMOUNT),
+        ExcelColumn("제품금액", lambda row: _amount(row.product_product_total_amount), 12, STYLE_AMOUNT),
+        ExcelColumn("포장금액", lambda row: _amount(row.package_vinyl_spec_total_amount), None, STYLE_AMOUNT),
+        ExcelColumn("총금액", lambda row: _amount(row.product_total_amount), None, STYLE_AMOUNT),
+    ]
+
+    return "견적 상품 목록", columns, query
+
+
+# 엑셀 다운로드 종류: (시트 / 열 / 쿼리 생성 함수, 파일명 접두어, 캐시 키에 최종 수정 시각을 반영할 모델)
+EXCEL_EXPORTS = {
+    'shipment-dtl': (
+        build_shipment_dtl_export, "발주구매정보",
+        (purchase_models.OrderShipmentMst, purchase_models.OrderShipmentDtl,
+         purchase_models.OrderShipmentPackingDtl, purchase_models.OrderShipmentPackingMst)
+    ),
+    'shipment-estimate': (
+        build_shipment_estimate_export, "견적리스트",
+        (purchase_models.OrderShipmentEstimate,)
+    ),
+    'estimate-product-all': (
+        build_shipment_estimate_product_all_export, "견적상품목록",
+        (purchase_models.OrderShipmentEstimateProduct, purchase_models.OrderShipmentEstimate,
+         purchase_models.OrderShipmentMst, purchase_models.OrderShipmentDtl, purchase_models.OrderShipmentPackingDtl)
+    ),
+}
+
+# 열 구성 / 서식 변경 시 올려서 기존 캐시 파일 무효화
+EXCEL_EXPORT_FORMAT_VERSION = 1
+
+
+def build_excel_artifact(export_type: str, order_mst_no: Union[str, int], db: Session):
+    """
+    엑셀 파일 생성 또는 캐시 재사용
+
+    캐시 키 = 다운로드 종류 + 발주서 번호 + 원본 데이터 버전(조회 대상 행 수, 테이블별 최종 updated_at)
+    원본 데이터가 바뀌지 않았으면 이전에 생성한 파일을 그대로 반환한다.
+    파일은 DB(COM_EXPORT_ARTIFACT)에 저장되므로 작업 워커에서 생성하고 API 프로세스에서 다운로드할 수 있다.
+
+    Returns:
+        dict: 메타 정보 (cache_key, file_name, file_size, chunk_count, row_count, cached ...)
+    """
+    if export_type not in EXCEL_EXPORTS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 다운로드 종류입니다: {export_type}")
+
+    build_export, filename_prefix, source_models = EXCEL_EXPORTS[export_type]
+
+    _get_existing_order_mst(order_mst_no, db)
+
+    sheet_title, columns, query = build_export(order_mst_no, db)
+
+    source_version = query.order_by(None).with_entities(
+        func.count(),
+        *(func.max(source_model.updated_at) for source_model in source_models)
+    ).one()
+    cache_key = EXPORT_ARTIFACT_STORE.make_key(
+        EXCEL_EXPORT_FORMAT_VERSION, export_type, str(order_mst_no), list(source_version)
+    )
 
+    cached = EXPORT_ARTIFACT_STORE.get(db, cache_key)
+    if cached:
+        return {**cached, 'cached': True}
 
-async def download_shipment_estimate_excel(
-        order_mst_no: Union[str, int],
-        request: Request,
-        db: Session
-) -> FileResponse:
-    """견적 리스트 엑셀 다운로드"""
+    temp_path = EXPORT_ARTIFACT_STORE.new_temp_path()
     try:
-        # 발주서 마스터 존재 확인
-        existing_order_mst = db.query(purchase_models.OrderMst).filter(
-            purchase_models.OrderMst.order_mst_no == order_mst_no,
-            purchase_models.OrderMst.del_yn == 0
-        ).first()
-
-        if not existing_order_mst:
-            raise HTTPException(
-                status_code=404,
-                detail="해당 발주서를 찾을 수 없습니다."
-            )
-
-        # 데이터 조회
-        query = db.query(
-            purchase_models.OrderShipmentEstimate
-        ).filter(
-            purchase_models.OrderShipmentEstimate.order_mst_no == order_mst_no,
-            purchase_models.OrderShipmentEstimate.del_yn == 0,
-        ).order_by(
-            purchase_models.OrderShipmentEstimate.created_at.desc()
+        row_count = write_excel_file(
+            temp_path, sheet_title, columns, query.yield_per(EXCEL_EXPORT_CONFIG.YIELD_PER)
         )
-
-        results = query.all()
-
-        if not results:
+        if row_count == 0:
             raise HTTPException(
                 status_code=400,
                 detail="다운로드할 데이터가 없습니다."
             )
 
-        # 워크북 생성 및 스타일 정의
-        workbook = Workbook()
-        worksheet = workbook.active
-        worksheet.title = "견적 리스트"
-
-        header_font = Font(bold=True, size=11, color="FFFFFF")
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        header_alignment = Alignment(horizontal="center", vertical="center")
-        cell_alignment = Alignment(horizontal="left", vertical="center")
-        center_alignment = Alignment(horizontal="center", vertical="center")
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
+        current_time = datetime.now().strftime("%Y%m%d_%H%M%S")
+        meta = EXPORT_ARTIFACT_STORE.save(
+            db, cache_key, temp_path,
+            file_name=f"{filename_prefix}_{order_mst_no}_{current_time}.xlsx",
+            meta={'export_type': export_type, 'order_mst_no': order_mst_no, 'row_count': row_count}
         )
+    finally:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
 
-        headers = ["견적서 번호", "견적일자", "견적총액"]
-
-        # 헤더 작성
-        for col_idx, header in enumerate(headers, start=1):
-            cell = worksheet.cell(row=1, column=col_idx, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-            cell.border = thin_border
-
-        # 데이터 작성
-        for row_idx, estimate in enumerate(results, start=2):
-            worksheet.cell(row=row_idx, column=1, value=estimate.estimate_id).alignment = cell_alignment
-            worksheet.cell(row=row_idx, column=1).border = thin_border
-
-            worksheet.cell(row=row_idx, column=2, value=estimate.estimate_date).alignment = center_alignment
-            worksheet.cell(row=row_idx, column=2).border = thin_border
-
-            worksheet.cell(row=row_idx, column=3, value=estimate.estimate_total_amount).alignment = cell_alignment
-            worksheet.cell(row=row_idx, column=3).border = thin_border
-
-        # 열 너비 설정
-        worksheet.column_dimensions['A'].width = 15
-        worksheet.column_dimensions['B'].width = 12
-        worksheet.column_dimensions['C'].width = 20
-
-        # 임시 파일 생성
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp_file:
-            temp_path = tmp_file.name
-
-        workbook.save(temp_path)
-        workbook.close()
-
-        # 파일명 생성
-        current_time = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"견적리스트_{order_mst_no}_{current_time}.xlsx"
+    return {**meta, 'cached': False}
 
-        #  한글 파일명 인코딩
-        encoded_filename = quote(filename)
 
-        #  FileResponse 반환
-        response = FileResponse(
-            path=temp_path,
-            media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            background=None
-        )
+def _stream_excel_artifact(meta: dict) -> StreamingResponse:
+    return stream_excel_chunks(
+        EXPORT_ARTIFACT_STORE.iter_chunks(meta['cache_key'], meta['chunk_count']),
+        meta['file_name'],
+        meta['file_size']
+    )
 
-        response.headers["Content-Disposition"] = f"attachment; filename*=UTF-8''{encoded_filename}"
 
-        return response
+def _download_excel(export_type: str, order_mst_no: Union[str, int], db: Session) -> StreamingResponse:
+    """엑셀 다운로드 공용 처리 (캐시 파일이 없을 때만 생성 후 스트리밍)"""
+    try:
+        return _stream_excel_artifact(build_excel_artifact(export_type, order_mst_no, db))
 
     except HTTPException:
         raise
     except Exception as e:
-        if 'temp_path' in locals() and os.path.exists(temp_path):
-            os.unlink(temp_path)
-
         raise HTTPException(
             status_code=500,
             detail=f"엑셀 다운로드 중 오류가 발생했습니다: {str(e)}"
         )
 
 
-async def download_shipment_estimate_product_all_excel(
+async def download_shipment_dtl_excel(
         order_mst_no: Union[str, int],
         request: Request,
         db: Session
-) -> FileResponse:
-    """견적 상품 전체 목록 엑셀 다운로드"""
-    try:
-
-        # 발주서 마스터 존재 확인
-        existing_order_mst = db.query(purchase_models.OrderMst).filter(
-            purchase_models.OrderMst.order_mst_no == order_mst_no,
-            purchase_models.OrderMst.del_yn == 0
-        ).first()
-
-        if not existing_order_mst:
-            raise HTTPException(
-                status_code=404,
-                detail="해당 발주서를 찾을 수 없습니다."
-            )
-
-        # center_name 서브쿼리
-        center_subquery = db.query(set_models.SetCenter.center_name).filter(
-            set_models.SetCenter.center_no == purchase_models.OrderShipmentMst.center_no,
-            set_models.SetCenter.del_yn == 0
-        ).scalar_subquery()
-
-        # 쉽먼트 상태명 서브쿼리
-        shipment_status_subquery = db.query(common_models.ComCode.code_name).filter(
-            common_models.ComCode.com_code == purchase_models.OrderShipmentMst.order_shipment_mst_status_cd,
-            common_models.ComCode.parent_com_code == 'ORDER_SHIPMENT_MST_STATUS_CD',
-            common_models.ComCode.del_yn == 0,
-            common_models.ComCode.use_yn == 1
-        ).scalar_subquery()
-
-        # 포장비닐 사양명 서브쿼리
-        vinyl_spec_subquery = db.query(common_models.ComCode.code_name).filter(
-            common_models.ComCode.com_code == purchase_models.OrderShipmentEstimateProduct.package_vinyl_spec_cd,
-            common_models.ComCode.parent_com_code == 'PACKAGE_VINYL_SPEC_CD',
-            common_models.ComCode.del_yn == 0,
-            common_models.ComCode.use_yn == 1
-        ).scalar_subquery()
-
-        # 데이터 조회 (fetch_shipment_estimate_product_list_all과 동일)
-        query = (db.query(
-            # EstimateProduct 컬럼
-            purchase_models.OrderShipmentEstimateProduct.order_shipment_estimate_product_no,
-            purchase_models.OrderShipmentEstimateProduct.order_shipment_estimate_no,
-            purchase_models.OrderShipmentEstimateProduct.order_shipment_mst_no,
-            purchase_models.OrderShipmentEstimateProduct.order_shipment_dtl_no,
-            purchase_models.OrderShipmentEstimateProduct.sku_id,
-            purchase_models.OrderShipmentEstimateProduct.sku_name,
-            purchase_models.OrderShipmentEstimateProduct.purchase_quantity,
-            purchase_models.OrderShipmentEstimateProduct.product_unit_price,
-            purchase_models.OrderShipmentEstimateProduct.product_total_amount.label("product_product_total_amount"),
-            purchase_models.OrderShipmentEstimateProduct.package_vinyl_spec_total_amount,
-            purchase_models.OrderShipmentEstimateProduct.total_amount.label("product_total_amount"),
-            purchase_models.OrderShipmentEstimateProduct.remark,
-            purchase_models.OrderShipmentEstimateProduct.fail_yn,
-
-            # Estimate 컬럼
-            purchase_models.OrderShipmentEstimate.estimate_id,
-
-            # ShipmentMst 컬럼
-            purchase_models.OrderShipmentMst.edd,
-            purchase_models.OrderShipmentMst.order_shipment_mst_status_cd,
-            center_subquery.label("center_name"),
-            shipment_status_subquery.label("order_shipment_mst_status_name"),
-
-            # ShipmentDtl 컬럼
-            purchase_models.OrderShipmentDtl.order_number,
-            purchase_models.OrderShipmentDtl.sku_barcode,
-            purchase_models.OrderShipmentDtl.confirmed_quantity.label("dtl_confirmed_quantity"),
-            purchase_models.OrderShipmentDtl.transport_type,
-            purchase_models.OrderShipmentDtl.purchase_tracking_number,
-            purchase_models.OrderShipmentDtl.purchase_order_number,
-            purchase_models.OrderShipmentDtl.delivery_status,
-
-            # PackingDtl 컬럼
-            purchase_models.OrderShipmentPackingDtl.packing_quantity,
-            purchase_models.OrderShipmentPackingDtl.box_name,
-            purchase_models.OrderShipmentPackingDtl.tracking_number
-        ).join(
-            purchase_models.OrderShipmentEstimate,
-            purchase_models.OrderShipmentEstimateProduct.order_shipment_estimate_no == purchase_models.OrderShipmentEstimate.order_shipment_estimate_no
-        ).join(
-            purchase_models.OrderShipmentMst,
-            purchase_models.OrderShipmentEstimateProduct.order_shipment_mst_no == purchase_models.OrderShipmentMst.order_shipment_mst_no
-        ).outerjoin(
-            purchase_models.OrderShipmentDtl,
-            and_(
-                purchase_models.OrderShipmentEstimateProduct.order_shipment_dtl_no == purchase_models.OrderShipmentDtl.order_shipment_dtl_no,
-                purchase_models.OrderShipmentDtl.del_yn == 0
-            )
-        ).outerjoin(
-            purchase_models.OrderShipmentPackingDtl,
-            and_(
-                purchase_models.OrderShipmentDtl.order_shipment_dtl_no == purchase_models.OrderShipmentPackingDtl.order_shipment_dtl_no,
-                purchase_models.OrderShipmentPackingDtl.del_yn == 0
-            )
-        ).filter(
-            purchase_models.OrderShipmentEstimate.order_mst_no == order_mst_no,
-            purchase_models.OrderShipmentEstimateProduct.del_yn == 0,
-            purchase_models.OrderShipmentEstimate.del_yn == 0,
-            purchase_models.OrderShipmentMst.del_yn == 0
-        ).order_by(
-            purchase_models.OrderShipmentMst.estimated_yn.desc(),
-            purchase_models.OrderShipmentEstimateProduct.created_at.desc()
-        ))
-
-        results = query.all()
-
-        if not results:
-            raise HTTPException(
-                status_code=400,
-                detail="다운로드할 데이터가 없습니다."
-            )
-
-        # 새 워크북 생성
-        workbook = Workbook()
-        worksheet = workbook.active
-        worksheet.title = "견적 상품 목록"
-
-        # 스타일 정의
-        header_font = Font(bold=True, size=11, color="FFFFFF")
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        header_alignment = Alignment(horizontal="center", vertical="center")
-
-        yellow_fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
-
-        cell_alignment = Alignment(horizontal="left", vertical="center")
-        center_alignment = Alignment(horizontal="center", vertical="center")
-        right_alignment = Alignment(horizontal="right", vertical="center")
-
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-
-        # 헤더 정의
-        headers = [
-            "견적서 번호",
-            "구매번호",
-            "발주번호",
-            "물류센터",
-            "상태",
-            "배송상태",
-            "입고유형",
-            "입고예정일",
-            "상품번호(SKU ID)",
-            "상품바코드",
-            "상품이름",
-            "확정수량",
-            "포장수량",
-            "박스명",
-            "1688 운송장번호",
-            "CJ 운송장번호",
-            "비고",
-            "단가",
-            "제품금액",
-            "포장금액",
-            "총금액"
-        ]
-
-        # 헤더 작성
-        for col_idx, header in enumerate(headers, start=1):
-            cell = worksheet.cell(row=1, column=col_idx, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-            cell.border = thin_border
-
-        # 데이터 작성
-        for row_idx, row in enumerate(results, start=2):
-            # 견적서 번호
-            cell = worksheet.cell(row=row_idx, column=1, value=row.estimate_id)
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # 구매번호
-            cell = worksheet.cell(row=row_idx, column=2, value=row.purchase_order_number)
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-            if row.order_shipment_mst_status_cd == "PAYMENT_COMPLETED" and row.fail_yn == 0:
-                cell.fill = yellow_fill
-
-            # 발주번호
-            cell = worksheet.cell(row=row_idx, column=3, value=row.order_number)
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # 물류센터
-            cell = worksheet.cell(row=row_idx, column=4, value=row.center_name)
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # 상태
-            cell = worksheet.cell(row=row_idx, column=5, value=row.order_shipment_mst_status_name)
-            cell.alignment = center_alignment
-            cell.border = thin_border
-
-            # 배송상태
-            cell = worksheet.cell(row=row_idx, column=6, value=row.delivery_status)
-            cell.alignment = center_alignment
-            cell.border = thin_border
-
-            # 입고유형
-            cell = worksheet.cell(row=row_idx, column=7, value=row.transport_type)
-            cell.alignment = center_alignment
-            cell.border = thin_border
-
-            # 입고예정일
-            cell = worksheet.cell(row=row_idx, column=8, value=row.edd)
-            cell.alignment = center_alignment
-            cell.border = thin_border
-
-            # 상품번호(SKU ID)
-            cell = worksheet.cell(row=row_idx, column=9, value=row.sku_id)
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # 상품바코드
-            cell = worksheet.cell(row=row_idx, column=10, value=row.sku_barcode)
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # 상품이름
-            cell = worksheet.cell(row=row_idx, column=11, value=row.sku_name)
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # 확정수량
-            cell = worksheet.cell(row=row_idx, column=12, value=row.dtl_confirmed_quantity)
-            cell.alignment = center_alignment
-            cell.border = thin_border
-
-            # 포장수량
-            cell = worksheet.cell(row=row_idx, column=13, value=row.packing_quantity)
-            cell.alignment = center_alignment
-            cell.border = thin_border
-
-            # 박스명
-            cell = worksheet.cell(row=row_idx, column=14, value=row.box_name)
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # 송장번호 (1688 운송장번호)
-            cell = worksheet.cell(row=row_idx, column=15, value=row.purchase_tracking_number)
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # 송장번호 (cj 운송장번호)
-            cell = worksheet.cell(row=row_idx, column=16, value=row.tracking_number)
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # 비고
-            cell = worksheet.cell(row=row_idx, column=17, value=row.remark)
-            cell.alignment = cell_alignment
-            cell.border = thin_border
-
-            # 단가
-            unit_price = float(row.product_unit_price) if row.product_unit_price else 0.0
-            cell = worksheet.cell(row=row_idx, column=18, value=unit_price)
-            cell.alignment = right_alignment
-            cell.border = thin_border
-            cell.number_format = '#,##0'
-
-            # 제품금액
-            product_amount = float(row.product_product_total_amount) if row.product_product_total_amount else 0.0
-            cell = worksheet.cell(row=row_idx, column=19, value=product_amount)
-            cell.alignment = right_alignment
-            cell.border = thin_border
-            cell.number_format = '#,##0'
-
-            # 포장금액
-            package_amount = float(row.package_vinyl_spec_total_amount) if row.package_vinyl_spec_total_amount else 0.0
-            cell = worksheet.cell(row=row_idx, column=20, value=package_amount)
-            cell.alignment = right_alignment
-            cell.border = thin_border
-            cell.number_format = '#,##0'
-
-            # 총금액
-            total_amount = float(row.product_total_amount) if row.product_total_amount else 0.0
-            cell = worksheet.cell(row=row_idx, column=21, value=total_amount)
-            cell.alignment = right_alignment
-            cell.border = thin_border
-            cell.number_format = '#,##0'
-
-        # 열 너비 설정
-        column_widths = {
-            1: 20,  # 견적서 번호
-            2: 20,  # 발주번호
-            3: 15,  # 물류센터
-            4: 15,  # 상태
-            5: 15,  # 배송상태
-            6: 12,  # 입고유형
-            7: 12,  # 입고예정일
-            8: 20,  # 상품번호(SKU ID)
-            9: 20,  # 상품바코드
-            10: 40,  # 상품이름
-            11: 12,  # 확정수량
-            12: 12,  # 포장수량
-            13: 25,  # 박스명
-            14: 20,  # 송장번호
-            15: 30,  # 비고
-            16: 12,  # 단가
-            17: 12,  # 제품금액
-            18: 12,  # 포장금액
-            19: 12  # 총금액
-        }
+) -> StreamingResponse:
+    """Growth 발주 구매 정보 엑셀 다운로드"""
+    return _download_excel('shipment-dtl', order_mst_no, db)
 
-        for col, width in column_widths.items():
-            worksheet.column_dimensions[worksheet.cell(row=1, column=col).column_letter].width = width
 
-        # 임시 파일 생성
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp_file:
-            temp_path = tmp_file.name
-
-        # 워크북 저장
-        workbook.save(temp_path)
-        workbook.close()
-
-        # 파일명 생성
-        current_time = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"견적상품목록_{order_mst_no}_{current_time}.xlsx"
-
-        #  한글 파일명 인코딩
-        encoded_filename = quote(filename)
-
-        #  FileResponse 반환
-        response = FileResponse(
-            path=temp_path,
-            media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            background=None
-        )
-
-        response.headers["Content-Disposition"] = f"attachment; filename*=UTF-8''{encoded_filename}"
+async def download_shipment_estimate_excel(
+        order_mst_no: Union[str, int],
+        request: Request,
+        db: Session
+) -> StreamingResponse:
+    """견적 리스트 엑셀 다운로드"""
+    return _download_excel('shipment-estimate', order_mst_no, db)
 
-        return response
-    except HTTPException:
-        raise
-    except Exception as e:
-        # 임시 파일 정리
-        if 'temp_path' in locals() and os.path.exists(temp_path):
-            os.unlink(temp_path)
 
-        raise HTTPException(
-            status_code=500,
-            detail=f"엑셀 다운로드 중 오류가 발생했습니다: {str(e)}"
-        )
+async def download_shipment_estimate_product_all_excel(
+        order_mst_no: Union[str, int],
+        request: Request,
+        db: Session
+) -> StreamingResponse:
+    """견적 상품 전체 목록 엑셀 다운로드"""
+    return _download_excel('estimate-product-all', order_mst_no, db)
 
 
 async def upload_1688_order_number(
@@ -2242,61 +1892,89 @@ async def issue_cj_tracking_number(
         db: Session
 ) -> common_response.ApiResponse[dict]:
     """CJ 운송장 번호 발급 및 업데이트"""
-    try:
-        # 사용자 인증
-        user_no, company_no = get_authenticated_user_no(request)
+    # 사용자 인증
+    user_no, company_no = get_authenticated_user_no(request)
+
+    return await run_issue_cj_tracking_number(Issue_tracking_number_request, user_no, db)
+
+
+async def run_issue_cj_tracking_number(
+        Issue_tracking_number_request: purchase_schemas.IssueCjTackingNumberRequest,
+        user_no: int,
+        db: Session,
+        on_progress=None
+) -> common_response.ApiResponse[dict]:
+    """
+    CJ 운송장 번호 발급 및 업데이트 (HTTP 요청 / 작업 큐 공용)
 
+    대상 박스를 한 번에 조회해 CJ 채번을 동시에 호출하고 (CJ_LOGISTICS_ISSUE_CONCURRENCY / 호출 한도 적용),
+    발급된 운송장 번호는 PackingMst / PackingDtl 에 일괄 반영한다.
+    """
+    try:
         order_shipment_packing_mst_nos = Issue_tracking_number_request.order_shipment_packing_mst_nos
-        success_count = 0
-        error_count = 0
+        total_count = len(order_shipment_packing_mst_nos)
         error_details = []
-        issued_tracking_numbers = []
-
-        for packing_mst_no in order_shipment_packing_mst_nos:
-            try:
-                # 1. PackingMst 존재 확인
-                packing_mst = db.query(purchase_models.OrderShipmentPackingMst).filter(
-                    purchase_models.OrderShipmentPackingMst.order_shipment_packing_mst_no == packing_mst_no,
-                    purchase_models.OrderShipmentPackingMst.del_yn == 0
-                ).first()
 
-                if not packing_mst:
-                    error_details.append({
-                        "order_shipment_packing_mst_no": packing_mst_no,
-                        "box_name": None,
-                        "error": "해당 포장 박스를 찾을 수 없습니다."
-                    })
-                    error_count += 1
-                    continue
+        # 1. 대상 PackingMst 일괄 조회
+        packing_msts = db.query(purchase_models.OrderShipmentPackingMst).filter(
+            purchase_models.OrderShipmentPackingMst.order_shipment_packing_mst_no.in_(order_shipment_packing_mst_nos),
+            purchase_models.OrderShipmentPackingMst.del_yn == 0
+        ).all()
+        packing_mst_map = {packing_mst.order_shipment_packing_mst_no: packing_mst for packing_mst in packing_msts}
 
+        targets = []
+        for packing_mst_no in dict.fromkeys(order_shipment_packing_mst_nos):
+            packing_mst = packing_mst_map.get(packing_mst_no)
+            if not packing_mst:
+                error_details.append({
+                    "order_shipment_packing_mst_no": packing_mst_no,
+                    "box_name": None,
+                    "error": "해당 포장 박스를 찾을 수 없습니다."
+                })
+            elif packing_mst.tracking_number:
                 # 2. 이미 운송장이 발급된 경우 스킵
-                if packing_mst.tracking_number:
+                error_details.append({
+                    "order_shipment_packing_mst_no": packing_mst_no,
+                    "box_name": packing_mst.box_name,
+                    "error": f"이미 운송장이 발급되었습니다. (운송장번호: {packing_mst.tracking_number})"
+                })
+            else:
+                targets.append(packing_mst)
+
+        # 3. CJ API 동시 호출하여 운송장 번호 발급 (토큰은 1회만 조회)
+        tracking_number_by_mst = {}
+        if targets:
+            token = await CJ_TOKEN_MANAGER.get_token()
+            if not token:
+                raise HTTPException(status_code=400, detail="CJ Logistics token을 가져올 수 없습니다")
+
+            semaphore = asyncio.Semaphore(max(CJ_LOGISTICS_CONFIG.ISSUE_CONCURRENCY, 1))
+            done_count = 0
+
+            async def issue(packing_mst):
+                nonlocal done_count
+                async with semaphore:
+                    try:
+                        cj_response = await issue_cj_invoice_number(token=token)
+                    except Exception as e:
+                        cj_response = e
+                done_count += 1
+                if on_progress:
+                    on_progress(done_count, len(targets))
+                return packing_mst, cj_response
+
+            for packing_mst, cj_response in await asyncio.gather(*(issue(packing_mst) for packing_mst in targets)):
+                # 4. API 응답 검증 및 운송장 번호 추출
+                packing_mst_no = packing_mst.order_shipment_packing_mst_no
+
+                if isinstance(cj_response, Exception):
                     error_details.append({
                         "order_shipment_packing_mst_no": packing_mst_no,
                         "box_name": packing_mst.box_name,
-                        "error": f"이미 운송장이 발급되었습니다. (운송장번호: {packing_mst.tracking_number})"
+                        "error": f"처리 중 오류: {str(cj_response)}"
                     })
-                    error_count += 1
                     continue
 
-                # 3. CJ API 호출하여 운송장 번호 발급
-                # CJ API 파라미터 구성
-                cj_params = {
-                    "box_name": packing_mst.box_name,
-                    "package_box_spec_cd": packing_mst.package_box_spec_cd,
-                    "company_no": packing_mst.company_no,
-                }
-
-                # CJ 물류 API 호출
-                cj_response = request_cj_logistics_api(
-                    db=db,
-                    process="/tracking/issue",  # 실제 CJ API 엔드포인트로 수정 필요
-                    params=cj_params
-                )
-
-                # 4. API 응답 검증 및 운송장 번호 추출
-                tracking_number = None
-
                 #  RESULT_CD 체크
                 if not cj_response or cj_response.get("RESULT_CD") != "S":
                     error_message = cj_response.get("RESULT_DETAIL", "알 수 없는 오류") if cj_response else "API 응답 없음"
@@ -2306,13 +1984,10 @@ async def issue_cj_tracking_number(
                         "error": f"CJ API 호출 실패: {error_message}",
                         "cj_response": cj_response
                     })
-                    error_count += 1
                     continue
 
                 #  INVC_NO 추출
-                if "DATA" in cj_response and cj_response["DATA"]:
-                    tracking_number = cj_response["DATA"].get("INVC_NO")
-
+                tracking_number = (cj_response.get("DATA") or {}).get("INVC_NO")
                 if not tracking_number:
                     error_details.append({
                         "order_shipment_packing_mst_no": packing_mst_no,
@@ -2320,53 +1995,25 @@ async def issue_cj_tracking_number(
                         "error": "CJ API에서 운송장 번호(INVC_NO)를 받지 못했습니다.",
                         "cj_response": cj_response
                     })
-                    error_count += 1
                     continue
 
-                # 5. PackingMst 업데이트
-                packing_mst.tracking_number = tracking_number
-                packing_mst.updated_by = user_no
-                packing_mst.updated_at = func.now()
+                tracking_number_by_mst[packing_mst_no] = tracking_number
 
-                # 6. 해당 PackingMst에 속한 PackingDtl 중 fail_yn이 0인 것만 업데이트
-                #  1단계: fail_yn이 0인 order_shipment_dtl_no를 서브쿼리로 추출
-                valid_dtl_nos_subquery = db.query(
-                    purchase_models.OrderShipmentEstimateProduct.order_shipment_dtl_no
-                ).filter(
-                    purchase_models.OrderShipmentEstimateProduct.fail_yn == 0,
-                    purchase_models.OrderShipmentEstimateProduct.del_yn == 0
-                ).subquery()
-
-                #  2단계: 서브쿼리 결과를 사용하여 업데이트 (join 없음)
-                updated_dtl_count = db.query(purchase_models.OrderShipmentPackingDtl).filter(
-                    purchase_models.OrderShipmentPackingDtl.order_shipment_packing_mst_no == packing_mst_no,
-                    purchase_models.OrderShipmentPackingDtl.del_yn == 0,
-                    purchase_models.OrderShipmentPackingDtl.order_shipment_dtl_no.in_(valid_dtl_nos_subquery)  # 서브쿼리 사용
-                ).update(
-                    {
-                        "tracking_number": tracking_number,
-                        "updated_by": user_no,
-                        "updated_at": func.now()
-                    },
-                    synchronize_session=False
-                )
+        # 5. PackingMst / PackingDtl 일괄 업데이트
+        issued_tracking_numbers = []
+        if tracking_number_by_mst:
+            updated_dtl_counts = _apply_cj_tracking_numbers(db, tracking_number_by_mst, user_no)
 
-                success_count += 1
+            for packing_mst_no, tracking_number in tracking_number_by_mst.items():
                 issued_tracking_numbers.append({
                     "order_shipment_packing_mst_no": packing_mst_no,
-                    "box_name": packing_mst.box_name,
+                    "box_name": packing_mst_map[packing_mst_no].box_name,
                     "tracking_number": tracking_number,
-                    "updated_dtl_count": updated_dtl_count
+                    "updated_dtl_count": updated_dtl_counts.get(packing_mst_no, 0)
                 })
 
-            except Exception as e:
-                error_details.append({
-                    "order_shipment_packing_mst_no": packing_mst_no,
-                    "box_name": packing_mst.box_name if 'packing_mst' in locals() else None,
-                    "error": f"처리 중 오류: {str(e)}"
-                })
-                error_count += 1
-                continue
+        success_count = len(issued_tracking_numbers)
+        error_count = len(error_details)
 
         # 커밋 (성공 건이 있을 때만)
         if success_count > 0:
@@ -2376,7 +2023,7 @@ async def issue_cj_tracking_number(
 
         # 응답 데이터 구성
         response_data = {
-            "total_count": len(order_shipment_packing_mst_nos),
+            "total_count": total_count,
             "success_count": success_count,
             "error_count": error_count,
             "issued_tracking_numbers": issued_tracking_numbers,
@@ -2406,14 +2053,302 @@ async def issue_cj_tracking_number(
         )
 
 
+def _apply_cj_tracking_numbers(db: Session, tracking_number_by_mst: dict, user_no: int) -> dict:
+    """발급된 운송장 번호를 PackingMst / PackingDtl 에 CASE UPDATE로 일괄 반영 (박스별 반영 DTL 수 반환)"""
+    packing_mst_nos = list(tracking_number_by_mst.keys())
+
+    db.query(purchase_models.OrderShipmentPackingMst).filter(
+        purchase_models.OrderShipmentPackingMst.order_shipment_packing_mst_no.in_(packing_mst_nos)
+    ).update(
+        {
+            "tracking_number": case(
+                tracking_number_by_mst, value=purchase_models.OrderShipmentPackingMst.order_shipment_packing_mst_no
+            ),
+            "updated_by": user_no,
+            "updated_at": func.now()
+        },
+        synchronize_session=False
+    )
+
+    # PackingDtl 중 fail_yn이 0인 DTL만 업데이트 (서브쿼리 사용, join 없음)
+    valid_dtl_nos_subquery = db.query(
+        purchase_models.OrderShipmentEstimateProduct.order_shipment_dtl_no
+    ).filter(
+        purchase_models.OrderShipmentEstimateProduct.fail_yn == 0,
+        purchase_models.OrderShipmentEstimateProduct.del_yn == 0
+    ).subquery()
+
+    dtl_filters = [
+        purchase_models.OrderShipmentPackingDtl.order_shipment_packing_mst_no.in_(packing_mst_nos),
+        purchase_models.OrderShipmentPackingDtl.del_yn == 0,
+        purchase_models.OrderShipmentPackingDtl.order_shipment_dtl_no.in_(valid_dtl_nos_subquery)
+    ]
+
+    updated_dtl_counts = dict(
+        db.query(
+            purchase_models.OrderShipmentPackingDtl.order_shipment_packing_mst_no,
+            func.count(purchase_models.OrderShipmentPackingDtl.order_shipment_packing_dtl_no)
+        ).filter(*dtl_filters).group_by(
+            purchase_models.OrderShipmentPackingDtl.order_shipment_packing_mst_no
+        ).all()
+    )
+
+    db.query(purchase_models.OrderShipmentPackingDtl).filter(*dtl_filters).update(
+        {
+            "tracking_number": case(
+                tracking_number_by_mst, value=purchase_models.OrderShipmentPackingDtl.order_shipment_packing_mst_no
+            ),
+            "updated_by": user_no,
+            "updated_at": func.now()
+        },
+        synchronize_session=False
+    )
+
+    return updated_dtl_counts
+
+
+def _begin_1688_order_idempotency(
+        idempotency_key: str,
+        open_uid: str,
+        sorted_dtl_nos: list,
+        out_order_id: str,
+        user_no: int
+) -> dict:
+    """
+    1688 주문 멱등 원장 선점 (주문 처리 트랜잭션과 분리된 세션으로 즉시 커밋)
+
+    Returns:
+        dict: state - NEW(1688 호출 진행) / REPLAY(저장된 결과 재사용) / IN_PROGRESS(처리 중 또는 결과 불명)
+    """
+    dtl_nos_text = ",".join(str(dtl_no) for dtl_no in sorted_dtl_nos)
+    request_hash = hashlib.sha256(f"{idempotency_key}|{open_uid}|{dtl_nos_text}".encode("utf-8")).hexdigest()
+    Ledger = purchase_models.OrderPurchaseIdempotency1688
+
+    ledger_db = SessionLocal()
+    try:
+        ledger = ledger_db.query(Ledger).filter(Ledger.request_hash == request_hash).first()
+
+        if ledger is None:
+            ledger_db.add(Ledger(
+                idempotency_key=idempotency_key,
+                open_uid=open_uid,
+                dtl_nos=dtl_nos_text,
+                request_hash=request_hash,
+                status='PENDING',
+                out_order_id=out_order_id,
+                created_by=user_no
+            ))
+            try:
+                ledger_db.commit()
+            except IntegrityError:
+                # 같은 키로 동시에 들어온 요청이 먼저 선점
+                ledger_db.rollback()
+                return {"state": "IN_PROGRESS", "request_hash": request_hash}
+            return {"state": "NEW", "request_hash": request_hash}
+
+        if ledger.status == 'SUCCESS':
+            return {
+                "state": "REPLAY",
+                "request_hash": request_hash,
+                "order_id": ledger.order_1688_id,
+                "response": json.loads(ledger.response) if ledger.response else None
+            }
+
+        if ledger.status == 'FAILED':
+            # 1688에서 명확히 거절된 요청은 같은 키로 재시도 허용
+            reclaimed = ledger_db.query(Ledger).filter(
+                Ledger.request_hash == request_hash,
+                Ledger.status == 'FAILED'
+            ).update({'status': 'PENDING', 'updated_at': func.now()}, synchronize_session=False)
+            ledger_db.commit()
+            if reclaimed:
+                return {"state": "NEW", "request_hash": request_hash}
+
+        return {"state": "IN_PROGRESS", "request_hash": request_hash}
+
+    finally:
+        ledger_db.close()
+
+
+def _finish_1688_order_idempotency(request_hash: str, api_result: Optional[dict]):
+    """
+    1688 주문 결과를 멱등 원장에 기록
+
+    통신 오류(요청 전달 여부 불명)는 PENDING으로 남겨 같은 키로 재호출되지 않게 한다.
+    """
+    Ledger = purchase_models.OrderPurchaseIdempotency1688
+    values = {'response': json.dumps(api_result, ensure_ascii=False, default=str) if api_result else None}
+
+    order_id = (api_result.get("result") or {}).get("orderId") if api_result and api_result.get("success") else None
+    if order_id:
+        values.update({'status': 'SUCCESS', 'order_1688_id': str(order_id)})
+    elif api_result and "success" in api_result:
+        values['status'] = 'FAILED'
+
+    ledger_db = SessionLocal()
+    try:
+        ledger_db.query(Ledger).filter(Ledger.request_hash == request_hash).update(values, synchronize_session=False)
+        ledger_db.commit()
+    finally:
+        ledger_db.close()
+
+
+async def _create_1688_seller_order(
+        open_uid: str,
+        seller_data: dict,
+        message: Optional[str],
+        user_no: int,
+        idempotency_key: Optional[str] = None
+) -> tuple:
+    """
+    판매자 1곳의 1688 주문 생성 (DB 반영은 호출 측에서 일괄 처리)
+
+    Returns:
+        tuple: ("success", 주문 정보) 또는 ("error", 오류 상세)
+    """
+    # cargo_list 생성 (같은 판매자 상품만)
+    cargo_list = []
+    for (offer_id, spec_id), total_quantity in seller_data["cargo_map"].items():
+        cargo_list.append(
+            common_schemas.AlibabaFastCreateOrderCargo(
+                offerId=offer_id,
+                specId=spec_id,
+                quantity=total_quantity
+            )
+        )
+
+    # 외부 주문 ID 생성
+    dtl_nos = seller_data["dtl_nos"]
+    sorted_dtl_nos = sorted(dtl_nos)
+    out_order_id = f"DTL_{open_uid[:8]}_{sorted_dtl_nos[0]}"
+
+    # 1688 API 호출
+    api_request = common_schemas.AlibabaFastCreateOrderRequest(
+        cargoList=cargo_list,
+        flow="general",
+        message=message,
+        tradeType="creditBuy",
+        outOrderId=out_order_id
+    )
+
+    replayed = False
+    if idempotency_key:
+        ledger = _begin_1688_order_idempotency(idempotency_key, open_uid, sorted_dtl_nos, out_order_id, user_no)
+
+        if ledger["state"] == "IN_PROGRESS":
+            return "error", {
+                "open_uid": open_uid,
+                "dtl_nos": dtl_nos,
+                "error": "같은 Idempotency-Key로 처리 중이거나 이전 결과를 확인할 수 없는 주문입니다. 1688 주문 내역을 확인해주세요."
+            }
+
+        if ledger["state"] == "REPLAY":
+            api_result = ledger["response"]
+            replayed = True
+
+    if not replayed:
+        api_result = await alibaba_1688_util.create_order_1688(api_request)
+
+        if idempotency_key:
+            _finish_1688_order_idempotency(ledger["request_hash"], api_result)
+
+    # API 결과 확인
+    if not api_result or not api_result.get("success"):
+        error_message = api_result.get("message", "알 수 없는 오류") if api_result else "API 응답 없음"
+        translated_message = await alibaba_1688_util.translate_chinese_to_korean(error_message)
+
+        return "error", {
+            "open_uid": open_uid,
+            "dtl_nos": dtl_nos,
+            "error": f"1688 주문 생성 실패: {translated_message}",
+            "api_response": api_result
+        }
+
+    # 주문 ID 추출
+    order_id = None
+    if "result" in api_result:
+        order_id = api_result["result"].get("orderId")
+
+    if not order_id:
+        return "error", {
+            "open_uid": open_uid,
+            "dtl_nos": dtl_nos,
+            "error": "1688에서 주문 ID를 받지 못했습니다.",
+            "api_response": api_result
+        }
+
+    return "success", {
+        "open_uid": open_uid,
+        "order_id": order_id,
+        "dtl_nos": dtl_nos,
+        "cargo_list": cargo_list,
+        "replayed": replayed
+    }
+
+
+def _apply_1688_order_numbers(db: Session, order_id_by_dtl: dict, user_no: int):
+    """DTL별 1688 주문번호를 견적 상품 / 쉽먼트 DTL에 CASE UPDATE 2문으로 일괄 반영"""
+    dtl_nos = list(order_id_by_dtl.keys())
+
+    db.query(purchase_models.OrderShipmentEstimateProduct).filter(
+        purchase_models.OrderShipmentEstimateProduct.order_shipment_dtl_no.in_(dtl_nos),
+        purchase_models.OrderShipmentEstimateProduct.fail_yn == 0,
+        purchase_models.OrderShipmentEstimateProduct.del_yn == 0
+    ).update(
+        {
+            "purchase_order_number": case(
+                order_id_by_dtl,
+                value=purchase_models.OrderShipmentEstimateProduct.order_shipment_dtl_no
+            ),
+            "updated_by": user_no,
+            "updated_at": func.now()
+        },
+        synchronize_session=False
+    )
+
+    db.query(purchase_models.OrderShipmentDtl).filter(
+        purchase_models.OrderShipmentDtl.order_shipment_dtl_no.in_(dtl_nos),
+        purchase_models.OrderShipmentDtl.del_yn == 0
+    ).update(
+        {
+            "purchase_order_number": case(
+                order_id_by_dtl,
+                value=purchase_models.OrderShipmentDtl.order_shipment_dtl_no
+            ),
+            "order_shipment_dtl_status_cd": "PURCHASE_PROCESSING",
+            "updated_by": user_no,
+            "updated_at": func.now()
+        },
+        synchronize_session=False
+    )
+
+
 async def create_1688_order(
         create_order_request: purchase_schemas.Create1688OrderRequest,
         request: Request,
-        db: Session
+        db: Session,
+        idempotency_key: Optional[str] = None
 ) -> common_response.ApiResponse[dict]:
     """1688 실제 주문 생성 (판매자별로 분리) + 결제 링크 생성"""
+    user_no, company_no = get_authenticated_user_no(request)
+
+    return await run_create_1688_order(create_order_request, user_no, db, idempotency_key=idempotency_key)
+
+
+async def run_create_1688_order(
+        create_order_request: purchase_schemas.Create1688OrderRequest,
+        user_no: int,
+        db: Session,
+        on_progress=None,
+        skip_already_ordered: bool = False,
+        idempotency_key: Optional[str] = None
+) -> common_response.ApiResponse[dict]:
+    """
+    1688 실제 주문 생성 (HTTP 요청 / 작업 큐 공용)
+    skip_already_ordered: 이미 구매번호가 있는 DTL 제외 (작업 재시도 시 중복 주문 방지)
+    idempotency_key: 지정 시 (키, 판매자, DTL 목록) 단위로 1688 주문 결과를 원장에 저장하고 재요청 시 재사용
+    """
     try:
-        user_no, company_no = get_authenticated_user_no(request)
         order_shipment_dtl_nos = create_order_request.order_shipment_dtl_nos
         message = create_order_request.message
 
@@ -2441,7 +2376,41 @@ async def create_1688_order(
             purchase_models.OrderShipmentEstimateProduct.del_yn == 0,
             purchase_models.OrderShipmentDtl.del_yn == 0,
             set_models.SetSku.del_yn == 0,
-        ).all()
+        )
+
+        if skip_already_ordered:
+            estimate_products = estimate_products.filter(
+                purchase_models.OrderShipmentEstimateProduct.purchase_order_number.is_(None)
+            )
+
+        estimate_products = estimate_products.all()
+
+        if not estimate_products and skip_already_ordered:
+            # 재시도 전에 모든 주문이 이미 반영된 경우 - 실패가 아닌 완료로 처리
+            already_ordered_numbers = [
+                order_number for (order_number,) in db.query(
+                    purchase_models.OrderShipmentEstimateProduct.purchase_order_number
+                ).filter(
+                    purchase_models.OrderShipmentEstimateProduct.order_shipment_dtl_no.in_(order_shipment_dtl_nos),
+                    purchase_models.OrderShipmentEstimateProduct.purchase_order_number.isnot(None),
+                    purchase_models.OrderShipmentEstimateProduct.fail_yn == 0,
+                    purchase_models.OrderShipmentEstimateProduct.del_yn == 0
+                ).distinct().all()
+            ]
+            if already_ordered_numbers:
+                return common_response.ResponseBuilder.success(
+                    data={
+                        "total_sellers": 0,
+                        "success_count": 0,
+                        "error_count": 0,
+                        "created_orders": [],
+                        "error_details": None,
+                        "total_dtl_count": len(order_shipment_dtl_nos),
+                        "already_ordered": True,
+                        "order_numbers": already_ordered_numbers
+                    },
+                    message="요청한 상품이 모두 이미 주문되었습니다."
+                )
 
         if not estimate_products:
             raise HTTPException(
@@ -2479,123 +2448,65 @@ async def create_1688_order(
             if dtl_no not in seller_data["dtl_nos"]:
                 seller_data["dtl_nos"].append(dtl_no)
 
-        # 3. 판매자별로 주문 생성
-        created_orders = []
-        total_success = 0
-        total_error = 0
-        error_details = []
-        all_order_numbers = []  # 생성된 모든 주문 번호 수집
+        # 3. 판매자별 주문 동시 생성 (동시 호출 수 제한)
+        semaphore = asyncio.Semaphore(ORDER_1688_CONFIG.CREATE_CONCURRENCY)
+        progress = {"done": 0}
 
-        for open_uid, seller_data in grouped_by_seller.items():
-            try:
-                # cargo_list 생성 (같은 판매자 상품만)
-                cargo_list = []
-                for (offer_id, spec_id), total_quantity in seller_data["cargo_map"].items():
-                    cargo_list.append(
-                        common_schemas.AlibabaFastCreateOrderCargo(
-                            offerId=offer_id,
-                            specId=spec_id,
-                            quantity=total_quantity
-                        )
-                    )
-
-                # 외부 주문 ID 생성
-                dtl_nos = seller_data["dtl_nos"]
-                sorted_dtl_nos = sorted(dtl_nos)
-                out_order_id = f"DTL_{open_uid[:8]}_{sorted_dtl_nos[0]}"
-
-                # 1688 API 호출
-                api_request = common_schemas.AlibabaFastCreateOrderRequest(
-                    cargoList=cargo_list,
-                    flow="general",
-                    message=message,
-                    tradeType="creditBuy",
-                    outOrderId=out_order_id
-                )
-
-                api_result = await alibaba_1688_util.create_order_1688(api_request)
-
-                # API 결과 확인
-                if not api_result or not api_result.get("success"):
-                    error_message = api_result.get("message", "알 수 없는 오류") if api_result else "API 응답 없음"
-                    translated_message = await alibaba_1688_util.translate_chinese_to_korean(error_message)
-
-                    error_details.append({
+        async def create_seller_order(open_uid, seller_data):
+            async with semaphore:
+                try:
+                    return await _create_1688_seller_order(open_uid, seller_data, message, user_no, idempotency_key)
+                except Exception as e:
+                    return "error", {
                         "open_uid": open_uid,
-                        "dtl_nos": dtl_nos,
-                        "error": f"1688 주문 생성 실패: {translated_message}",
-                        "api_response": api_result
-                    })
-                    total_error += 1
-                    continue
-
-                # 주문 ID 추출
-                order_id = None
-                if "result" in api_result:
-                    order_id = api_result["result"].get("orderId")
-
-                if not order_id:
-                    error_details.append({
-                        "open_uid": open_uid,
-                        "dtl_nos": dtl_nos,
-                        "error": "1688에서 주문 ID를 받지 못했습니다.",
-                        "api_response": api_result
-                    })
-                    total_error += 1
-                    continue
-
-                # DB 업데이트 - 해당 판매자의 상품만
-                updated_estimate_count = db.query(purchase_models.OrderShipmentEstimateProduct).filter(
-                    purchase_models.OrderShipmentEstimateProduct.order_shipment_dtl_no.in_(dtl_nos),
-                    purchase_models.OrderShipmentEstimateProduct.fail_yn == 0,
-                    purchase_models.OrderShipmentEstimateProduct.del_yn == 0
-                ).update(
-                    {
-                        "purchase_order_number": order_id,
-                        "updated_by": user_no,
-                        "updated_at": func.now()
-                    },
-                    synchronize_session=False
-                )
+                        "dtl_nos": seller_data["dtl_nos"],
+                        "error": f"처리 중 오류: {str(e)}"
+                    }
+                finally:
+                    progress["done"] += 1
+                    if on_progress:
+                        on_progress(progress["done"], len(grouped_by_seller))
+
+        seller_results = await asyncio.gather(*[
+            create_seller_order(open_uid, seller_data) for open_uid, seller_data in grouped_by_seller.items()
+        ])
+
+        estimate_count_by_dtl = defaultdict(int)
+        for estimate_product, shipment_dtl, set_sku in estimate_products:
+            estimate_count_by_dtl[estimate_product.order_shipment_dtl_no] += 1
 
-                updated_dtl_count = db.query(purchase_models.OrderShipmentDtl).filter(
-                    purchase_models.OrderShipmentDtl.order_shipment_dtl_no.in_(dtl_nos),
-                    purchase_models.OrderShipmentDtl.del_yn == 0
-                ).update(
-                    {
-                        "purchase_order_number": order_id,
-                        "order_shipment_dtl_status_cd": "PURCHASE_PROCESSING",
-                        "updated_by": user_no,
-                        "updated_at": func.now()
-                    },
-                    synchronize_session=False
-                )
+        created_orders = []
+        error_details = []
+        all_order_numbers = []  # 생성된 모든 주문 번호 수집
+        order_id_by_dtl = {}
 
-                created_orders.append({
-                    "open_uid": open_uid,
-                    "order_1688_id": order_id,
-                    "dtl_nos": dtl_nos,
-                    "total_items": len(cargo_list),
-                    "total_quantity": sum(cargo.quantity for cargo in cargo_list),
-                    "updated_estimate_count": updated_estimate_count,
-                    "updated_dtl_count": updated_dtl_count
-                })
+        for outcome, detail in seller_results:
+            if outcome != "success":
+                error_details.append(detail)
+                continue
 
-                # 생성된 주문번호 수집
-                all_order_numbers.append(order_id)
-                total_success += 1
+            dtl_nos = detail["dtl_nos"]
+            for dtl_no in dtl_nos:
+                order_id_by_dtl[dtl_no] = detail["order_id"]
+
+            created_orders.append({
+                "open_uid": detail["open_uid"],
+                "order_1688_id": detail["order_id"],
+                "dtl_nos": dtl_nos,
+                "total_items": len(detail["cargo_list"]),
+                "total_quantity": sum(cargo.quantity for cargo in detail["cargo_list"]),
+                "updated_estimate_count": sum(estimate_count_by_dtl[dtl_no] for dtl_no in dtl_nos),
+                "updated_dtl_count": len(dtl_nos),
+                "replayed": detail["replayed"]
+            })
+            all_order_numbers.append(detail["order_id"])
 
-            except Exception as e:
-                error_details.append({
-                    "open_uid": open_uid,
-                    "dtl_nos": seller_data["dtl_nos"],
-                    "error": f"처리 중 오류: {str(e)}"
-                })
-                total_error += 1
-                continue
+        total_success = len(created_orders)
+        total_error = len(error_details)
 
-        # 커밋
-        if total_success > 0:
+        # 4. 성공한 판매자 주문번호를 DTL / 견적 상품에 일괄 반영 후 커밋
+        if order_id_by_dtl:
+            _apply_1688_order_numbers(db, order_id_by_dtl, user_no)
             db.commit()
         else:
             db.rollback()
@@ -2639,8 +2550,18 @@ async def create_payment_link(
         db: Session
 ) -> common_response.ApiResponse[dict]:
     """선택한 쉽먼트 DTL의 결제 링크 생성"""
+    user_no, company_no = get_authenticated_user_no(request)
+
+    return await run_create_payment_link(payment_link_request, user_no, db)
+
+
+async def run_create_payment_link(
+        payment_link_request: purchase_schemas.CreatePaymentLinkRequest,
+        user_no: int,
+        db: Session
+) -> common_response.ApiResponse[dict]:
+    """선택한 쉽먼트 DTL의 결제 링크 생성 (HTTP 요청 / 작업 큐 공용)"""
     try:
-        user_no, company_no = get_authenticated_user_no(request)
         order_shipment_dtl_nos = payment_link_request.order_shipment_dtl_nos
 
         # 1. 유효한 쉽먼트 DTL 조회
@@ -2773,4 +2694,166 @@ async def create_payment_link(
         raise HTTPException(
             status_code=400,
             detail=f"결제 링크 생성 중 오류가 발생했습니다: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+# ==================== 작업 큐 (외부 API 비동기 처리) ====================
+
+def _submit_purchase_job(job_type: str, payload: dict, progress_total: int, request: Request, db: Session) -> ApiResponse[dict]:
+    user_no, company_no = get_authenticated_user_no(request)
+
+    job = job_service.enqueue_job(db, job_type, payload, user_no, progress_total=progress_total)
+
+    return ResponseBuilder.success(
+        data={'job_no': job.job_no, 'job_type': job.job_type, 'status': job.status},
+        message='작업이 등록되었습니다. 작업 번호로 진행 상태를 조회하세요.'
+    )
+
+
+def submit_1688_order_job(
+        create_order_request: purchase_schemas.Create1688OrderRequest,
+        request: Request,
+        db: Session
+) -> ApiResponse[dict]:
+    """1688 주문 생성 작업 등록"""
+    return _submit_purchase_job(
+        'PURCHASE_1688_ORDER', create_order_request.dict(), 0, request, db
+    )
+
+
+def submit_payment_link_job(
+        payment_link_request: purchase_schemas.CreatePaymentLinkRequest,
+        request: Request,
+        db: Session
+) -> ApiResponse[dict]:
+    """결제 링크 생성 작업 등록"""
+    return _submit_purchase_job(
+        'PURCHASE_1688_PAYMENT_LINK', payment_link_request.dict(), 1, request, db
+    )
+
+
+def submit_cj_tracking_number_job(
+        Issue_tracking_number_request: purchase_schemas.IssueCjTackingNumberRequest,
+        request: Request,
+        db: Session
+) -> ApiResponse[dict]:
+    """CJ 운송장 번호 발급 작업 등록"""
+    return _submit_purchase_job(
+        'PURCHASE_CJ_TRACKING_NUMBER',
+        Issue_tracking_number_request.dict(),
+        len(Issue_tracking_number_request.order_shipment_packing_mst_nos),
+        request,
+        db
+    )
+
+
+async def handle_1688_order_job(payload: dict, context: job_service.JobContext) -> dict:
+    """1688 주문 생성 작업 (재실행 시 이미 주문된 DTL은 제외)"""
+    db = SessionLocal()
+    try:
+        response = await run_create_1688_order(
+            purchase_schemas.Create1688OrderRequest(**payload),
+            context.created_by,
+            db,
+            on_progress=context.update_progress,
+            skip_already_ordered=True,
+            idempotency_key=f"JOB_{context.job_no}"
+        )
+        return {'message': response.message, **(response.data or {})}
+    finally:
+        db.close()
+
+
+async def handle_payment_link_job(payload: dict, context: job_service.JobContext) -> dict:
+    """결제 링크 생성 작업 (같은 주문번호로 재생성 후 덮어쓰므로 멱등)"""
+    db = SessionLocal()
+    try:
+        response = await run_create_payment_link(
+            purchase_schemas.CreatePaymentLinkRequest(**payload),
+            context.created_by,
+            db
+        )
+        return {'message': response.message, **(response.data or {})}
+    finally:
+        db.close()
+
+
+async def handle_cj_tracking_number_job(payload: dict, context: job_service.JobContext) -> dict:
+    """CJ 운송장 발급 작업 (이미 운송장이 있는 박스는 건너뛰므로 멱등)"""
+    db = SessionLocal()
+    try:
+        response = await run_issue_cj_tracking_number(
+            purchase_schemas.IssueCjTackingNumberRequest(**payload),
+            context.created_by,
+            db,
+            on_progress=context.update_progress
+        )
+        return {'message': response.message, **(response.data or {})}
+    finally:
+        db.close()
+
+
+def submit_excel_export_job(
+        excel_export_request: purchase_schemas.ExcelExportRequest,
+        request: Request,
+        db: Session
+) -> ApiResponse[dict]:
+    """엑셀 생성 작업 등록 (완료 후 /jobs/excel-export/{job_no}/download 로 다운로드)"""
+    if excel_export_request.export_type not in EXCEL_EXPORTS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 다운로드 종류입니다: {excel_export_request.export_type}")
+
+    _get_existing_order_mst(excel_export_request.order_mst_no, db)
+
+    return _submit_purchase_job(
+        'PURCHASE_EXCEL_EXPORT', excel_export_request.dict(), 1, request, db
+    )
+
+
+async def handle_excel_export_job(payload: dict, context: job_service.JobContext) -> dict:
+    """엑셀 생성 작업 (같은 원본 데이터면 캐시 파일 재사용하므로 멱등)"""
+
+    def build():
+        db = SessionLocal()
+        try:
+            return build_excel_artifact(payload['export_type'], payload['order_mst_no'], db)
+        finally:
+            db.close()
+
+    # 파일 작성은 동기 처리라 이벤트 루프를 막지 않도록 스레드에서 실행
+    meta = await asyncio.to_thread(build)
+    context.update_progress(1)
+    return meta
+
+
+def register_job_handlers():
+    """구매 작업 큐 처리 함수 등록 (API / 워커 프로세스 시작 시 호출)"""
+    job_service.register_job_handler('PURCHASE_1688_ORDER', handle_1688_order_job)
+    job_service.register_job_handler('PURCHASE_1688_PAYMENT_LINK', handle_payment_link_job)
+    job_service.register_job_handler('PURCHASE_CJ_TRACKING_NUMBER', handle_cj_tracking_number_job)
+    job_service.register_job_handler('PURCHASE_EXCEL_EXPORT', handle_excel_export_job)
+
+
+def download_excel_export(
+        job_no: int,
+        request: Request,
+        db: Session
+) -> StreamingResponse:
+    """엑셀 생성 작업 결과 파일 다운로드"""
+    job = db.query(ComJobQueue).filter(
+        ComJobQueue.job_no == job_no,
+        ComJobQueue.job_type == 'PURCHASE_EXCEL_EXPORT'
+    ).first()
+
+    if not job:
+        raise HTTPException(status_code=404, detail="해당 엑셀 생성 작업을 찾을 수 없습니다.")
+
+    if job.status != 'DONE':
+        raise HTTPException(
+            status_code=409,
+            detail=job.error_message if job.status == 'FAILED' else f"엑셀 파일이 아직 준비되지 않았습니다. (상태: {job.status})"
+        )
+
+    meta = EXPORT_ARTIFACT_STORE.get(db, json.loads(job.result)['cache_key'])
+    if not meta:
+        raise HTTPException(status_code=410, detail="엑셀 파일이 만료되었습니다. 다시 생성해 주세요.")
+
+    return _stream_excel_artifact(meta)
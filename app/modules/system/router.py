@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.core.database import get_db
+from app.common.response import ApiResponse, PageResponse
+from app.common.schemas.request import PaginationRequest
+from app.modules.system import service as system_service
+
+system_router = APIRouter()
+
+
+# 1688 계정 설정 스냅샷 조회
+@system_router.get("/1688-accounts")
+def fetch_1688_account_snapshot() -> ApiResponse[dict]:
+    return system_service.fetch_1688_account_snapshot()
+
+
+# 1688 계정 설정 강제 재로드 (access_token 교체 직후 등)
+@system_router.post("/1688-accounts/reload")
+def reload_1688_accounts(db: Session = Depends(get_db)) -> ApiResponse[dict]:
+    return system_service.reload_1688_accounts(db)
+
+
+# 스케줄 작업 실행 이력 (건수 / 계정별 호출 수 / 1688 응답 시간 p50·p95)
+@system_router.get("/sync-runs")
+def fetch_sync_run_history(
+        job_id: Optional[str] = Query(None, description="스케줄 작업 ID (예: sync_1688_order_status)"),
+        pagination: PaginationRequest = Depends(),
+        db: Session = Depends(get_db)
+) -> ApiResponse[PageResponse[dict]]:
+    return system_service.fetch_sync_run_history(job_id, pagination, db)
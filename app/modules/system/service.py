@@ -0,0 +1,69 @@
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.common.response import ApiResponse, PageResponse, ResponseBuilder
+from app.common.schemas import request as common_request
+from app.core.config_1688 import ALIBABA_1688_API_CONFIG
+from app.modules.common.models import ComSyncRunHistory
+import json
+
+
+def _account_snapshot_data(snapshot) -> dict:
+    # 인증 정보(app_secret / access_token)는 응답에서 제외
+    return {
+        "version": snapshot.version,
+        "account_nos": list(snapshot.account_nos),
+        "account_count": len(snapshot.account_nos),
+        "source_updated_at": snapshot.source_updated_at,
+        "loaded_at": snapshot.loaded_at,
+    }
+
+
+def fetch_1688_account_snapshot() -> ApiResponse[dict]:
+    """현재 프로세스의 1688 계정 설정 스냅샷 정보"""
+    return ResponseBuilder.success(
+        data=_account_snapshot_data(ALIBABA_1688_API_CONFIG.get_snapshot()),
+        message="1688 계정 설정 정보를 조회했습니다."
+    )
+
+
+def reload_1688_accounts(db: Session) -> ApiResponse[dict]:
+    """
+    1688 계정 설정 즉시 재로드 (요청을 받은 프로세스 기준)
+    다른 프로세스는 변경 감시 주기(ACCOUNT_1688_RELOAD_CHECK_INTERVAL_SECONDS) 내에 반영된다.
+    """
+    snapshot = ALIBABA_1688_API_CONFIG.load_all_configs(db)
+
+    return ResponseBuilder.success(
+        data=_account_snapshot_data(snapshot),
+        message="1688 계정 설정을 다시 불러왔습니다."
+    )
+
+
+def fetch_sync_run_history(
+        job_id: Optional[str],
+        pagination: common_request.PaginationRequest,
+        db: Session
+) -> ApiResponse[PageResponse[dict]]:
+    """스케줄 작업 실행 이력 (최근 실행 순)"""
+    query = db.query(ComSyncRunHistory)
+    if job_id:
+        query = query.filter(ComSyncRunHistory.job_id == job_id)
+
+    total_elements = query.count()
+
+    offset = (pagination.page - 1) * pagination.size
+    runs = query.order_by(ComSyncRunHistory.run_no.desc()).offset(offset).limit(pagination.size).all()
+
+    content = []
+    for run in runs:
+        run_dict = {column.name: getattr(run, column.name) for column in ComSyncRunHistory.__table__.columns}
+        run_dict['account_calls'] = json.loads(run.account_calls) if run.account_calls else {}
+        content.append(run_dict)
+
+    return ResponseBuilder.paged_success(
+        content=content,
+        page=pagination.page,
+        size=pagination.size,
+        total_elements=total_elements,
+        message="스케줄 실행 이력을 조회했습니다."
+    )
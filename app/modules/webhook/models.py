@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text, func, UniqueConstraint
+from app.core.database import Base
+
+
+class WebhookInbox1688(Base):
+    __tablename__ = "WEBHOOK_INBOX_1688"
+    __table_args__ = (
+        UniqueConstraint('account_info_no_1688', 'msg_id', name='UK_WEBHOOK_INBOX_1688_MSG'),
+    )
+
+    inbox_no = Column(Integer, primary_key=True, autoincrement=True, comment='수신 메시지 번호')
+    account_info_no_1688 = Column(Integer, nullable=False, comment='1688 계정 정보 번호')
+    msg_id = Column(String(100), nullable=False, comment='1688 메시지 ID (중복 수신 방지)')
+    msg_type = Column(String(100), nullable=True, comment='1688 메시지 타입')
+    payload = Column(Text, nullable=False, comment='메시지 원문(JSON)')
+    status = Column(String(20), nullable=False, default='PENDING', comment='처리 상태(PENDING, DONE, FAILED, IGNORED)')
+    attempts = Column(Integer, nullable=False, default=0, comment='처리 시도 횟수')
+    error_message = Column(String(1000), nullable=True, comment='마지막 처리 오류')
+    received_at = Column(DateTime, nullable=False, default=func.now(), comment='수신일시')
+    processed_at = Column(DateTime, nullable=True, comment='처리일시')
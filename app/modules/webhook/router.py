@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Depends, Path, Request
+from sqlalchemy.orm import Session
+from app.core.database import get_db
+from app.common.response import ApiResponse
+from app.modules.webhook import service as webhook_service
+
+webhook_router = APIRouter()
+
+
+# 1688 메시지 푸시 수신 (계정별 콜백 URL)
+@webhook_router.post("/1688/{account_info_no_1688}")
+async def receive_1688_message(
+        request: Request,
+        account_info_no_1688: int = Path(..., description="1688 계정 정보 번호"),
+        db: Session = Depends(get_db)
+) -> ApiResponse[dict]:
+    return await webhook_service.receive_1688_message(account_info_no_1688, request, db)
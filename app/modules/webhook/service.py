@@ -0,0 +1,169 @@
+from fastapi import HTTPException, Request
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from app.common.response import ApiResponse, ResponseBuilder
+from app.core.database import get_db
+from app.core.config import WEBHOOK_1688_CONFIG
+from app.core.config_1688 import ALIBABA_1688_API_CONFIG
+from app.modules.webhook.models import WebhookInbox1688
+from app.scheduler.scheduler_1688 import LogisticsBulkApplier, record_1688_sync_states
+from datetime import datetime
+import hashlib
+import hmac
+import json
+
+# 물류 정보가 포함된 1688 메시지 타입
+LOGISTICS_MESSAGE_TYPES_1688 = ("LOGISTICS_BUYER_VIEW_TRACE", "LOGISTICS_MAIL_NO_CHANGE")
+
+
+def verify_1688_message_signature(account_info_no_1688: int, message: str, signature: str) -> bool:
+    """1688 메시지 푸시 서명 검증 (app_secret 기반 HMAC-SHA1, 'message' + 원문)"""
+    config = ALIBABA_1688_API_CONFIG._get_account_config(account_info_no_1688)
+    expected = ALIBABA_1688_API_CONFIG.generate_signature("", {"message": message}, config)
+    return hmac.compare_digest(expected, (signature or "").upper())
+
+
+async def receive_1688_message(account_info_no_1688: int, request: Request, db: Session) -> ApiResponse[dict]:
+    """1688 메시지 푸시 수신 → 서명 검증 후 수신함(inbox)에 저장 (처리는 백그라운드 consumer)"""
+    form = await request.form()
+    message = form.get("message")
+    signature = form.get("_aop_signature")
+
+    if not message or not signature:
+        raise HTTPException(status_code=400, detail="message / _aop_signature 값이 필요합니다.")
+
+    try:
+        verified = verify_1688_message_signature(account_info_no_1688, message, signature)
+    except ValueError:
+        raise HTTPException(status_code=404, detail=f"1688 계정 번호 {account_info_no_1688}를 찾을 수 없습니다.")
+
+    if not verified:
+        raise HTTPException(status_code=401, detail="1688 메시지 서명이 올바르지 않습니다.")
+
+    try:
+        message_data = json.loads(message)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="1688 메시지 형식이 올바르지 않습니다.")
+
+    msg_id = str(message_data.get("msgId") or hashlib.sha1(message.encode("utf-8")).hexdigest())
+
+    inbox = WebhookInbox1688(
+        account_info_no_1688=account_info_no_1688,
+        msg_id=msg_id,
+        msg_type=message_data.get("type"),
+        payload=message,
+        status="PENDING",
+        attempts=0
+    )
+
+    duplicate = False
+    try:
+        db.add(inbox)
+        db.commit()
+    except IntegrityError:
+        # 같은 메시지 재전송 → 이미 수신됨
+        db.rollback()
+        duplicate = True
+
+    return ResponseBuilder.success(
+        data={"msg_id": msg_id, "duplicate": duplicate},
+        message="1688 메시지가 수신되었습니다."
+    )
+
+
+def parse_1688_push_message(message_data: dict) -> list:
+    """
+    1688 푸시 메시지에서 물류 변경 내용 추출
+
+    Returns:
+        list: [(구매 주문 번호, 운송장 번호, 배송 상태), ...] - 반영할 내용이 없으면 빈 리스트
+    """
+    if message_data.get("type") not in LOGISTICS_MESSAGE_TYPES_1688:
+        return []
+
+    data = message_data.get("data") or {}
+    tracing = data.get("OrderLogisticsTracingModel") or data
+
+    tracking_number = tracing.get("logisticsId") or tracing.get("mailNo")
+    delivery_status = tracing.get("statusChanged") or tracing.get("status")
+    if not tracking_number:
+        return []
+
+    order_ids = []
+    for item in tracing.get("orderLogsItems") or []:
+        if item.get("orderId") and str(item["orderId"]) not in order_ids:
+            order_ids.append(str(item["orderId"]))
+    if tracing.get("orderId") and str(tracing["orderId"]) not in order_ids:
+        order_ids.append(str(tracing["orderId"]))
+
+    return [(order_id, tracking_number, delivery_status) for order_id in order_ids]
+
+
+async def consume_1688_webhook_inbox():
+    """수신함의 1688 메시지를 OrderShipmentDtl / OrderShipmentEstimateProduct 및 동기화 상태에 반영"""
+    db = next(get_db())
+    try:
+        inbox_rows = db.query(WebhookInbox1688).filter(
+            WebhookInbox1688.status.in_(["PENDING", "FAILED"]),
+            WebhookInbox1688.attempts < WEBHOOK_1688_CONFIG.MAX_ATTEMPTS
+        ).order_by(
+            WebhookInbox1688.inbox_no
+        ).limit(WEBHOOK_1688_CONFIG.CONSUMER_BATCH_SIZE).all()
+
+        if not inbox_rows:
+            return
+
+        # 시도 횟수는 반영 결과와 별도 트랜잭션으로 먼저 커밋 (반영이 계속 실패하는 배치도 MAX_ATTEMPTS 후 제외)
+        inbox_nos = [inbox.inbox_no for inbox in inbox_rows]
+        for inbox in inbox_rows:
+            inbox.attempts += 1
+        db.commit()
+
+        applier = LogisticsBulkApplier(db, include_estimate_products=True)
+        sync_results = []
+        order_accounts = {}
+        now = datetime.now()
+
+        for inbox in inbox_rows:
+            try:
+                updates = parse_1688_push_message(json.loads(inbox.payload))
+
+                for order_number, tracking_number, delivery_status in updates:
+                    applier.add(order_number, tracking_number, delivery_status)
+                    sync_results.append((order_number, 'success', {'logisticsId': tracking_number, 'status': delivery_status}))
+                    order_accounts[order_number] = inbox.account_info_no_1688
+
+                inbox.status = "DONE" if updates else "IGNORED"
+                inbox.error_message = None
+                inbox.processed_at = now
+
+            except Exception as e:
+                inbox.status = "FAILED"
+                inbox.error_message = str(e)[:1000]
+
+        # 물류 정보 반영 (수신함 처리 상태도 같은 트랜잭션으로 커밋)
+        try:
+            applier.flush()
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            db.query(WebhookInbox1688).filter(
+                WebhookInbox1688.inbox_no.in_(inbox_nos)
+            ).update({
+                'status': "FAILED",
+                'error_message': f"물류 정보 반영 실패: {str(e)}"[:1000]
+            }, synchronize_session=False)
+            db.commit()
+            print(f"[{datetime.now()}] 1688 메시지 {len(inbox_nos)}건 반영 실패: {str(e)}")
+            return
+
+        # 폴링 동기화 상태에도 기록 (종료 상태 주문은 이후 폴링 제외)
+        record_1688_sync_states(db, sync_results, order_accounts)
+
+        print(f"[{datetime.now()}] 1688 메시지 {len(inbox_rows)}건 처리 (물류 반영 {len(sync_results)}건)")
+
+    except Exception as e:
+        db.rollback()
+        print(f"[{datetime.now()}] 1688 메시지 처리 실패: {str(e)}")
+    finally:
+        db.close()
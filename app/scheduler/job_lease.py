@@ -0,0 +1,158 @@
+# app/scheduler/job_lease.py
+from app.core.database import SessionLocal
+from app.core.config import JOB_LEASE_CONFIG
+from app.modules.common.models import ComJobLease
+from datetime import datetime, timedelta
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError
+import asyncio
+import functools
+import os
+import socket
+
+# 현재 프로세스 식별자
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+def try_acquire_job_lease(db, job_id: str, ttl_seconds: int = None) -> bool:
+    """
+    작업 리스 획득 (비어 있거나 만료되었거나 이미 내가 보유한 경우)
+
+    Returns:
+        bool: 획득 여부
+    """
+    now = datetime.now()
+    lease_until = now + timedelta(seconds=ttl_seconds or JOB_LEASE_CONFIG.TTL_SECONDS)
+
+    try:
+        updated = db.query(ComJobLease).filter(
+            and_(
+                ComJobLease.job_id == job_id,
+                or_(
+                    ComJobLease.lease_until.is_(None),
+                    ComJobLease.lease_until < now,
+                    ComJobLease.holder == WORKER_ID
+                )
+            )
+        ).update({
+            'holder': WORKER_ID,
+            'lease_until': lease_until,
+            'acquired_at': now
+        }, synchronize_session=False)
+
+        if updated:
+            db.commit()
+            return True
+
+        # 리스 행이 없으면 생성 (동시에 생성되면 PK 충돌로 한쪽만 성공)
+        if db.query(ComJobLease.job_id).filter(ComJobLease.job_id == job_id).first():
+            db.rollback()
+            return False
+
+        db.add(ComJobLease(job_id=job_id, holder=WORKER_ID, lease_until=lease_until, acquired_at=now))
+        db.commit()
+        return True
+
+    except IntegrityError:
+        db.rollback()
+        return False
+
+
+def renew_job_lease(db, job_id: str, ttl_seconds: int = None) -> bool:
+    """보유 중인 리스 연장 (다른 워커에게 넘어갔으면 False)"""
+    lease_until = datetime.now() + timedelta(seconds=ttl_seconds or JOB_LEASE_CONFIG.TTL_SECONDS)
+
+    updated = db.query(ComJobLease).filter(
+        and_(
+            ComJobLease.job_id == job_id,
+            ComJobLease.holder == WORKER_ID
+        )
+    ).update({'lease_until': lease_until}, synchronize_session=False)
+    db.commit()
+
+    return bool(updated)
+
+
+def release_job_lease(db, job_id: str, lease_until: datetime = None):
+    """
+    보유 중인 리스 반환
+
+    Args:
+        lease_until: 이 시각까지 다른 워커의 획득을 막음 (없거나 지난 시각이면 즉시 만료 처리)
+    """
+    now = datetime.now()
+    db.query(ComJobLease).filter(
+        and_(
+            ComJobLease.job_id == job_id,
+            ComJobLease.holder == WORKER_ID
+        )
+    ).update({'lease_until': max(lease_until or now, now)}, synchronize_session=False)
+    db.commit()
+
+
+async def _keep_job_lease_alive(job_id: str, job_task: asyncio.Task):
+    """작업 실행 중 주기적으로 리스 연장, 리스를 잃으면 작업 취소"""
+    while True:
+        await asyncio.sleep(JOB_LEASE_CONFIG.RENEW_INTERVAL_SECONDS)
+
+        db = SessionLocal()
+        try:
+            renewed = renew_job_lease(db, job_id)
+        except Exception as e:
+            print(f"[{datetime.now()}] 작업 리스 연장 실패 ({job_id}): {str(e)}")
+            continue
+        finally:
+            db.close()
+
+        if not renewed:
+            print(f"[{datetime.now()}] 작업 리스를 잃어 실행을 중단합니다. ({job_id})")
+            job_task.cancel()
+            return
+
+
+def with_job_lease(job_id: str, func, interval_seconds: float = None):
+    """
+    여러 워커 중 리스를 획득한 1개 워커에서만 스케줄 작업을 실행하도록 감싸기
+
+    워커마다 IntervalTrigger 실행 시점이 달라, 실행 직후 리스를 풀면 다른 워커가 같은 주기 안에 다시 실행한다.
+    그래서 실행이 끝나도 리스는 시작 시각 + interval_seconds 까지 유지한다.
+    보유 워커는 다음 주기에 바로 재획득하고, 보유 워커가 죽으면 다른 워커가 1주기 후 이어받는다.
+
+    Args:
+        job_id: 리스 키 (스케줄러 job id)
+        func: 실행할 코루틴 함수
+        interval_seconds: 스케줄 실행 주기 (없으면 실행 종료 즉시 반환)
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        started_at = datetime.now()
+
+        db = SessionLocal()
+        try:
+            acquired = try_acquire_job_lease(db, job_id)
+        finally:
+            db.close()
+
+        if not acquired:
+            print(f"[{datetime.now()}] 다른 워커가 이번 주기 실행을 담당하므로 건너뜁니다. ({job_id})")
+            return None
+
+        job_task = asyncio.ensure_future(func(*args, **kwargs))
+        renew_task = asyncio.create_task(_keep_job_lease_alive(job_id, job_task))
+        try:
+            return await job_task
+        finally:
+            renew_task.cancel()
+
+            db = SessionLocal()
+            try:
+                release_job_lease(
+                    db, job_id,
+                    started_at + timedelta(seconds=interval_seconds) if interval_seconds else None
+                )
+            except Exception as e:
+                print(f"[{datetime.now()}] 작업 리스 반환 실패 ({job_id}): {str(e)}")
+            finally:
+                db.close()
+
+    return wrapper
@@ -0,0 +1,45 @@
+# app/scheduler/jobs.py
+from app.core.config import SYNC_1688_CONFIG, SYNC_CJ_CONFIG, WEBHOOK_1688_CONFIG, EXCEL_EXPORT_CONFIG
+from app.scheduler import scheduler_1688, scheduler_cj
+from app.modules.webhook import service as webhook_service
+from app.utils.export_artifact_util import cleanup_export_artifacts
+from app.scheduler.job_lease import with_job_lease
+from apscheduler.triggers.interval import IntervalTrigger
+
+
+def register_jobs(scheduler):
+    """스케줄 작업 등록 (API 프로세스 / 워커 프로세스 공용)"""
+    scheduler.add_job(
+        func=with_job_lease('sync_1688_order_status', scheduler_1688.sync_1688_order_status, SYNC_1688_CONFIG.ORDER_STATUS_INTERVAL_MINUTES * 60),  # 1688 구매 상태 배치 (워커 간 1곳에서만 실행)
+        trigger=IntervalTrigger(minutes=SYNC_1688_CONFIG.ORDER_STATUS_INTERVAL_MINUTES),
+        id='sync_1688_order_status',  # 고유한 ID
+        name='1688 주문 상태 동기화'
+    )
+
+    scheduler.add_job(
+        func=with_job_lease('sync_1688_payment_links', scheduler_1688.sync_1688_payment_links, SYNC_1688_CONFIG.PAYMENT_LINK_INTERVAL_MINUTES * 60),  # 1688 결제 링크 배치
+        trigger=IntervalTrigger(minutes=SYNC_1688_CONFIG.PAYMENT_LINK_INTERVAL_MINUTES),
+        id='sync_1688_payment_links',
+        name='1688 결제 링크 동기화'
+    )
+
+    scheduler.add_job(
+        func=with_job_lease('sync_cj_tracking_status', scheduler_cj.sync_cj_tracking_status, SYNC_CJ_CONFIG.INTERVAL_MINUTES * 60),  # CJ 배송 상태 배치
+        trigger=IntervalTrigger(minutes=SYNC_CJ_CONFIG.INTERVAL_MINUTES),
+        id='sync_cj_tracking_status',
+        name='CJ 배송 상태 동기화'
+    )
+
+    scheduler.add_job(
+        func=with_job_lease('consume_1688_webhook_inbox', webhook_service.consume_1688_webhook_inbox, WEBHOOK_1688_CONFIG.CONSUMER_INTERVAL_SECONDS),  # 1688 메시지 푸시 반영
+        trigger=IntervalTrigger(seconds=WEBHOOK_1688_CONFIG.CONSUMER_INTERVAL_SECONDS),
+        id='consume_1688_webhook_inbox',
+        name='1688 메시지 수신함 처리'
+    )
+
+    scheduler.add_job(
+        func=with_job_lease('cleanup_export_artifacts', cleanup_export_artifacts, EXCEL_EXPORT_CONFIG.CLEANUP_INTERVAL_MINUTES * 60),  # 만료 엑셀 캐시 정리
+        trigger=IntervalTrigger(minutes=EXCEL_EXPORT_CONFIG.CLEANUP_INTERVAL_MINUTES),
+        id='cleanup_export_artifacts',
+        name='엑셀 다운로드 캐시 정리'
+    )
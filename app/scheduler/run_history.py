@@ -0,0 +1,118 @@
+# app/scheduler/run_history.py
+from app.core.database import SessionLocal
+from app.core.config import SCHEDULER_CONFIG
+from app.modules.common.models import ComSyncRunHistory
+from app.scheduler.job_lease import WORKER_ID
+from collections import defaultdict
+from datetime import datetime, timedelta
+import json
+import math
+import time
+
+# 결과 구분 → 이력 컬럼
+OUTCOME_COLUMNS = {
+    'success': 'success_count',
+    'not_shipped': 'not_shipped_count',
+    'no_info': 'no_info_count',
+    'failed': 'failed_count',
+}
+
+
+def percentile(values: list, pct: float):
+    """nearest-rank 백분위수 (값이 없으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class SyncRunRecorder:
+    """
+    스케줄 작업 1회 실행 이력 기록 (결과별 건수, 계정별 호출 수, 1688 응답 시간)
+    작업의 DB 트랜잭션과 분리된 별도 세션으로 시작 / 종료 시점에만 저장
+    """
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self.run_no = None
+        self.started_at = None
+        self._started_perf = None
+        self.target_count = 0
+        self.rows_updated = 0
+        self.outcomes = defaultdict(int)
+        self.account_calls = defaultdict(int)
+        self.latencies_ms = []
+
+    def start(self, target_count: int = 0):
+        self.started_at = datetime.now()
+        self._started_perf = time.perf_counter()
+        self.target_count = target_count
+
+        db = SessionLocal()
+        try:
+            run = ComSyncRunHistory(
+                job_id=self.job_id,
+                worker_id=WORKER_ID,
+                status='RUNNING',
+                started_at=self.started_at,
+                target_count=target_count
+            )
+            db.add(run)
+            db.commit()
+            self.run_no = run.run_no
+        except Exception as e:
+            db.rollback()
+            print(f"[{datetime.now()}] 실행 이력 저장 실패 ({self.job_id}): {str(e)}")
+        finally:
+            db.close()
+
+    def record_call(self, account_no, elapsed_seconds: float):
+        """1688 API 호출 1건 (계정 None은 호출 여유 기준 자동 선택)"""
+        self.account_calls['auto' if account_no is None else str(account_no)] += 1
+        self.latencies_ms.append(elapsed_seconds * 1000)
+
+    def add_outcome(self, outcome: str, count: int = 1):
+        self.outcomes[outcome] += count
+
+    def finish(self, status: str = 'SUCCESS', error_message: str = None):
+        if self.run_no is None:
+            return
+
+        finished_at = datetime.now()
+        values = {
+            'status': status,
+            'finished_at': finished_at,
+            'duration_ms': int((time.perf_counter() - self._started_perf) * 1000),
+            'target_count': self.target_count,
+            'rows_updated': self.rows_updated,
+            'api_call_count': len(self.latencies_ms),
+            'account_calls': json.dumps(self.account_calls),
+            'latency_p50_ms': self._round(percentile(self.latencies_ms, 50)),
+            'latency_p95_ms': self._round(percentile(self.latencies_ms, 95)),
+            'latency_max_ms': self._round(max(self.latencies_ms) if self.latencies_ms else None),
+            'error_message': error_message[:1000] if error_message else None,
+        }
+        for outcome, column in OUTCOME_COLUMNS.items():
+            values[column] = self.outcomes.get(outcome, 0)
+
+        db = SessionLocal()
+        try:
+            db.query(ComSyncRunHistory).filter(ComSyncRunHistory.run_no == self.run_no).update(
+                values, synchronize_session=False
+            )
+
+            # 보관 기간이 지난 이력 정리
+            db.query(ComSyncRunHistory).filter(
+                ComSyncRunHistory.started_at < finished_at - timedelta(days=SCHEDULER_CONFIG.RUN_HISTORY_RETENTION_DAYS)
+            ).delete(synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"[{datetime.now()}] 실행 이력 저장 실패 ({self.job_id}): {str(e)}")
+        finally:
+            db.close()
+
+    @staticmethod
+    def _round(value):
+        return int(round(value)) if value is not None else None
@@ -1,124 +1,409 @@
 # app/scheduler/scheduler_1688.py
 from app.core.database import get_db
 from app.core.config_1688 import ALIBABA_1688_API_CONFIG
-from app.modules.purchase.models import OrderShipmentDtl, OrderShipmentEstimate, OrderMst, OrderShipmentMst
-from datetime import datetime
-from sqlalchemy import and_, distinct
+from app.core.config import SYNC_1688_CONFIG
+from app.modules.purchase.models import OrderShipmentDtl, OrderShipmentEstimate, OrderMst, OrderShipmentMst, OrderPurchaseSync1688
+from datetime import datetime, timedelta
+from sqlalchemy import and_, or_, distinct, func, case
 from app.utils import alibaba_1688_util
 from app.modules.purchase import models as purchase_models
-import httpx
+from collections import defaultdict
+from app.scheduler.run_history import SyncRunRecorder
+import asyncio
+import heapq
+import time
+
+# 변화 없는 기간 대비 다음 조회 주기 비율 (예: 2일간 변화 없으면 12시간 뒤 조회)
+STALE_INTERVAL_RATIO = 0.25
 
 
 async def sync_1688_order_status():
-    """1688 구매요청 물류 상태 동기화 (매일 자정 실행)"""
+    """1688 구매요청 물류 상태 증분 동기화 (조회 예정 주문만, 계정별 동시 호출 + 배치 반영)"""
     print(f"[{datetime.now()}] 1688 주문 상태 동기화 시작...")
 
     db = next(get_db())
+    run_recorder = SyncRunRecorder('sync_1688_order_status')
     try:
-        # 1. 고유한 구매번호만 조회 (DISTINCT)
-        unique_order_numbers = db.query(
-            distinct(OrderShipmentDtl.purchase_order_number)
-        ).filter(
-            and_(
-                OrderShipmentDtl.purchase_order_number.isnot(None),
-                OrderShipmentDtl.purchase_order_number != '',
-                OrderShipmentDtl.del_yn == 0
-            )
-        ).all()
-
-        # 튜플 리스트를 문자열 리스트로 변환
-        order_numbers = [order[0] for order in unique_order_numbers]
+        # 1. 조회 예정 시각이 된 주문번호만 우선순위 순으로 조회 (종료 상태 제외)
+        order_numbers = get_due_1688_order_numbers(db)
+        run_recorder.start(len(order_numbers))
 
         print(f"[{datetime.now()}] 동기화 대상 주문 {len(order_numbers)}건 발견")
 
+        # 2. 주문번호별 account_info_no_1688 일괄 조회 (없으면 None → 랜덤 계정)
+        account_map = get_1688_account_map(db, order_numbers)
+        order_accounts = {order_number: account_map.get(order_number) for order_number in order_numbers}
+
         success_count = 0
         fail_count = 0
         not_shipped_count = 0
+        applier = LogisticsBulkApplier(db)
+        sync_results = []
 
-        # 2. 각 고유 주문 번호에 대해 한 번씩만 API 호출
-        for order_number in order_numbers:
+        # 3. 계정별 동시성 제한 하에 API 호출, 완료되는 순서대로 결과 처리
+        async for order_number, logistics_info in fetch_1688_logistics_infos(order_accounts, run_recorder):
             try:
-                # 2-1. 해당 주문번호의 account_info_no_1688 조회
-                account_no = db.query(OrderShipmentEstimate.account_info_no_1688).join(
-                    OrderMst, OrderShipmentEstimate.order_mst_no == OrderMst.order_mst_no
-                ).join(
-                    OrderShipmentMst, OrderMst.order_mst_no == OrderShipmentMst.order_mst_no
-                ).join(
-                    OrderShipmentDtl, OrderShipmentMst.order_shipment_mst_no == OrderShipmentDtl.order_shipment_mst_no
-                ).filter(
-                    and_(
-                        OrderShipmentDtl.purchase_order_number == order_number,
-                        OrderShipmentDtl.del_yn == 0,
-                        OrderShipmentEstimate.del_yn == 0
+                outcome, logistics_data = parse_1688_logistics_result(order_number, logistics_info)
+                sync_results.append((order_number, outcome, logistics_data))
+                run_recorder.add_outcome(outcome)
+
+                if outcome == 'success':
+                    # 4. 결과 수집 (chunk 단위로 일괄 UPDATE + 커밋)
+                    applier.add(
+                        order_number,
+                        logistics_data.get('logisticsId'),
+                        logistics_data.get('status')
                     )
-                ).first()
-
-                # account_no가 있으면 해당 계정 사용, 없으면 None (랜덤)
-                account_info_no = account_no[0] if account_no else None
-
-                # 3. 1688 API 호출 (계정 번호 전달)
-                logistics_info = await get_1688_logistics_info(order_number, account_info_no)
-
-                if logistics_info and logistics_info.get('success'):
-                    result = logistics_info.get('result', [])
-
-                    if result and len(result) > 0:
-                        logistics_data = result[0]
-
-                        # 4. 운송장 번호 및 배송 상태 추출
-                        tracking_number = logistics_data.get('logisticsId')
-                        delivery_status = logistics_data.get('status')
-                        logistics_company_id = logistics_data.get('logisticsCompanyId')
-
-                        if tracking_number:
-                            # 5. 해당 구매번호를 가진 모든 DTL 업데이트 (운송장번호 + 배송상태)
-                            updated_count = db.query(OrderShipmentDtl).filter(
-                                and_(
-                                    OrderShipmentDtl.purchase_order_number == order_number,
-                                    OrderShipmentDtl.del_yn == 0
-                                )
-                            ).update({
-                                'purchase_tracking_number': tracking_number,
-                                'delivery_status': delivery_status,
-                                'updated_at': datetime.now()
-                            }, synchronize_session=False)
-
-                            print(f"[{datetime.now()}] 주문번호 {order_number}: 업데이트 완료 ({updated_count}건)")
-                            print(f"[{datetime.now()}] - 운송장번호: {tracking_number}")
-                            print(f"[{datetime.now()}] - 배송상태: {delivery_status}")
-                            print(f"[{datetime.now()}] - 물류사ID: {logistics_company_id}")
-
-                            success_count += 1
-                    else:
-                        print(f"[{datetime.now()}] 주문번호 {order_number}: 물류 정보 없음")
-
-                elif logistics_info and logistics_info.get('errorCode') == '500_2':
-                    print(f"[{datetime.now()}] 주문번호 {order_number}: 아직 발송되지 않음")
+                    success_count += 1
+                elif outcome == 'not_shipped':
                     not_shipped_count += 1
-
-                else:
-                    error_msg = logistics_info.get('errorMessage', 'Unknown error')
-                    error_code = logistics_info.get('errorCode', '')
-                    print(f"[{datetime.now()}] 주문번호 {order_number} API 호출 실패: [{error_code}] {error_msg}")
+                elif outcome == 'failed':
                     fail_count += 1
 
             except Exception as e:
                 print(f"[{datetime.now()}] 주문번호 {order_number} 처리 중 오류 발생: {str(e)}")
+                sync_results.append((order_number, 'failed', None))
+                run_recorder.add_outcome('failed')
                 fail_count += 1
                 continue
 
-        # 6. 변경사항 커밋
-        db.commit()
+        # 5. 남은 변경사항 반영
+        applier.flush()
+
+        # 6. 주문별 동기화 상태 / 다음 조회 시각 기록
+        record_1688_sync_states(db, sync_results, order_accounts)
+
+        run_recorder.rows_updated = applier.updated_rows
+        run_recorder.finish()
+
         print(f"[{datetime.now()}] 1688 주문 상태 동기화 완료")
-        print(f"[{datetime.now()}] 성공: {success_count}건, 미발송: {not_shipped_count}건, 실패: {fail_count}건")
+        print(f"[{datetime.now()}] 성공: {success_count}건, 미발송: {not_shipped_count}건, 실패: {fail_count}건, 반영: {applier.updated_rows}행")
 
     except Exception as e:
         print(f"[{datetime.now()}] 1688 주문 상태 동기화 실패: {str(e)}")
         db.rollback()
+        run_recorder.finish('FAILED', str(e))
     finally:
         db.close()
 
 
+def get_due_1688_order_numbers(db, now: datetime = None) -> list:
+    """
+    조회 예정 시각(next_sync_at)이 된 구매 주문번호를 우선순위 큐 순서로 반환
+    - 동기화 상태가 없는 신규 주문이 가장 먼저, 이후 예정 시각이 오래된 순
+    - 종료 상태(terminal_yn = 1) 주문은 제외
+
+    Args:
+        db: DB 세션
+        now: 기준 시각 (기본값: 현재)
+
+    Returns:
+        list: 구매 주문 번호 리스트
+    """
+    now = now or datetime.now()
+
+    due_rows = db.query(
+        OrderShipmentDtl.purchase_order_number,
+        OrderPurchaseSync1688.next_sync_at
+    ).outerjoin(
+        OrderPurchaseSync1688,
+        OrderPurchaseSync1688.purchase_order_number == OrderShipmentDtl.purchase_order_number
+    ).filter(
+        and_(
+            OrderShipmentDtl.purchase_order_number.isnot(None),
+            OrderShipmentDtl.purchase_order_number != '',
+            OrderShipmentDtl.del_yn == 0,
+            or_(
+                OrderPurchaseSync1688.purchase_order_number.is_(None),
+                and_(
+                    OrderPurchaseSync1688.terminal_yn == 0,
+                    or_(
+                        OrderPurchaseSync1688.next_sync_at.is_(None),
+                        OrderPurchaseSync1688.next_sync_at <= now
+                    )
+                )
+            )
+        )
+    ).distinct().all()
+
+    # 다음 조회 시각 기준 우선순위 큐 (신규 주문은 datetime.min → 최우선)
+    queue = [(next_sync_at or datetime.min, order_number) for order_number, next_sync_at in due_rows]
+    heapq.heapify(queue)
+
+    limit = SYNC_1688_CONFIG.MAX_ORDERS_PER_RUN or len(queue)
+    order_numbers = []
+    while queue and len(order_numbers) < limit:
+        _, order_number = heapq.heappop(queue)
+        order_numbers.append(order_number)
+
+    return order_numbers
+
+
+def compute_next_1688_sync_at(last_changed_at: datetime, now: datetime) -> datetime:
+    """
+    다음 조회 시각 계산
+    최근 변경된(신규) 주문은 ACTIVE 주기, 변화가 없을수록 주기를 늘려 MAX 주기까지 증가
+    """
+    active_interval = timedelta(minutes=SYNC_1688_CONFIG.ACTIVE_INTERVAL_MINUTES)
+    max_interval = timedelta(minutes=SYNC_1688_CONFIG.MAX_INTERVAL_MINUTES)
+
+    unchanged_for = now - (last_changed_at or now)
+    interval = min(max(unchanged_for * STALE_INTERVAL_RATIO, active_interval), max_interval)
+
+    return now + interval
+
+
+def record_1688_sync_states(db, sync_results: list, order_accounts: dict):
+    """
+    조회 결과로 주문별 동기화 상태(마지막 상태, 변경 시각, 다음 조회 시각) 기록
+
+    Args:
+        db: DB 세션
+        sync_results: [(주문번호, 결과 구분, 물류 데이터), ...]
+        order_accounts: {구매 주문 번호: 1688 계정 번호}
+    """
+    now = datetime.now()
+    chunk_size = SYNC_1688_CONFIG.APPLY_BATCH_SIZE
+    retry_interval = timedelta(minutes=SYNC_1688_CONFIG.ACTIVE_INTERVAL_MINUTES)
+
+    for i in range(0, len(sync_results), chunk_size):
+        chunk = sync_results[i:i + chunk_size]
+
+        try:
+            states = {
+                state.purchase_order_number: state
+                for state in db.query(OrderPurchaseSync1688).filter(
+                    OrderPurchaseSync1688.purchase_order_number.in_([result[0] for result in chunk])
+                ).all()
+            }
+
+            for order_number, outcome, logistics_data in chunk:
+                state = states.get(order_number)
+                if state is None:
+                    state = OrderPurchaseSync1688(
+                        purchase_order_number=order_number,
+                        sync_fail_count=0,
+                        last_changed_at=now
+                    )
+                    db.add(state)
+                    states[order_number] = state
+
+                state.account_info_no_1688 = order_accounts.get(order_number)
+                state.last_synced_at = now
+
+                if outcome == 'failed':
+                    # 실패 건은 다음 실행 주기에 재조회
+                    state.sync_fail_count = (state.sync_fail_count or 0) + 1
+                    state.next_sync_at = now + retry_interval
+                    continue
+
+                state.sync_fail_count = 0
+
+                if outcome == 'success':
+                    tracking_number = logistics_data.get('logisticsId')
+                    delivery_status = logistics_data.get('status') or state.delivery_status
+
+                    if (tracking_number, delivery_status) != (state.tracking_number, state.delivery_status):
+                        state.last_changed_at = now
+
+                    state.tracking_number = tracking_number
+                    state.delivery_status = delivery_status
+
+                if state.delivery_status in SYNC_1688_CONFIG.TERMINAL_DELIVERY_STATUSES:
+                    state.terminal_yn = 1
+                    state.next_sync_at = None
+                else:
+                    state.terminal_yn = 0
+                    state.next_sync_at = compute_next_1688_sync_at(state.last_changed_at, now)
+
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"[{datetime.now()}] 동기화 상태 기록 중 오류 발생: {str(e)}")
+
+
+async def fetch_1688_logistics_infos(order_accounts: dict, run_recorder=None):
+    """
+    주문번호별 1688 물류 정보를 계정별 동시성 제한 하에 병렬 조회
+
+    Args:
+        order_accounts: {구매 주문 번호: 1688 계정 번호(None이면 랜덤)}
+        run_recorder: 실행 이력 기록기 (계정별 호출 수 / 응답 시간 집계)
+
+    Yields:
+        tuple: (주문번호, 물류 정보 응답) - 완료되는 순서대로 반환
+    """
+    semaphores = defaultdict(lambda: asyncio.Semaphore(SYNC_1688_CONFIG.CONCURRENCY_PER_ACCOUNT))
+
+    async def _fetch(order_number, account_no):
+        async with semaphores[account_no]:
+            started = time.perf_counter()
+            logistics_info = await get_1688_logistics_info(order_number, account_no)
+            if run_recorder:
+                run_recorder.record_call(account_no, time.perf_counter() - started)
+            return order_number, logistics_info
+
+    tasks = [
+        asyncio.create_task(_fetch(order_number, account_no))
+        for order_number, account_no in order_accounts.items()
+    ]
+
+    try:
+        for future in asyncio.as_completed(tasks):
+            yield await future
+    finally:
+        # 중간에 중단된 경우 남은 호출 취소
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+def parse_1688_logistics_result(order_number: str, logistics_info: dict):
+    """
+    1688 물류 정보 응답 해석
+
+    Returns:
+        tuple: (결과 구분, 물류 데이터)
+            - 'success': 운송장 번호 확인
+            - 'no_info': 물류 정보 없음
+            - 'not_shipped': 아직 발송되지 않음 (500_2)
+            - 'failed': API 호출 실패
+    """
+    if logistics_info and logistics_info.get('success'):
+        result = logistics_info.get('result', [])
+
+        if result and len(result) > 0:
+            logistics_data = result[0]
+
+            if logistics_data.get('logisticsId'):
+                print(f"[{datetime.now()}] 주문번호 {order_number}: 물류 정보 확인")
+                print(f"[{datetime.now()}] - 운송장번호: {logistics_data.get('logisticsId')}")
+                print(f"[{datetime.now()}] - 배송상태: {logistics_data.get('status')}")
+                print(f"[{datetime.now()}] - 물류사ID: {logistics_data.get('logisticsCompanyId')}")
+                return 'success', logistics_data
+
+        print(f"[{datetime.now()}] 주문번호 {order_number}: 물류 정보 없음")
+        return 'no_info', None
+
+    if logistics_info and logistics_info.get('errorCode') == '500_2':
+        print(f"[{datetime.now()}] 주문번호 {order_number}: 아직 발송되지 않음")
+        return 'not_shipped', None
+
+    error_msg = logistics_info.get('errorMessage', 'Unknown error') if logistics_info else 'API 응답 없음'
+    error_code = logistics_info.get('errorCode', '') if logistics_info else ''
+    print(f"[{datetime.now()}] 주문번호 {order_number} API 호출 실패: [{error_code}] {error_msg}")
+    return 'failed', None
+
+
+class LogisticsBulkApplier:
+    """
+    1688 물류 조회 결과 일괄 반영기
+    (주문번호, 운송장번호, 배송상태)를 모아 chunk 단위로 CASE UPDATE 1회 + 커밋
+    """
+
+    def __init__(self, db, chunk_size: int = None, include_estimate_products: bool = False):
+        self.db = db
+        self.chunk_size = chunk_size or SYNC_1688_CONFIG.APPLY_BATCH_SIZE
+        self.include_estimate_products = include_estimate_products  # 견적 상품 운송장 번호도 함께 반영
+        self.updated_rows = 0
+        self._pending = {}
+
+    def add(self, order_number: str, tracking_number: str, delivery_status: str):
+        """반영 대상 추가 (chunk_size 도달 시 자동 flush)"""
+        self._pending[order_number] = (tracking_number, delivery_status)
+        if len(self._pending) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> int:
+        """대기 중인 결과를 단일 UPDATE 문으로 반영 후 커밋"""
+        if not self._pending:
+            return 0
+
+        chunk, self._pending = self._pending, {}
+
+        tracking_case = case(
+            {order_number: values[0] for order_number, values in chunk.items()},
+            value=OrderShipmentDtl.purchase_order_number
+        )
+        dtl_values = {'purchase_tracking_number': tracking_case, 'updated_at': datetime.now()}
+
+        # 배송 상태가 없는 결과(운송장만 변경된 메시지 등)는 기존 delivery_status 유지
+        statuses = {order_number: values[1] for order_number, values in chunk.items() if values[1] is not None}
+        if statuses:
+            dtl_values['delivery_status'] = case(
+                statuses,
+                value=OrderShipmentDtl.purchase_order_number,
+                else_=OrderShipmentDtl.delivery_status
+            )
+
+        try:
+            updated_count = self.db.query(OrderShipmentDtl).filter(
+                and_(
+                    OrderShipmentDtl.purchase_order_number.in_(list(chunk.keys())),
+                    OrderShipmentDtl.del_yn == 0
+                )
+            ).update(dtl_values, synchronize_session=False)
+
+            if self.include_estimate_products:
+                self.db.query(purchase_models.OrderShipmentEstimateProduct).filter(
+                    and_(
+                        purchase_models.OrderShipmentEstimateProduct.purchase_order_number.in_(list(chunk.keys())),
+                        purchase_models.OrderShipmentEstimateProduct.del_yn == 0
+                    )
+                ).update({
+                    'purchase_tracking_number': case(
+                        {order_number: values[0] for order_number, values in chunk.items()},
+                        value=purchase_models.OrderShipmentEstimateProduct.purchase_order_number
+                    ),
+                    'updated_at': datetime.now()
+                }, synchronize_session=False)
+
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        self.updated_rows += updated_count
+        print(f"[{datetime.now()}] 물류 정보 {len(chunk)}건 DB 반영 완료 ({updated_count}행)")
+        return updated_count
+
+
+def get_1688_account_map(db, order_numbers: list) -> dict:
+    """
+    구매 주문번호별 1688 계정 번호 일괄 조회 (단일 GROUP BY 쿼리)
+
+    Args:
+        db: DB 세션
+        order_numbers: 1688 구매 주문 번호 리스트
+
+    Returns:
+        dict: {구매 주문 번호: account_info_no_1688} - 계정을 찾지 못한 주문은 포함되지 않음
+    """
+    if not order_numbers:
+        return {}
+
+    rows = db.query(
+        OrderShipmentDtl.purchase_order_number,
+        func.max(OrderShipmentEstimate.account_info_no_1688)
+    ).select_from(OrderShipmentEstimate).join(
+        OrderMst, OrderShipmentEstimate.order_mst_no == OrderMst.order_mst_no
+    ).join(
+        OrderShipmentMst, OrderMst.order_mst_no == OrderShipmentMst.order_mst_no
+    ).join(
+        OrderShipmentDtl, OrderShipmentMst.order_shipment_mst_no == OrderShipmentDtl.order_shipment_mst_no
+    ).filter(
+        and_(
+            OrderShipmentDtl.purchase_order_number.in_(order_numbers),
+            OrderShipmentDtl.del_yn == 0,
+            OrderShipmentEstimate.del_yn == 0
+        )
+    ).group_by(
+        OrderShipmentDtl.purchase_order_number
+    ).all()
+
+    return {order_number: account_no for order_number, account_no in rows if account_no is not None}
+
+
 async def get_1688_logistics_info(order_id: str, account_no: int = None) -> dict:
     """
     1688 물류 정보 조회 API 호출
@@ -134,15 +419,10 @@ async def get_1688_logistics_info(order_id: str, account_no: int = None) -> dict
         # 1. 계정 설정 가져오기 (account_no가 있으면 해당 계정, 없으면 랜덤)
         config = ALIBABA_1688_API_CONFIG._get_account_config(account_no)
 
-        # 2. API 엔드포인트 구성
-        api_endpoint = "com.alibaba.logistics/alibaba.trade.getLogisticsInfos.buyerView"
-        api_path = f"param2/1/{api_endpoint}/{config['app_key']}"
-        url = f"{config['base_url']}{api_path}"
-
-        # 3. 타임스탬프 생성
+        # 2. 타임스탬프 생성
         timestamp = ALIBABA_1688_API_CONFIG.get_timestamp()
 
-        # 4. 요청 파라미터 구성
+        # 3. 요청 파라미터 구성
         params = {
             "access_token": config['access_token'],
             "timestamp": timestamp,
@@ -152,25 +432,13 @@ async def get_1688_logistics_info(order_id: str, account_no: int = None) -> dict
             "webSite": "1688"
         }
 
-        # 5. 서명 생성
-        signature = ALIBABA_1688_API_CONFIG.generate_signature(api_path, params, config)
-        params['_aop_signature'] = signature
-
-        # 6. 헤더 생성
-        headers = ALIBABA_1688_API_CONFIG.get_headers()
-
-        # 7. API 호출 (비동기)
+        # 4. API 호출 (서명 + 공용 클라이언트)
         print(f"[{datetime.now()}] 주문번호 {order_id} API 호출 중...")
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url,
-                data=params,
-                headers=headers,
-                timeout=30.0
-            )
-            result = response.json()
+        result = await alibaba_1688_util.post_1688_api(
+            config, "com.alibaba.logistics/alibaba.trade.getLogisticsInfos.buyerView", params
+        )
 
-        # 8. 응답 로깅
+        # 5. 응답 로깅
         if result.get('success'):
             print(f"[{datetime.now()}] 주문번호 {order_id} API 호출 성공")
         else:
@@ -210,21 +478,7 @@ async def sync_1688_order_status_manual(order_id: str, db):
             return {'success': False, 'message': f'주문번호 {order_id}를 찾을 수 없습니다'}
 
         # account_info_no_1688 조회
-        account_no = db.query(OrderShipmentEstimate.account_info_no_1688).join(
-            OrderMst, OrderShipmentEstimate.order_mst_no == OrderMst.order_mst_no
-        ).join(
-            OrderShipmentMst, OrderMst.order_mst_no == OrderShipmentMst.order_mst_no
-        ).join(
-            OrderShipmentDtl, OrderShipmentMst.order_shipment_mst_no == OrderShipmentDtl.order_shipment_mst_no
-        ).filter(
-            and_(
-                OrderShipmentDtl.purchase_order_number == order_id,
-                OrderShipmentDtl.del_yn == 0,
-                OrderShipmentEstimate.del_yn == 0
-            )
-        ).first()
-
-        account_info_no = account_no[0] if account_no else None
+        account_info_no = get_1688_account_map(db, [order_id]).get(order_id)
 
         # 1688 API 호출
         logistics_info = await get_1688_logistics_info(order_id=order_id, account_no=account_info_no)
@@ -285,18 +539,10 @@ async def create_payment_link_by_order_numbers(order_numbers: list, account_no:
         # 1. 계정 설정 가져오기
         config = ALIBABA_1688_API_CONFIG._get_account_config(account_no)
 
-        print("TEST123")
-        print("CONFIG -> ", config)
-
-        # 2. API 엔드포인트 구성
-        api_endpoint = "com.alibaba.trade/alibaba.trade.grouppay.url.get"
-        api_path = f"param2/1/{api_endpoint}/{config['app_key']}"
-        url = f"{config['base_url']}{api_path}"
-
-        # 3. 타임스탬프 생성
+        # 2. 타임스탬프 생성
         timestamp = ALIBABA_1688_API_CONFIG.get_timestamp()
 
-        # 4. 요청 파라미터 구성
+        # 3. 요청 파라미터 구성
         params = {
             "access_token": config['access_token'],
             "orderIds": str(order_numbers),  # 리스트를 문자열로 변환
@@ -305,25 +551,11 @@ async def create_payment_link_by_order_numbers(order_numbers: list, account_no:
             "_aop_timestamp": timestamp
         }
 
-        # 5. 서명 생성
-        signature = ALIBABA_1688_API_CONFIG.generate_signature(api_path, params, config)
-        params['_aop_signature'] = signature
-
-        # 6. 헤더 생성
-        headers = ALIBABA_1688_API_CONFIG.get_headers()
-
-        # 7. API 호출 (비동기)
+        # 4. API 호출 (서명 + 공용 클라이언트)
         print(f"[{datetime.now()}] 결제 링크 생성 API 호출 중... (주문 {len(order_numbers)}건)")
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url,
-                data=params,
-                headers=headers,
-                timeout=30.0
-            )
-            result = response.json()
+        result = await alibaba_1688_util.post_1688_api(config, "com.alibaba.trade/alibaba.trade.grouppay.url.get", params)
 
-        # 8. 응답 처리
+        # 5. 응답 처리
         if result.get('success'):
             pay_url = result.get('payUrl')
             print(f"[{datetime.now()}] 결제 링크 생성 성공: {pay_url}")
@@ -455,11 +687,12 @@ async def sync_1688_payment_links():
     """
     1688 결제 링크 동기화 스케줄러
     purchase_order_number는 있지만 purchase_pay_link가 없는 주문들의 결제 링크를 생성
-    (매일 정기적으로 실행)
+    (계정별로 분할하여 계정 단위 동시 처리)
     """
     print(f"[{datetime.now()}] 1688 결제 링크 동기화 시작...")
 
     db = next(get_db())
+    run_recorder = SyncRunRecorder('sync_1688_payment_links')
     try:
         # 1. purchase_order_number는 있지만 purchase_pay_link가 없는 주문 조회
         missing_payment_links = db.query(
@@ -481,78 +714,94 @@ async def sync_1688_payment_links():
             return
 
         print(f"[{datetime.now()}] 결제 링크 생성 대상 주문 {len(order_numbers)}건 발견")
+        run_recorder.start(len(order_numbers))
 
-        success_count = 0
-        fail_count = 0
-
-        # 2. 주문번호를 그룹으로 묶어서 처리 (최대 20개씩)
-        batch_size = 20
-        for i in range(0, len(order_numbers), batch_size):
-            batch = order_numbers[i:i + batch_size]
-
-            try:
-                # 2-1. 해당 주문번호들의 account_info_no_1688 조회 (첫 번째 주문 기준)
-                account_no = db.query(purchase_models.OrderShipmentEstimate.account_info_no_1688).join(
-                    purchase_models.OrderMst,
-                    purchase_models.OrderShipmentEstimate.order_mst_no == purchase_models.OrderMst.order_mst_no
-                ).join(
-                    purchase_models.OrderShipmentMst,
-                    purchase_models.OrderMst.order_mst_no == purchase_models.OrderShipmentMst.order_mst_no
-                ).join(
-                    purchase_models.OrderShipmentDtl,
-                    purchase_models.OrderShipmentMst.order_shipment_mst_no == purchase_models.OrderShipmentDtl.order_shipment_mst_no
-                ).filter(
-                    and_(
-                        purchase_models.OrderShipmentDtl.purchase_order_number == batch[0],
-                        purchase_models.OrderShipmentDtl.del_yn == 0,
-                        purchase_models.OrderShipmentEstimate.del_yn == 0
-                    )
-                ).first()
-
-                account_info_no = account_no[0] if account_no else None
+        # 2. 주문번호별 account_info_no_1688 일괄 조회 후 계정별로 분할 (없으면 None → 호출 여유가 많은 계정)
+        account_map = get_1688_account_map(db, order_numbers)
+        orders_by_account = defaultdict(list)
+        for order_number in order_numbers:
+            orders_by_account[account_map.get(order_number)].append(order_number)
 
-                # 3. 결제 링크 생성 API 호출
-                payment_result = await create_payment_link_by_order_numbers(
-                    order_numbers=batch,
-                    account_no=account_info_no
-                )
+        # 3. 계정별 파티션을 동시에 처리 (계정 내에서는 grouppay 한도 단위 배치로 순차 처리)
+        partition_results = await asyncio.gather(*[
+            _sync_1688_payment_links_for_account(db, account_no, account_order_numbers, run_recorder)
+            for account_no, account_order_numbers in orders_by_account.items()
+        ])
 
-                if payment_result.get('success'):
-                    pay_url = payment_result.get('pay_url')
-
-                    # 4. OrderShipmentEstimateProduct 업데이트
-                    updated_count = db.query(purchase_models.OrderShipmentEstimateProduct).filter(
-                        and_(
-                            purchase_models.OrderShipmentEstimateProduct.purchase_order_number.in_(batch),
-                            purchase_models.OrderShipmentEstimateProduct.del_yn == 0
-                        )
-                    ).update({
-                        'purchase_pay_link': pay_url,
-                        'updated_at': datetime.now()
-                    }, synchronize_session=False)
-
-                    print(f"[{datetime.now()}] 배치 {i // batch_size + 1}: 결제 링크 업데이트 완료 ({updated_count}건)")
-                    print(f"[{datetime.now()}] - 주문번호: {', '.join(batch)}")
-                    print(f"[{datetime.now()}] - 결제 링크: {pay_url}")
-
-                    success_count += len(batch)
-                else:
-                    error_msg = payment_result.get('message', 'Unknown error')
-                    print(f"[{datetime.now()}] 배치 {i // batch_size + 1} 결제 링크 생성 실패: {error_msg}")
-                    fail_count += len(batch)
+        success_count = sum(result[0] for result in partition_results)
+        fail_count = sum(result[1] for result in partition_results)
 
-            except Exception as e:
-                print(f"[{datetime.now()}] 배치 {i // batch_size + 1} 처리 중 오류 발생: {str(e)}")
-                fail_count += len(batch)
-                continue
+        run_recorder.add_outcome('success', success_count)
+        run_recorder.add_outcome('failed', fail_count)
+        run_recorder.finish()
 
-        # 5. 변경사항 커밋
-        db.commit()
-        print(f"[{datetime.now()}] 1688 결제 링크 동기화 완료")
+        print(f"[{datetime.now()}] 1688 결제 링크 동기화 완료 (계정 {len(orders_by_account)}개)")
         print(f"[{datetime.now()}] 성공: {success_count}건, 실패: {fail_count}건")
 
     except Exception as e:
         print(f"[{datetime.now()}] 1688 결제 링크 동기화 실패: {str(e)}")
         db.rollback()
+        run_recorder.finish('FAILED', str(e))
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def _sync_1688_payment_links_for_account(db, account_no, order_numbers: list, run_recorder=None):
+    """
+    한 계정의 주문번호들을 grouppay 한도 단위 배치로 결제 링크 생성 후 반영 (배치별 커밋)
+
+    Returns:
+        tuple: (성공 건수, 실패 건수)
+    """
+    success_count = 0
+    fail_count = 0
+    batch_size = SYNC_1688_CONFIG.PAYMENT_LINK_BATCH_SIZE
+
+    for i in range(0, len(order_numbers), batch_size):
+        batch = order_numbers[i:i + batch_size]
+        batch_label = f"계정 {account_no} 배치 {i // batch_size + 1}"
+
+        try:
+            # 결제 링크 생성 API 호출
+            started = time.perf_counter()
+            payment_result = await create_payment_link_by_order_numbers(
+                order_numbers=batch,
+                account_no=account_no
+            )
+            if run_recorder:
+                run_recorder.record_call(account_no, time.perf_counter() - started)
+
+            if payment_result.get('success'):
+                pay_url = payment_result.get('pay_url')
+
+                # OrderShipmentEstimateProduct 업데이트
+                updated_count = db.query(purchase_models.OrderShipmentEstimateProduct).filter(
+                    and_(
+                        purchase_models.OrderShipmentEstimateProduct.purchase_order_number.in_(batch),
+                        purchase_models.OrderShipmentEstimateProduct.del_yn == 0
+                    )
+                ).update({
+                    'purchase_pay_link': pay_url,
+                    'updated_at': datetime.now()
+                }, synchronize_session=False)
+                db.commit()
+                if run_recorder:
+                    run_recorder.rows_updated += updated_count
+
+                print(f"[{datetime.now()}] {batch_label}: 결제 링크 업데이트 완료 ({updated_count}건)")
+                print(f"[{datetime.now()}] - 주문번호: {', '.join(batch)}")
+                print(f"[{datetime.now()}] - 결제 링크: {pay_url}")
+
+                success_count += len(batch)
+            else:
+                error_msg = payment_result.get('message', 'Unknown error')
+                print(f"[{datetime.now()}] {batch_label} 결제 링크 생성 실패: {error_msg}")
+                fail_count += len(batch)
+
+        except Exception as e:
+            db.rollback()
+            print(f"[{datetime.now()}] {batch_label} 처리 중 오류 발생: {str(e)}")
+            fail_count += len(batch)
+            continue
+
+    return success_count, fail_count
@@ -0,0 +1,237 @@
+# app/scheduler/scheduler_cj.py
+from app.core.database import get_db
+from app.core.config import CJ_LOGISTICS_CONFIG, SYNC_CJ_CONFIG
+from app.modules.purchase.models import OrderShipmentPackingMst, OrderShipmentPackingDtl, OrderShipmentPackingSyncCj
+from app.scheduler.run_history import SyncRunRecorder
+from app.utils.cj_logistics_util import request_cj_logistics_api
+from datetime import datetime, timedelta
+from sqlalchemy import and_, or_, case
+import asyncio
+import heapq
+import time
+
+
+async def sync_cj_tracking_status():
+    """CJ 배송 상태 증분 동기화 (조회 예정 박스만, 배치 단위 동시 조회 + 변경분만 일괄 반영)"""
+    print(f"[{datetime.now()}] CJ 배송 상태 동기화 시작...")
+
+    db = next(get_db())
+    run_recorder = SyncRunRecorder('sync_cj_tracking_status')
+    try:
+        # 1. 조회 예정 시각이 된 운송장만 우선순위 순으로 조회 (배달완료 등 종료 상태 제외)
+        tracking_numbers = get_due_cj_tracking_numbers(db)
+        run_recorder.start(len(tracking_numbers))
+
+        print(f"[{datetime.now()}] 동기화 대상 운송장 {len(tracking_numbers)}건 발견")
+
+        batch_size = SYNC_CJ_CONFIG.BATCH_SIZE
+        for i in range(0, len(tracking_numbers), batch_size):
+            # 2. 배치 단위 동시 조회
+            sync_results = await fetch_cj_tracking_infos(tracking_numbers[i:i + batch_size], run_recorder)
+            for _, outcome, _ in sync_results:
+                run_recorder.add_outcome(outcome)
+
+            # 3. 동기화 상태 기록 + 상태가 바뀐 박스만 shipping_status_cd 일괄 반영
+            try:
+                changed_statuses = record_cj_sync_states(db, sync_results)
+                run_recorder.rows_updated += apply_cj_shipping_statuses(db, changed_statuses)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                print(f"[{datetime.now()}] CJ 배송 상태 반영 중 오류 발생: {str(e)}")
+
+        run_recorder.finish()
+
+        print(f"[{datetime.now()}] CJ 배송 상태 동기화 완료")
+        print(
+            f"[{datetime.now()}] 성공: {run_recorder.outcomes['success']}건, "
+            f"조회 정보 없음: {run_recorder.outcomes['no_info']}건, "
+            f"실패: {run_recorder.outcomes['failed']}건, 반영: {run_recorder.rows_updated}행"
+        )
+
+    except Exception as e:
+        print(f"[{datetime.now()}] CJ 배송 상태 동기화 실패: {str(e)}")
+        db.rollback()
+        run_recorder.finish('FAILED', str(e))
+    finally:
+        db.close()
+
+
+def get_due_cj_tracking_numbers(db, now: datetime = None) -> list:
+    """
+    조회 예정 시각(next_sync_at)이 된 CJ 운송장 번호를 우선순위 큐 순서로 반환
+    - 동기화 상태가 없는 신규 운송장이 가장 먼저, 이후 예정 시각이 오래된 순
+    - 종료 상태(terminal_yn = 1) 운송장은 제외
+    """
+    now = now or datetime.now()
+
+    due_rows = db.query(
+        OrderShipmentPackingMst.tracking_number,
+        OrderShipmentPackingSyncCj.next_sync_at
+    ).outerjoin(
+        OrderShipmentPackingSyncCj,
+        OrderShipmentPackingSyncCj.tracking_number == OrderShipmentPackingMst.tracking_number
+    ).filter(
+        and_(
+            OrderShipmentPackingMst.tracking_number.isnot(None),
+            OrderShipmentPackingMst.tracking_number != '',
+            OrderShipmentPackingMst.del_yn == 0,
+            or_(
+                OrderShipmentPackingSyncCj.tracking_number.is_(None),
+                and_(
+                    OrderShipmentPackingSyncCj.terminal_yn == 0,
+                    or_(
+                        OrderShipmentPackingSyncCj.next_sync_at.is_(None),
+                        OrderShipmentPackingSyncCj.next_sync_at <= now
+                    )
+                )
+            )
+        )
+    ).distinct().all()
+
+    queue = [(next_sync_at or datetime.min, tracking_number) for tracking_number, next_sync_at in due_rows]
+    heapq.heapify(queue)
+
+    limit = SYNC_CJ_CONFIG.MAX_BOXES_PER_RUN or len(queue)
+    tracking_numbers = []
+    while queue and len(tracking_numbers) < limit:
+        _, tracking_number = heapq.heappop(queue)
+        tracking_numbers.append(tracking_number)
+
+    return tracking_numbers
+
+
+def compute_next_cj_sync_at(last_changed_at: datetime, now: datetime) -> datetime:
+    """다음 조회 시각 계산 (변화가 없을수록 ACTIVE 주기에서 MAX 주기까지 증가)"""
+    active_interval = timedelta(minutes=SYNC_CJ_CONFIG.ACTIVE_INTERVAL_MINUTES)
+    max_interval = timedelta(minutes=SYNC_CJ_CONFIG.MAX_INTERVAL_MINUTES)
+
+    unchanged_for = now - (last_changed_at or now)
+    interval = min(max(unchanged_for * SYNC_CJ_CONFIG.STALE_INTERVAL_RATIO, active_interval), max_interval)
+
+    return now + interval
+
+
+async def fetch_cj_tracking_infos(tracking_numbers: list, run_recorder=None) -> list:
+    """
+    운송장별 CJ 배송 추적 정보를 동시 조회 (SYNC_CJ_CONCURRENCY, 호출 한도는 CJ_RATE_LIMITER)
+
+    Returns:
+        list: [(운송장 번호, 결과 구분, CJ 화물 상태 코드), ...]
+    """
+    semaphore = asyncio.Semaphore(max(SYNC_CJ_CONFIG.CONCURRENCY, 1))
+
+    async def _fetch(tracking_number):
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                cj_response = await request_cj_logistics_api(
+                    CJ_LOGISTICS_CONFIG.TRACKING_PROCESS,
+                    {"CLNTNUM": CJ_LOGISTICS_CONFIG.CUST_ID, "INVC_NO": tracking_number}
+                )
+            except Exception as e:
+                print(f"[{datetime.now()}] 운송장 {tracking_number} 배송 추적 조회 실패: {str(e)}")
+                return tracking_number, 'failed', None
+            finally:
+                if run_recorder:
+                    run_recorder.record_call('CJ', time.perf_counter() - started)
+
+        outcome, status = parse_cj_tracking_result(cj_response)
+        return tracking_number, outcome, status
+
+    return await asyncio.gather(*(_fetch(tracking_number) for tracking_number in tracking_numbers))
+
+
+def parse_cj_tracking_result(cj_response: dict):
+    """
+    CJ 배송 추적 응답에서 최신 화물 상태 코드(CRG_ST) 추출
+
+    Returns:
+        tuple: ('success', 상태 코드) / ('no_info', None) - 집화 전 / ('failed', None)
+    """
+    if not cj_response or cj_response.get('RESULT_CD') != 'S':
+        return 'failed', None
+
+    data = cj_response.get('DATA')
+    if isinstance(data, dict):
+        # 단건 응답은 DATA 아래 스캔 목록, 목록이 없으면 DATA 자체를 최신 스캔으로 사용
+        scans = next((value for value in data.values() if isinstance(value, list)), [data])
+    else:
+        scans = data or []
+
+    scans = [scan for scan in scans if isinstance(scan, dict) and scan.get('CRG_ST')]
+    if not scans:
+        return 'no_info', None
+
+    latest = max(scans, key=lambda scan: (str(scan.get('SCAN_YMD', '')), str(scan.get('SCAN_HOUR', ''))))
+    return 'success', str(latest['CRG_ST'])
+
+
+def record_cj_sync_states(db, sync_results: list) -> dict:
+    """
+    조회 결과로 운송장별 동기화 상태 기록 (커밋은 호출 측)
+
+    Returns:
+        dict: 상태가 바뀐 운송장 {운송장 번호: CJ 화물 상태 코드}
+    """
+    now = datetime.now()
+    retry_interval = timedelta(minutes=SYNC_CJ_CONFIG.ACTIVE_INTERVAL_MINUTES)
+    changed_statuses = {}
+
+    states = {
+        state.tracking_number: state
+        for state in db.query(OrderShipmentPackingSyncCj).filter(
+            OrderShipmentPackingSyncCj.tracking_number.in_([result[0] for result in sync_results])
+        ).all()
+    }
+
+    for tracking_number, outcome, status in sync_results:
+        state = states.get(tracking_number)
+        if state is None:
+            state = OrderShipmentPackingSyncCj(
+                tracking_number=tracking_number,
+                sync_fail_count=0,
+                last_changed_at=now
+            )
+            db.add(state)
+            states[tracking_number] = state
+
+        state.last_synced_at = now
+
+        if outcome == 'failed':
+            # 실패 건은 ACTIVE 주기 후 재조회
+            state.sync_fail_count = (state.sync_fail_count or 0) + 1
+            state.next_sync_at = now + retry_interval
+            continue
+
+        state.sync_fail_count = 0
+
+        if outcome == 'success' and status != state.delivery_status:
+            state.delivery_status = status
+            state.last_changed_at = now
+            changed_statuses[tracking_number] = status
+
+        if state.delivery_status in SYNC_CJ_CONFIG.TERMINAL_STATUSES:
+            state.terminal_yn = 1
+            state.next_sync_at = None
+        else:
+            state.terminal_yn = 0
+            state.next_sync_at = compute_next_cj_sync_at(state.last_changed_at, now)
+
+    return changed_statuses
+
+
+def apply_cj_shipping_statuses(db, changed_statuses: dict) -> int:
+    """PackingDtl.shipping_status_cd 를 운송장 번호 기준 CASE UPDATE 1회로 반영 (커밋은 호출 측)"""
+    if not changed_statuses:
+        return 0
+
+    return db.query(OrderShipmentPackingDtl).filter(
+        and_(
+            OrderShipmentPackingDtl.tracking_number.in_(list(changed_statuses.keys())),
+            OrderShipmentPackingDtl.del_yn == 0
+        )
+    ).update({
+        'shipping_status_cd': case(changed_statuses, value=OrderShipmentPackingDtl.tracking_number),
+        'updated_at': datetime.now()
+    }, synchronize_session=False)
@@ -3,22 +3,151 @@ from app.modules.common import schemas as common_schemas
 from app.modules.purchase import models as purchase_models
 from collections import defaultdict
 from typing import Optional
-from googletrans import Translator
+from app.utils.translation_util import TRANSLATION_SERVICE
+from app.utils.record_replay_1688 import RECORDER_1688
 from typing import List
 from sqlalchemy import and_
 from datetime import datetime
+from app.core.http_client_1688 import HTTP_CLIENT_1688
+from app.core.rate_limiter_1688 import RATE_LIMITER_1688
+from app.core.config import RESILIENCE_1688_CONFIG
+from app.utils.resilience_util import (
+    CircuitBreakerRegistry, CircuitOpenError, ResilienceMetrics, TransientError, retry_async
+)
 import httpx
 import json
 import asyncio
 import re
 
 
+# 재시도 / 서킷 브레이커 (엔드포인트별 + 계정별)
+RESILIENCE_METRICS_1688 = ResilienceMetrics()
+CIRCUIT_BREAKERS_1688 = CircuitBreakerRegistry(
+    failure_threshold=RESILIENCE_1688_CONFIG.BREAKER_FAILURE_THRESHOLD,
+    reset_timeout=RESILIENCE_1688_CONFIG.BREAKER_RESET_SECONDS,
+    metrics=RESILIENCE_METRICS_1688
+)
+
+# 호출 한도 초과 등 재시도 가능한 1688 게이트웨이 에러 코드
+TRANSIENT_1688_ERROR_CODES = ("gw.QpsOverLimit",)
+
+# 재호출 시 중복 생성될 수 있는 엔드포인트 (요청이 전송되지 않은 연결 오류 / 429만 재시도)
+NON_IDEMPOTENT_1688_ENDPOINTS = ("com.alibaba.trade/alibaba.trade.fastCreateOrder",)
+
+
+def get_1688_gateway_error(result) -> tuple:
+    """
+    1688 응답의 게이트웨이 에러 (코드, 메시지) 추출
+
+    게이트웨이 에러는 error_code / error_message, 일부 API 응답은 errorCode / errorMessage 로 내려오므로 둘 다 확인
+    """
+    if not isinstance(result, dict):
+        return None, None
+    code = result.get('error_code') or result.get('errorCode')
+    message = result.get('error_message') or result.get('errorMessage') or ''
+    return code, message
+
+
+def is_1688_throttle_error(error_code) -> bool:
+    """호출 한도 초과 게이트웨이 에러 여부 (gw.QpsOverLimit 등 gw.*Limit 코드)"""
+    if not error_code:
+        return False
+    error_code = str(error_code)
+    return error_code in TRANSIENT_1688_ERROR_CODES or (error_code.startswith('gw.') and 'Limit' in error_code)
+
+
+async def post_1688_api(config, api_endpoint, params):
+    """서명 생성 후 공용 HTTP 클라이언트로 1688 API 호출 (재시도 + 서킷 브레이커)"""
+    api_path = f"param2/1/{api_endpoint}/{config['app_key']}"
+    url = f"{config['base_url']}{api_path}"
+
+    params['_aop_signature'] = ALIBABA_1688_API_CONFIG.generate_signature(api_path, params, config)
+    headers = ALIBABA_1688_API_CONFIG.get_headers()
+
+    breakers = [
+        CIRCUIT_BREAKERS_1688.get(f"endpoint:{api_endpoint}"),
+        CIRCUIT_BREAKERS_1688.get(f"account:{config['account_no']}"),
+    ]
+    idempotent = api_endpoint not in NON_IDEMPOTENT_1688_ENDPOINTS
+
+    async def _send():
+        # 계정별 호출 한도 대기 (토큰 버킷) - 대기 중 취소되어도 시험 호출 슬롯을 잡지 않도록 서킷 확인보다 먼저
+        await RATE_LIMITER_1688.acquire(config['account_no'])
+
+        for i, breaker in enumerate(breakers):
+            try:
+                breaker.check()
+            except CircuitOpenError:
+                for allowed in breakers[:i]:
+                    allowed.release()
+                raise
+
+        outcome = None  # 'success' / 'failure' (그 외 오류 / 취소는 시험 호출 슬롯만 반환)
+        try:
+            client = HTTP_CLIENT_1688.get_client()
+            response = await client.post(url, data=params, headers=headers)
+
+            if RECORDER_1688.enabled():
+                RECORDER_1688.record(api_endpoint, params, response.status_code, response.text)
+
+            if response.status_code == 429 or response.status_code >= 500:
+                raise TransientError(f"1688 HTTP {response.status_code}", throttled=response.status_code == 429)
+
+            # 호출 한도 초과는 HTTP 200 / 4xx 본문으로도 내려옴
+            result = response.json()
+            error_code, error_message = get_1688_gateway_error(result)
+            if is_1688_throttle_error(error_code):
+                raise TransientError(f"1688 {error_code}: {error_message}", throttled=True)
+
+            outcome = 'success'
+            return result
+
+        except (TransientError, httpx.TransportError):
+            outcome = 'failure'
+            raise
+        finally:
+            # CancelledError(BaseException) 포함 모든 종료 경로에서 슬롯 정리
+            for breaker in breakers:
+                if outcome == 'success':
+                    breaker.record_success()
+                elif outcome == 'failure':
+                    breaker.record_failure()
+                else:
+                    breaker.release()
+
+    def _is_retryable(e):
+        if idempotent:
+            return isinstance(e, (TransientError, httpx.TransportError))
+        # 요청이 전송되지 않은 경우만 재시도
+        return isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)) or (
+            isinstance(e, TransientError) and e.throttled
+        )
+
+    def _on_retry(attempt, e):
+        RESILIENCE_METRICS_1688.retries[api_endpoint] += 1
+        print(f"[{datetime.now()}] 1688 API 재시도 {attempt + 1}회: {api_endpoint} ({str(e) or type(e).__name__})")
+
+    return await retry_async(
+        _send,
+        retries=RESILIENCE_1688_CONFIG.MAX_RETRIES,
+        base_delay=RESILIENCE_1688_CONFIG.BACKOFF_BASE_SECONDS,
+        max_delay=RESILIENCE_1688_CONFIG.BACKOFF_MAX_SECONDS,
+        is_retryable=_is_retryable,
+        on_retry=_on_retry
+    )
+
+
+def get_1688_resilience_status() -> dict:
+    """1688 재시도 / 서킷 차단 집계 및 현재 서킷 상태"""
+    return {
+        **RESILIENCE_METRICS_1688.snapshot(),
+        "breakers": CIRCUIT_BREAKERS_1688.states()
+    }
+
+
 async def call_1688_api(api_endpoint, params=None):
     config_1688 = ALIBABA_1688_API_CONFIG._get_random_account_config()
 
-    api_path = f"param2/1/{api_endpoint}/{config_1688['app_key']}"
-    url = f"{config_1688['base_url']}{api_path}"
-
     timestamp = ALIBABA_1688_API_CONFIG.get_timestamp()
 
     base_params = {
@@ -30,18 +159,8 @@ async def call_1688_api(api_endpoint, params=None):
     if params:
         base_params.update(params)
 
-    base_params['_aop_signature'] = ALIBABA_1688_API_CONFIG.generate_signature(api_path, base_params, config_1688)
-    headers = ALIBABA_1688_API_CONFIG.get_headers()
-
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url,
-                data=base_params,
-                headers=headers,
-                timeout=30.0
-            )
-            return response.json()
+        return await post_1688_api(config_1688, api_endpoint, base_params)
 
     except Exception as e:
         return {"error": str(e)}
@@ -203,15 +322,8 @@ def extract_offer_id_from_link(link: str) -> Optional[str]:
     return None
 
 async def translate_chinese_to_korean(text: str) -> str:
-    """중국어를 한국어로 번역"""
-    try:
-        translator = Translator()
-        result = await translator.translate(text, src='zh-cn', dest='ko')
-        return result.text
-    except Exception as e:
-        print(f"번역 실패: {str(e)}")
-
-        return text  # 번역 실패 시 원본 텍스트 반환
+    """중국어를 한국어로 번역 (번역 캐시 적용, 실패 시 원본 텍스트 반환)"""
+    return await TRANSLATION_SERVICE.translate(text, src='zh-cn', dest='ko')
 
 
 async def sync_payment_link_to_shipment_dtl(db, order_numbers: list, account_no: int = None) -> dict:
@@ -326,18 +438,11 @@ async def create_payment_link_by_order_numbers(order_numbers: list, account_no:
     try:
         # 1. 계정 설정 가져오기
         config = ALIBABA_1688_API_CONFIG._get_account_config(account_no)
-        print("TEST CONFIG")
-        print(config)
-
-        # 2. API 엔드포인트 구성
-        api_endpoint = "com.alibaba.trade/alibaba.trade.grouppay.url.get"
-        api_path = f"param2/1/{api_endpoint}/{config['app_key']}"
-        url = f"{config['base_url']}{api_path}"
 
-        # 3. 타임스탬프 생성
+        # 2. 타임스탬프 생성
         timestamp = ALIBABA_1688_API_CONFIG.get_timestamp()
 
-        # 4. 요청 파라미터 구성
+        # 3. 요청 파라미터 구성
         params = {
             "access_token": config['access_token'],
             "orderIds": str(order_numbers),  # 리스트를 문자열로 변환
@@ -346,25 +451,11 @@ async def create_payment_link_by_order_numbers(order_numbers: list, account_no:
             "_aop_timestamp": timestamp
         }
 
-        # 5. 서명 생성
-        signature = ALIBABA_1688_API_CONFIG.generate_signature(api_path, params, config)
-        params['_aop_signature'] = signature
-
-        # 6. 헤더 생성
-        headers = ALIBABA_1688_API_CONFIG.get_headers()
-
-        # 7. API 호출 (비동기)
+        # 4. API 호출 (서명 + 공용 클라이언트)
         print(f"[{datetime.now()}] 결제 링크 생성 API 호출 중... (주문 {len(order_numbers)}건)")
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url,
-                data=params,
-                headers=headers,
-                timeout=30.0
-            )
-            result = response.json()
+        result = await post_1688_api(config, "com.alibaba.trade/alibaba.trade.grouppay.url.get", params)
 
-        # 8. 응답 처리
+        # 5. 응답 처리
         if result.get('success'):
             pay_url = result.get('payUrl')
             print(f"[{datetime.now()}] 결제 링크 생성 성공: {pay_url}")
@@ -1,108 +1,237 @@
-import requests
-from sqlalchemy.orm import Session
-import time
-import os
-from typing import Dict
+import asyncio
+import httpx
+from typing import Dict, Optional
+from app.core.config import CJ_LOGISTICS_CONFIG
+from app.core.database import SessionLocal
+from app.core.http_client_cj import HTTP_CLIENT_CJ
+from app.core.rate_limiter_1688 import TokenBucket
 from app.modules.common import models as common_models
 from datetime import datetime
 
-def request_cj_logistics_api(db: Session, process: str, params: Dict = None):
+# CJ API 호출 한도 (고정 대기 대신 토큰 버킷으로 호출 간격 조절)
+CJ_RATE_LIMITER = TokenBucket(CJ_LOGISTICS_CONFIG.PER_SECOND, CJ_LOGISTICS_CONFIG.BURST) \
+    if CJ_LOGISTICS_CONFIG.PER_SECOND > 0 else None
 
-    # 고정 값으로 우선 처리
-    process = 'ReqInvcNo'
-    params = {
-        "CLNTNUM": os.getenv('CJ_LOGISTICS_CUST_ID')
-    }
+JSON_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json"
+}
 
-    time.sleep(1)
-    token = get_cj_logistics_token(db)
+CJ_TOKEN_TYPE = 'cj_logistics'
 
-    if not token:  # 토큰이 없으면 에러 처리
-        raise ValueError("CJ Logistics token을 가져올 수 없습니다")
 
-    if params is None:  # mutable default argument 방지
-        params = {}
+def _parse_token_expire_date(token_expire_date: Optional[str]) -> Optional[datetime]:
+    try:
+        return datetime.strptime(token_expire_date, '%Y%m%d%H%M%S') if token_expire_date else None
+    except ValueError:
+        return None
+
+
+class CJ_TOKEN_MANAGER:
+    """
+    CJ 1일 토큰 관리 (프로세스 메모리 보관)
+
+    만료 TOKEN_EXPIRY_MARGIN_SECONDS 전까지는 메모리 토큰을 DB 조회 없이 반환한다.
+    갱신은 동시에 1건만 실행되고 (나머지 호출은 같은 갱신 결과를 대기), 다른 프로세스가 먼저 갱신했으면
+    COM_TOKEN 값을 그대로 사용한다. COM_TOKEN은 토큰이 바뀐 경우에만 저장한다.
+    """
+    _token = None
+    _expires_at = None
+    _refresh_task = None
+    _refresher_task = None
+    _session_factory = SessionLocal
+    stats = {"memory_hits": 0, "db_loads": 0, "issued": 0, "issue_failures": 0}
+
+    @classmethod
+    def _remaining_seconds(cls) -> float:
+        if not cls._token or cls._expires_at is None:
+            return 0
+        return (cls._expires_at - datetime.now()).total_seconds()
+
+    @classmethod
+    async def get_token(cls) -> Optional[str]:
+        """유효한 토큰 반환 (만료 임박 / 미보유 시에만 갱신)"""
+        if cls._remaining_seconds() > CJ_LOGISTICS_CONFIG.TOKEN_EXPIRY_MARGIN_SECONDS:
+            cls.stats["memory_hits"] += 1
+            return cls._token
+        return await cls.refresh(CJ_LOGISTICS_CONFIG.TOKEN_EXPIRY_MARGIN_SECONDS)
+
+    @classmethod
+    async def refresh(cls, margin_seconds: int) -> Optional[str]:
+        """토큰 갱신 (진행 중인 갱신이 있으면 그 결과를 대기)"""
+        task = cls._refresh_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(cls._refresh(margin_seconds))
+            cls._refresh_task = task
+        # 대기 중인 호출이 취소되어도 갱신 자체는 계속 진행
+        return await asyncio.shield(task)
+
+    @classmethod
+    async def _refresh(cls, margin_seconds: int) -> Optional[str]:
+        # 1. 다른 프로세스가 이미 갱신했는지 COM_TOKEN 확인
+        stored_token, stored_expire_date = cls._load_stored_token()
+        stored_expires_at = _parse_token_expire_date(stored_expire_date)
+        if stored_token and stored_expires_at and (stored_expires_at - datetime.now()).total_seconds() > margin_seconds:
+            cls._token, cls._expires_at = stored_token, stored_expires_at
+            return cls._token
+
+        # 2. CJ 토큰 발급
+        issued = await cls._issue_token()
+        if issued:
+            token, token_expire_date = issued
+            cls._token, cls._expires_at = token, _parse_token_expire_date(token_expire_date)
+            if token != stored_token or token_expire_date != stored_expire_date:
+                cls._save_token(token, token_expire_date)
+            return token
 
-    params['TOKEN_NUM'] = token
-    params = {"DATA": params}
+        # 발급 실패 시 기존 토큰이라도 반환 (만료 시각은 유지하여 다음 호출에서 재시도)
+        return cls._token or stored_token
 
-    cj_logistics_base_url = os.getenv('CJ_LOGISTICS_BASE_URL')
-    cj_logistics_url = cj_logistics_base_url + process
+    @classmethod
+    def _load_stored_token(cls):
+        cls.stats["db_loads"] += 1
+        db = cls._session_factory()
+        try:
+            token_info = db.query(common_models.ComToken).filter(
+                common_models.ComToken.token_type == CJ_TOKEN_TYPE
+            ).first()
+            if not token_info:
+                return None, None
+            return token_info.token, token_info.token_expire_date
+        except Exception as e:
+            print(f"CJ 토큰 조회 실패: {str(e)}")
+            return None, None
+        finally:
+            db.close()
+
+    @classmethod
+    def _save_token(cls, token: str, token_expire_date: str):
+        db = cls._session_factory()
+        try:
+            updated = db.query(common_models.ComToken).filter(
+                common_models.ComToken.token_type == CJ_TOKEN_TYPE
+            ).update({
+                'token': token,
+                'token_expire_date': token_expire_date
+            })
+            if not updated:
+                db.add(common_models.ComToken(
+                    token_type=CJ_TOKEN_TYPE,
+                    token=token,
+                    token_expire_date=token_expire_date
+                ))
+            db.commit()
+        except Exception as e:
+            # 저장 실패해도 메모리 토큰으로 계속 동작
+            db.rollback()
+            print(f"CJ 토큰 저장 실패: {str(e)}")
+        finally:
+            db.close()
+
+    @classmethod
+    async def _issue_token(cls):
+        """ReqOneDayToken 호출 → (TOKEN_NUM, TOKEN_EXPRTN_DTM) 또는 None"""
+        params = {
+            "DATA": {
+                "CUST_ID": CJ_LOGISTICS_CONFIG.CUST_ID,
+                "BIZ_REG_NUM": CJ_LOGISTICS_CONFIG.BIZ_REG_NUM
+            }
+        }
 
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "CJ-Gateway-APIKey": token
-    }
+        try:
+            response = await HTTP_CLIENT_CJ.get_client().post(
+                CJ_LOGISTICS_CONFIG.BASE_URL + 'ReqOneDayToken', json=params, headers=JSON_HEADERS
+            )
+            response.raise_for_status()
+
+            result = response.json()
+            if result.get('RESULT_CD') == 'S' and result.get('DATA', {}).get('TOKEN_NUM'):
+                cls.stats["issued"] += 1
+                return result['DATA']['TOKEN_NUM'], result['DATA'].get('TOKEN_EXPRTN_DTM', '')
+            print(f"CJ 토큰 발급 실패: {result.get('RESULT_DETAIL')}")
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"CJ 토큰 발급 실패: {str(e)}")
+
+        cls.stats["issue_failures"] += 1
+        return None
+
+    @classmethod
+    async def _refresh_proactively(cls):
+        while True:
+            try:
+                remaining = cls._remaining_seconds()
+                if remaining <= CJ_LOGISTICS_CONFIG.TOKEN_PROACTIVE_REFRESH_SECONDS:
+                    await cls.refresh(CJ_LOGISTICS_CONFIG.TOKEN_PROACTIVE_REFRESH_SECONDS)
+                    remaining = cls._remaining_seconds()
+            except Exception as e:
+                print(f"CJ 토큰 백그라운드 갱신 실패: {str(e)}")
+                remaining = 0
+
+            # 다음 선제 갱신 시점까지 대기 (갱신 실패 시 짧은 주기로 재시도)
+            await asyncio.sleep(max(
+                remaining - CJ_LOGISTICS_CONFIG.TOKEN_PROACTIVE_REFRESH_SECONDS,
+                CJ_LOGISTICS_CONFIG.TOKEN_RETRY_INTERVAL_SECONDS
+            ))
+
+    @classmethod
+    def start_refresher(cls, session_factory=None):
+        """만료 전 백그라운드 토큰 갱신 시작 (요청 경로에서 갱신 대기 방지)"""
+        if session_factory is not None:
+            cls._session_factory = session_factory
+        if cls._refresher_task is None or cls._refresher_task.done():
+            cls._refresher_task = asyncio.create_task(cls._refresh_proactively())
+
+    @classmethod
+    async def stop_refresher(cls):
+        if cls._refresher_task is not None:
+            cls._refresher_task.cancel()
+            await asyncio.gather(cls._refresher_task, return_exceptions=True)
+            cls._refresher_task = None
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        return {
+            "token_loaded": bool(cls._token),
+            "expires_at": cls._expires_at.isoformat() if cls._expires_at else None,
+            **cls.stats
+        }
 
-    try:
-        response = requests.post(cj_logistics_url, json=params, headers=headers, timeout=30)
-        response.raise_for_status()  # HTTP 에러 체크
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        # 로깅 추가 권장
-        raise Exception(f"CJ Logistics API 요청 실패: {str(e)}")
 
+async def request_cj_logistics_api(process: str, params: Dict = None, token: str = None):
+    """
+    CJ 물류 API 호출 (공용 커넥션 풀 + 호출 한도 대기)
 
-def get_cj_logistics_token(db: Session):
-    token_info = db.query(common_models.ComToken).filter(common_models.ComToken.token_type == 'cj_logistics').first()
+    Args:
+        process: CJ API 이름 (예: ReqInvcNo)
+        params: DATA 항목 (TOKEN_NUM은 자동 추가)
+        token: 일괄 호출 시 미리 받아둔 토큰 (없으면 CJ_TOKEN_MANAGER 사용)
+    """
+    if token is None:
+        token = await CJ_TOKEN_MANAGER.get_token()
 
-    if token_info and token_info.token_expire_date:
-        expire_date_str = token_info.token_expire_date
-        try:
-            expire_date = datetime.strptime(expire_date_str, '%Y%m%d%H%M%S')
-            now = datetime.now()
-            time_remaining = expire_date - now
-            if time_remaining.total_seconds() > 300:
-                return token_info.token_value if hasattr(token_info, 'token_value') else token_info.token
-        except ValueError:
-            pass
-
-    # 토큰 갱신
-    process = 'ReqOneDayToken'
-    cj_logistics_url = os.getenv('CJ_LOGISTICS_BASE_URL') + process
-    params = {
-        "DATA": {
-            "CUST_ID": os.getenv('CJ_LOGISTICS_CUST_ID', ''),
-            "BIZ_REG_NUM": os.getenv('CJ_LOGISTICS_BIZ_REG_NUM', '')
-        }
-    }
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
+    if not token:  # 토큰이 없으면 에러 처리
+        raise ValueError("CJ Logistics token을 가져올 수 없습니다")
 
-    try:
-        response = requests.post(cj_logistics_url, json=params, headers=headers, timeout=30)
-        response.raise_for_status()
-
-        result = response.json()
-        if result.get('RESULT_CD') == 'S' and 'DATA' in result:
-            token = result['DATA'].get('TOKEN_NUM', '')
-            token_expire_date = result['DATA'].get('TOKEN_EXPRTN_DTM', '')
-
-            if token_info:
-                # token과 token_value 필드명 통일 필요
-                db.query(common_models.ComToken).filter(common_models.ComToken.token_type == 'cj_logistics').update({
-                    'token': token,  # token_value로 통일
-                    'token_expire_date': token_expire_date
-                })
-            else:
-                new_com_token = common_models.ComToken(
-                    token_type='cj_logistics',
-                    token=token,
-                    token_expire_date=token_expire_date
-                )
-                db.add(new_com_token)
-            db.commit()
+    data = dict(params or {})
+    data['TOKEN_NUM'] = token
 
-            return token
-    except requests.exceptions.RequestException as e:
-        # 로깅 추가 권장
-        pass
+    headers = {**JSON_HEADERS, "CJ-Gateway-APIKey": token}
+
+    if CJ_RATE_LIMITER:
+        await CJ_RATE_LIMITER.acquire()
+
+    try:
+        response = await HTTP_CLIENT_CJ.get_client().post(
+            CJ_LOGISTICS_CONFIG.BASE_URL + process, json={"DATA": data}, headers=headers
+        )
+        response.raise_for_status()  # HTTP 에러 체크
+        return response.json()
+    except httpx.HTTPError as e:
+        raise Exception(f"CJ Logistics API 요청 실패: {str(e)}")
 
-    # 기존 토큰이라도 반환
-    if token_info:
-        return token_info.token_value if hasattr(token_info, 'token_value') else token_info.token
 
-    return None
\ No newline at end of file
+async def issue_cj_invoice_number(token: str = None):
+    """운송장 번호 1건 채번 (ReqInvcNo)"""
+    return await request_cj_logistics_api(
+        'ReqInvcNo', {"CLNTNUM": CJ_LOGISTICS_CONFIG.CUST_ID}, token=token
+    )
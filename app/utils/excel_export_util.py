@@ -0,0 +1,133 @@
+# app/utils/excel_export_util.py
+# 엑셀 다운로드 공용 엔진: write-only 워크북(행은 디스크로 기록, 메모리 일정) + 이름 있는 스타일
+from fastapi.responses import StreamingResponse
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import Cell
+from openpyxl.styles import Font, Alignment, PatternFill, Border, Side, NamedStyle
+from openpyxl.utils import get_column_letter
+from typing import Callable, Iterable, List
+from urllib.parse import quote
+from copy import copy
+
+EXCEL_MEDIA_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+# ExcelColumn.style 값
+STYLE_TEXT = 'export_text'
+STYLE_CENTER = 'export_center'
+STYLE_AMOUNT = 'export_amount'
+STYLE_HEADER = 'export_header'
+STYLE_HIGHLIGHT = 'export_highlight'
+
+
+class ExcelColumn:
+    """엑셀 열 정의 (헤더, 값 추출 함수, 너비, 스타일, 강조 조건)"""
+    __slots__ = ("header", "value", "width", "style", "highlight")
+
+    def __init__(
+            self,
+            header: str,
+            value: Callable,
+            width: float = None,
+            style: str = STYLE_TEXT,
+            highlight: Callable = None
+    ):
+        self.header = header
+        self.value = value
+        self.width = width
+        self.style = style
+        self.highlight = highlight  # row -> bool, True면 노란 배경 (STYLE_HIGHLIGHT)
+
+
+def _build_named_styles() -> List[NamedStyle]:
+    """셀마다 Font / Border 객체를 만들지 않도록 워크북에 한 번만 등록하는 스타일"""
+    thin_border = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+
+    return [
+        NamedStyle(
+            name=STYLE_HEADER,
+            font=Font(bold=True, size=11, color="FFFFFF"),
+            fill=PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid"),
+            alignment=Alignment(horizontal="center", vertical="center"),
+            border=thin_border
+        ),
+        NamedStyle(name=STYLE_TEXT, alignment=Alignment(horizontal="left", vertical="center"), border=thin_border),
+        NamedStyle(name=STYLE_CENTER, alignment=Alignment(horizontal="center", vertical="center"), border=thin_border),
+        NamedStyle(
+            name=STYLE_AMOUNT,
+            alignment=Alignment(horizontal="right", vertical="center"),
+            border=thin_border,
+            number_format='#,##0'
+        ),
+        NamedStyle(
+            name=STYLE_HIGHLIGHT,
+            fill=PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid"),
+            alignment=Alignment(horizontal="left", vertical="center"),
+            border=thin_border
+        ),
+    ]
+
+
+def write_excel_file(path: str, sheet_title: str, columns: List[ExcelColumn], rows: Iterable) -> int:
+    """
+    rows 를 순회하며 엑셀 파일 작성 (rows 는 query.yield_per() 등 지연 조회 결과)
+
+    Returns:
+        int: 작성한 데이터 행 수 (헤더 제외)
+    """
+    workbook = Workbook(write_only=True)
+    for named_style in _build_named_styles():
+        workbook.add_named_style(named_style)
+
+    worksheet = workbook.create_sheet(sheet_title)
+
+    # write-only 시트는 행 작성 전에 열 너비 지정
+    for col_idx, column in enumerate(columns, start=1):
+        if column.width:
+            worksheet.column_dimensions[get_column_letter(col_idx)].width = column.width
+
+    # 스타일 이름 조회는 스타일별 1회만 하고, 셀에는 해석된 스타일 배열을 복사해서 사용
+    style_arrays = {}
+    for style in {STYLE_HEADER, STYLE_HIGHLIGHT, *(column.style for column in columns)}:
+        template = WriteOnlyCell(worksheet)
+        template.style = style
+        style_arrays[style] = template._style
+
+    def styled_cell(value, style: str):
+        return Cell(worksheet, row=1, column=1, value=value, style_array=copy(style_arrays[style]))
+
+    worksheet.append([styled_cell(column.header, STYLE_HEADER) for column in columns])
+
+    row_count = 0
+    for row in rows:
+        worksheet.append([
+            styled_cell(
+                column.value(row),
+                STYLE_HIGHLIGHT if column.highlight and column.highlight(row) else column.style
+            )
+            for column in columns
+        ])
+        row_count += 1
+
+    workbook.save(path)
+    workbook.close()
+    return row_count
+
+
+def attachment_headers(filename: str) -> dict:
+    """한글 파일명 다운로드 헤더"""
+    return {"Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"}
+
+
+def stream_excel_chunks(chunks: Iterable[bytes], filename: str, file_size: int) -> StreamingResponse:
+    """저장된 엑셀 파일을 청크 단위로 스트리밍 응답"""
+    return StreamingResponse(
+        chunks,
+        media_type=EXCEL_MEDIA_TYPE,
+        headers={**attachment_headers(filename), "Content-Length": str(file_size)}
+    )
@@ -0,0 +1,163 @@
+# app/utils/export_artifact_util.py
+# 엑셀 다운로드 파일 캐시 (DB 저장 - 생성한 워커와 다운로드 API 프로세스가 달라도 공유, 원본 데이터가 같으면 같은 파일 재사용)
+from app.core.config import EXCEL_EXPORT_CONFIG
+from app.core.database import SessionLocal
+from app.modules.common.models import ComExportArtifact, ComExportArtifactChunk
+from datetime import datetime, timedelta
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from typing import Optional
+import hashlib
+import json
+import os
+import tempfile
+
+
+class EXPORT_ARTIFACT_STORE:
+    """캐시 키별 파일 저장소 (COM_EXPORT_ARTIFACT + ARTIFACT_CHUNK_SIZE 단위 COM_EXPORT_ARTIFACT_CHUNK, TTL 경과 시 만료)"""
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """조회 조건 / 원본 버전으로 캐시 키 생성"""
+        return hashlib.sha256(json.dumps(parts, default=str, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def new_temp_path(suffix: str = ".xlsx") -> str:
+        """작성용 로컬 임시 파일 경로 (save 후 호출 측에서 삭제)"""
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        os.close(fd)
+        return path
+
+    @staticmethod
+    def _to_meta(artifact: ComExportArtifact) -> dict:
+        return {
+            **(json.loads(artifact.meta) if artifact.meta else {}),
+            "cache_key": artifact.cache_key,
+            "file_name": artifact.file_name,
+            "file_size": artifact.file_size,
+            "chunk_count": artifact.chunk_count,
+            "created_at": artifact.created_at.isoformat() if artifact.created_at else None,
+        }
+
+    @classmethod
+    def get(cls, db, key: str) -> Optional[dict]:
+        """메타 정보 또는 None (없거나 TTL 경과)"""
+        artifact = db.query(ComExportArtifact).filter(
+            ComExportArtifact.cache_key == key,
+            ComExportArtifact.expires_at > datetime.now()
+        ).first()
+        return cls._to_meta(artifact) if artifact else None
+
+    @classmethod
+    def save(cls, db, key: str, temp_path: str, file_name: str, meta: dict = None) -> dict:
+        """
+        임시 파일을 청크 단위로 DB에 저장 후 메타 정보 반환
+
+        청크는 ORM 객체 없이 INSERT 하므로 파일 크기와 무관하게 메모리 일정.
+        같은 키를 다른 워커가 먼저 저장했으면 (PK 충돌) 그 결과를 반환한다.
+        """
+        now = datetime.now()
+        try:
+            # 같은 키의 만료된 이전 파일 정리
+            cls._delete(db, [key], expired_only=True)
+
+            artifact = ComExportArtifact(
+                cache_key=key,
+                file_name=file_name,
+                file_size=os.path.getsize(temp_path),
+                chunk_count=0,
+                meta=json.dumps(meta or {}, ensure_ascii=False, default=str),
+                created_at=now,
+                expires_at=now + timedelta(seconds=EXCEL_EXPORT_CONFIG.ARTIFACT_TTL_SECONDS)
+            )
+            db.add(artifact)
+            db.flush()
+
+            chunk_count = 0
+            with open(temp_path, "rb") as f:
+                while True:
+                    data = f.read(EXCEL_EXPORT_CONFIG.ARTIFACT_CHUNK_SIZE)
+                    if not data:
+                        break
+                    db.execute(insert(ComExportArtifactChunk).values(cache_key=key, seq=chunk_count, data=data))
+                    chunk_count += 1
+
+            artifact.chunk_count = chunk_count
+            db.commit()
+
+        except IntegrityError:
+            db.rollback()
+            existing = cls.get(db, key)
+            if existing:
+                return existing
+            raise
+        except Exception:
+            db.rollback()
+            raise
+
+        return cls._to_meta(artifact)
+
+    @staticmethod
+    def iter_chunks(key: str, chunk_count: int):
+        """저장된 파일을 청크 순서대로 반환 (응답 스트리밍용, 요청 세션 종료 후에도 읽도록 별도 세션 사용)"""
+        db = SessionLocal()
+        try:
+            for seq in range(chunk_count):
+                data = db.query(ComExportArtifactChunk.data).filter(
+                    ComExportArtifactChunk.cache_key == key,
+                    ComExportArtifactChunk.seq == seq
+                ).scalar()
+                if data is None:
+                    break  # 전송 중 만료 정리됨
+                yield data
+        finally:
+            db.close()
+
+    @staticmethod
+    def _delete(db, keys: list, expired_only: bool = False) -> int:
+        """파일 / 청크 삭제 (커밋은 호출 측)"""
+        if expired_only:
+            keys = [
+                key for (key,) in db.query(ComExportArtifact.cache_key).filter(
+                    ComExportArtifact.cache_key.in_(keys),
+                    ComExportArtifact.expires_at <= datetime.now()
+                ).all()
+            ]
+        if not keys:
+            return 0
+
+        db.query(ComExportArtifactChunk).filter(
+            ComExportArtifactChunk.cache_key.in_(keys)
+        ).delete(synchronize_session=False)
+        return db.query(ComExportArtifact).filter(
+            ComExportArtifact.cache_key.in_(keys)
+        ).delete(synchronize_session=False)
+
+    @classmethod
+    def cleanup(cls, db) -> int:
+        """TTL 경과 파일 삭제 (삭제 건수 반환)"""
+        expired_keys = [
+            key for (key,) in db.query(ComExportArtifact.cache_key).filter(
+                ComExportArtifact.expires_at <= datetime.now()
+            ).all()
+        ]
+
+        removed = 0
+        for i in range(0, len(expired_keys), 100):
+            removed += cls._delete(db, expired_keys[i:i + 100])
+            db.commit()
+        return removed
+
+
+async def cleanup_export_artifacts():
+    """만료된 엑셀 다운로드 파일 정리 (스케줄 작업)"""
+    db = SessionLocal()
+    try:
+        removed = EXPORT_ARTIFACT_STORE.cleanup(db)
+        if removed:
+            print(f"[{datetime.now()}] 만료된 엑셀 다운로드 파일 {removed}개 삭제")
+    except Exception as e:
+        db.rollback()
+        print(f"[{datetime.now()}] 엑셀 다운로드 파일 정리 실패: {str(e)}")
+    finally:
+        db.close()
@@ -0,0 +1,238 @@
+# 로컬 1688 게이트웨이 대역 서버 (부하 테스트 / 벤치마크용 ASGI 앱)
+# 실행 예: python -m app.utils.fake_1688_server --port 9688 --latency-ms 30-120 --error-rate 0.02
+#   → 1688 계정의 base_url 을 http://127.0.0.1:9688/openapi/ 로 변경 (계정 변경 감시로 재시작 없이 반영)
+from app.core.config_1688 import ALIBABA_1688_API_CONFIG
+from app.utils.record_replay_1688 import ReplayStore1688
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+from itertools import count
+import argparse
+import asyncio
+import hmac
+import json
+import random
+import time
+import zlib
+
+API_PATH_PREFIX = "param2/1/"
+
+
+class Fake1688Settings:
+    """대역 서버 동작 설정 (지연 / 오류 주입 비율)"""
+
+    def __init__(
+            self,
+            app_secrets: dict = None,
+            verify_signature: bool = True,
+            latency_ms: tuple = (0, 0),
+            error_rate: float = 0.0,
+            not_shipped_rate: float = 0.3,
+            replay_store: ReplayStore1688 = None,
+            seed: int = None
+    ):
+        self.app_secrets = app_secrets or {}  # app_key -> app_secret
+        self.verify_signature = verify_signature
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate  # 503 / gw.QpsOverLimit 응답 비율
+        self.not_shipped_rate = not_shipped_rate  # 물류 조회 500_2(미발송) 응답 비율
+        self.replay_store = replay_store
+        self.random = random.Random(seed)
+
+
+def _stable_number(*values) -> int:
+    # 프로세스마다 달라지는 hash() 대신 고정 값 사용 (재실행 시 같은 응답)
+    return zlib.crc32("|".join(str(value) for value in values).encode("utf-8"))
+
+
+def _sku_info_payload(offer_id: str) -> dict:
+    colors = ["红色", "黑色", "白色"]
+    sizes = ["S", "M", "L"]
+    return {
+        "result": {
+            "success": True,
+            "code": "200",
+            "result": {
+                "offerId": int(offer_id) if offer_id.isdigit() else offer_id,
+                "openUid": f"BBBfake{_stable_number(offer_id) % 100000:05d}",
+                "skuSimpleInfos": [
+                    {
+                        "skuId": int(f"{_stable_number(offer_id) % 100000}{index:02d}"),
+                        "specId": f"spec{_stable_number(offer_id, color, size):012d}",
+                        "attributes": [
+                            {"attributeName": "颜色", "attributeValue": color},
+                            {"attributeName": "尺码", "attributeValue": size},
+                        ]
+                    }
+                    for index, (color, size) in enumerate((c, s) for c in colors for s in sizes)
+                ]
+            }
+        }
+    }
+
+
+def create_fake_1688_app(settings: Fake1688Settings = None) -> FastAPI:
+    """1688 OpenAPI(param2) 형식 요청을 받아 서명 검증 후 실제와 유사한 응답 반환"""
+    settings = settings or Fake1688Settings()
+    order_ids = count(int(time.time()) * 1000)
+    stats = {"requests": 0, "signature_errors": 0, "injected_errors": 0, "replayed": 0}
+
+    app = FastAPI(title="Fake 1688 OpenAPI")
+
+    def logistics_payload(params: dict) -> dict:
+        order_id = params.get("orderId", "")
+        if settings.random.random() < settings.not_shipped_rate:
+            return {"success": False, "errorCode": "500_2", "errorMessage": "该订单没有物流信息"}
+
+        status = settings.random.choice(["SEND", "SEND", "ACCEPT", "SIGN"])
+        return {
+            "success": True,
+            "result": [{
+                "logisticsId": f"BX{order_id[-10:]}",
+                "logisticsBillNo": f"YT{order_id[-10:]}",
+                "logisticsCompanyId": "9",
+                "logisticsCompanyName": "圆通速递",
+                "status": status,
+                "orderEntryIds": order_id,
+            }]
+        }
+
+    def create_order_payload(params: dict) -> dict:
+        cargo_list = json.loads(params.get("cargoParamList") or "[]")
+        total_quantity = sum(int(cargo.get("quantity", 0)) for cargo in cargo_list)
+        return {
+            "success": True,
+            "result": {
+                "orderId": str(next(order_ids)),
+                "totalSuccessAmount": total_quantity * 1000,
+                "postFee": 500,
+            }
+        }
+
+    def preview_payload(params: dict) -> dict:
+        cargo_list = json.loads(params.get("cargoParamList") or "[]")
+        return {
+            "success": True,
+            "orderPreviewResuslt": [{
+                "sumPayment": sum(int(cargo.get("quantity", 0)) for cargo in cargo_list) * 1000,
+                "sumCarriage": 500,
+                "cargoList": [
+                    {"offerId": cargo.get("offerId"), "specId": cargo.get("specId"), "amount": 1000, "finalUnitPrice": 10.0}
+                    for cargo in cargo_list
+                ]
+            }]
+        }
+
+    def grouppay_payload(params: dict) -> dict:
+        return {
+            "success": True,
+            "payUrl": f"https://trade.1688.com/order/cashier.htm?orderIds={params.get('orderIds', '')}"
+        }
+
+    handlers = {
+        "com.alibaba.logistics/alibaba.trade.getLogisticsInfos.buyerView": logistics_payload,
+        "com.alibaba.trade/alibaba.trade.fastCreateOrder": create_order_payload,
+        "com.alibaba.trade/alibaba.createOrder.preview": preview_payload,
+        "com.alibaba.trade/alibaba.trade.grouppay.url.get": grouppay_payload,
+        "com.alibaba.product/product.skuinfo.get": lambda params: _sku_info_payload(str(params.get("offerId", ""))),
+    }
+
+    @app.get("/_fake/stats")
+    async def fake_stats():
+        return {
+            **stats,
+            "replay_endpoints": settings.replay_store.endpoints() if settings.replay_store else {}
+        }
+
+    @app.post("/{full_path:path}")
+    async def handle_api(full_path: str, request: Request):
+        stats["requests"] += 1
+        params = dict(await request.form())
+
+        prefix_index = full_path.find(API_PATH_PREFIX)
+        if prefix_index < 0:
+            return JSONResponse(status_code=404, content={"error_code": "gw.ApiNotFound", "error_message": "api not found"})
+
+        api_path = full_path[prefix_index:]
+        api_endpoint, _, app_key = api_path[len(API_PATH_PREFIX):].rpartition("/")
+
+        # 서명 검증 (generate_signature 와 동일한 방식)
+        if settings.verify_signature:
+            app_secret = settings.app_secrets.get(app_key)
+            config = {"app_secret": app_secret or "", "account_no": "fake", "login_id": app_key}
+            expected = ALIBABA_1688_API_CONFIG.generate_signature(api_path, params, config) if app_secret else None
+            if not expected or not hmac.compare_digest(expected, str(params.get("_aop_signature", "")).upper()):
+                stats["signature_errors"] += 1
+                return JSONResponse(status_code=401, content={
+                    "error_code": "gw.SignatureInvalid",
+                    "error_message": "Request signature is invalid",
+                    "request_id": f"fake-{stats['requests']}"
+                })
+
+        low, high = settings.latency_ms
+        if high > 0:
+            await asyncio.sleep(settings.random.uniform(low, high) / 1000)
+
+        if settings.random.random() < settings.error_rate:
+            stats["injected_errors"] += 1
+            if settings.random.random() < 0.5:
+                return JSONResponse(status_code=503, content={"error_code": "gw.ServiceUnavailable", "error_message": "service unavailable"})
+            return JSONResponse(content={"error_code": "gw.QpsOverLimit", "error_message": "App call exceeds limited frequency"})
+
+        if settings.replay_store:
+            recorded = settings.replay_store.lookup(api_endpoint, params)
+            if recorded is not None:
+                stats["replayed"] += 1
+                status_code, body = recorded
+                return Response(content=body, status_code=status_code, media_type="application/json")
+
+        handler = handlers.get(api_endpoint)
+        if handler is None:
+            return JSONResponse(status_code=404, content={"error_code": "gw.ApiNotFound", "error_message": f"{api_endpoint} not found"})
+
+        return JSONResponse(content=handler(params))
+
+    return app
+
+
+def _load_app_secrets_from_db() -> dict:
+    from app.core.database import SessionLocal
+    from app.modules.common.models import ComAccountInfo1688
+
+    db = SessionLocal()
+    try:
+        return {account.app_key: account.app_secret for account in db.query(ComAccountInfo1688).all() if account.app_key}
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="로컬 1688 게이트웨이 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9688)
+    parser.add_argument("--secret", action="append", default=[], help="APP_KEY=APP_SECRET (미지정 시 DB 계정 정보 사용)")
+    parser.add_argument("--no-verify", action="store_true", help="서명 검증 생략")
+    parser.add_argument("--latency-ms", default="0-0", help="응답 지연 범위 (예: 30-120)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 / QpsOverLimit 응답 비율 (0~1)")
+    parser.add_argument("--not-shipped-rate", type=float, default=0.3, help="물류 조회 500_2 응답 비율 (0~1)")
+    parser.add_argument("--replay-dir", help="RECORD_1688_DIR 로 녹화한 응답 재생")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    secrets = dict(item.split("=", 1) for item in args.secret)
+    if not secrets and not args.no_verify:
+        secrets = _load_app_secrets_from_db()
+
+    low, _, high = args.latency_ms.partition("-")
+    fake_settings = Fake1688Settings(
+        app_secrets=secrets,
+        verify_signature=not args.no_verify,
+        latency_ms=(float(low), float(high or low)),
+        error_rate=args.error_rate,
+        not_shipped_rate=args.not_shipped_rate,
+        replay_store=ReplayStore1688.load(args.replay_dir) if args.replay_dir else None,
+        seed=args.seed
+    )
+
+    uvicorn.run(create_fake_1688_app(fake_settings), host=args.host, port=args.port)
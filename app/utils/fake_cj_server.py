@@ -0,0 +1,162 @@
+# 로컬 CJ대한통운 API 대역 서버 (운송장 발급 / 배송 추적 테스트용 ASGI 앱)
+# 실행 예: python -m app.utils.fake_cj_server --port 9505 --latency-ms 20-80 --error-rate 0.02
+#   → CJ_LOGISTICS_BASE_URL=http://127.0.0.1:9505/ 로 API / 워커 실행
+from app.core.config import CJ_LOGISTICS_CONFIG
+from collections import defaultdict
+from datetime import datetime, timedelta
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from itertools import count
+import argparse
+import asyncio
+import random
+import secrets
+
+# 조회할 때마다 한 단계씩 진행되는 화물 상태 (집화 → 간선상차 → 간선하차 → 배송출발 → 배달완료)
+CJ_SCAN_STEPS = [
+    ("11", "집화처리"),
+    ("41", "간선상차"),
+    ("42", "간선하차"),
+    ("82", "배송출발"),
+    ("91", "배달완료"),
+]
+
+
+class FakeCjSettings:
+    """대역 서버 동작 설정 (지연 / 오류 주입 비율, 배송 진행 속도)"""
+
+    def __init__(
+            self,
+            latency_ms: tuple = (0, 0),
+            error_rate: float = 0.0,
+            steps_per_poll: int = 1,
+            tracking_process: str = None,
+            token_ttl_seconds: int = 86400,
+            seed: int = None
+    ):
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate  # RESULT_CD=E 응답 비율
+        self.steps_per_poll = steps_per_poll  # 추적 조회 1회당 진행되는 상태 단계 수
+        self.tracking_process = tracking_process or CJ_LOGISTICS_CONFIG.TRACKING_PROCESS
+        self.token_ttl_seconds = token_ttl_seconds
+        self.random = random.Random(seed)
+
+
+def _error(detail: str) -> dict:
+    return {"RESULT_CD": "E", "RESULT_DETAIL": detail}
+
+
+def create_fake_cj_app(settings: FakeCjSettings = None) -> FastAPI:
+    """CJ API 형식 요청({"DATA": {...}})을 받아 토큰 검증 후 실제와 유사한 응답 반환"""
+    settings = settings or FakeCjSettings()
+    invoice_numbers = count(int(datetime.now().strftime("%y%m%d")) * 1000000)
+    tokens = {}  # token -> 만료 일시
+    polls = defaultdict(int)  # 운송장 번호 -> 추적 조회 횟수
+    stats = {"requests": 0, "tokens_issued": 0, "invoices_issued": 0, "tracking_queries": 0, "token_errors": 0, "injected_errors": 0}
+
+    app = FastAPI(title="Fake CJ Logistics API")
+
+    def issue_token(data: dict) -> dict:
+        if not data.get("CUST_ID"):
+            return _error("CUST_ID 누락")
+        token = secrets.token_hex(16)
+        expires_at = datetime.now() + timedelta(seconds=settings.token_ttl_seconds)
+        tokens[token] = expires_at
+        stats["tokens_issued"] += 1
+        return {
+            "RESULT_CD": "S",
+            "RESULT_DETAIL": "성공",
+            "DATA": {"TOKEN_NUM": token, "TOKEN_EXPRTN_DTM": expires_at.strftime("%Y%m%d%H%M%S")}
+        }
+
+    def issue_invoice(data: dict) -> dict:
+        invoice_number = str(next(invoice_numbers))
+        stats["invoices_issued"] += 1
+        return {"RESULT_CD": "S", "RESULT_DETAIL": "성공", "DATA": {"INVC_NO": invoice_number}}
+
+    def tracking(data: dict) -> dict:
+        invoice_number = str(data.get("INVC_NO", ""))
+        if not invoice_number:
+            return _error("INVC_NO 누락")
+
+        stats["tracking_queries"] += 1
+        polls[invoice_number] += 1
+        # 첫 조회는 집화 전(스캔 없음), 이후 조회마다 steps_per_poll 단계씩 진행
+        step_count = min((polls[invoice_number] - 1) * settings.steps_per_poll, len(CJ_SCAN_STEPS))
+        scanned_at = datetime.now()
+        scans = [
+            {
+                "INVC_NO": invoice_number,
+                "CRG_ST": code,
+                "CRG_ST_NM": name,
+                "SCAN_YMD": scanned_at.strftime("%Y%m%d"),
+                "SCAN_HOUR": f"{scanned_at:%H%M}{index:02d}",
+            }
+            for index, (code, name) in enumerate(CJ_SCAN_STEPS[:step_count])
+        ]
+        return {"RESULT_CD": "S", "RESULT_DETAIL": "성공", "DATA": {"INVC_NO": invoice_number, "SCAN_LIST": scans}}
+
+    handlers = {
+        "ReqInvcNo": issue_invoice,
+        settings.tracking_process: tracking,
+    }
+
+    @app.get("/_fake/stats")
+    async def fake_stats():
+        return {**stats, "active_tokens": len(tokens), "tracked_invoices": len(polls)}
+
+    @app.post("/{process}")
+    async def handle_api(process: str, request: Request):
+        stats["requests"] += 1
+        data = (await request.json()).get("DATA") or {}
+
+        low, high = settings.latency_ms
+        if high > 0:
+            await asyncio.sleep(settings.random.uniform(low, high) / 1000)
+
+        if process == "ReqOneDayToken":
+            return JSONResponse(content=issue_token(data))
+
+        handler = handlers.get(process)
+        if handler is None:
+            return JSONResponse(status_code=404, content=_error(f"{process} not found"))
+
+        # 토큰 검증 (헤더 / TOKEN_NUM 모두 발급된 미만료 토큰이어야 함)
+        token = request.headers.get("CJ-Gateway-APIKey")
+        expires_at = tokens.get(token)
+        if not expires_at or expires_at <= datetime.now() or data.get("TOKEN_NUM") != token:
+            stats["token_errors"] += 1
+            return JSONResponse(content=_error("유효하지 않은 토큰입니다."))
+
+        if settings.random.random() < settings.error_rate:
+            stats["injected_errors"] += 1
+            return JSONResponse(content=_error("일시적인 오류입니다."))
+
+        return JSONResponse(content=handler(data))
+
+    return app
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="로컬 CJ대한통운 API 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9505)
+    parser.add_argument("--latency-ms", default="0-0", help="응답 지연 범위 (예: 20-80)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="RESULT_CD=E 응답 비율 (0~1)")
+    parser.add_argument("--steps-per-poll", type=int, default=1, help="추적 조회 1회당 진행되는 배송 단계 수")
+    parser.add_argument("--token-ttl-seconds", type=int, default=86400)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    low, _, high = args.latency_ms.partition("-")
+    fake_settings = FakeCjSettings(
+        latency_ms=(float(low), float(high or low)),
+        error_rate=args.error_rate,
+        steps_per_poll=args.steps_per_poll,
+        token_ttl_seconds=args.token_ttl_seconds,
+        seed=args.seed
+    )
+
+    uvicorn.run(create_fake_cj_app(fake_settings), host=args.host, port=args.port)
@@ -0,0 +1,92 @@
+# 1688 API 응답 녹화 / 재생 (부하 테스트용)
+# 녹화: RECORD_1688_DIR 설정 시 post_1688_api 응답을 엔드포인트별 JSONL로 저장
+# 재생: python -m app.utils.fake_1688_server --replay-dir <녹화 디렉터리>
+from app.core.config import HTTP_1688_CONFIG
+from collections import defaultdict
+from datetime import datetime
+import itertools
+import json
+import os
+
+# 요청 매칭 / 저장에서 제외하는 파라미터 (인증 정보, 호출마다 바뀌는 값)
+VOLATILE_1688_PARAMS = ("access_token", "_aop_signature", "timestamp", "_aop_timestamp")
+
+
+def _endpoint_file_name(api_endpoint: str) -> str:
+    return api_endpoint.replace("/", "__") + ".jsonl"
+
+
+def _request_key(params: dict) -> str:
+    return json.dumps(
+        {key: str(value) for key, value in sorted(params.items()) if key not in VOLATILE_1688_PARAMS},
+        ensure_ascii=False
+    )
+
+
+class RECORDER_1688:
+    """1688 실제 응답 녹화 (RECORD_1688_DIR 미설정 시 비활성)"""
+    record_dir = HTTP_1688_CONFIG.RECORD_DIR
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return bool(cls.record_dir)
+
+    @classmethod
+    def record(cls, api_endpoint: str, params: dict, status_code: int, body: str):
+        try:
+            os.makedirs(cls.record_dir, exist_ok=True)
+            line = json.dumps({
+                "endpoint": api_endpoint,
+                "request_key": _request_key(params),
+                "status_code": status_code,
+                "body": body,
+                "recorded_at": datetime.now().isoformat()
+            }, ensure_ascii=False)
+
+            with open(os.path.join(cls.record_dir, _endpoint_file_name(api_endpoint)), "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except Exception as e:
+            # 녹화 실패가 실제 호출에 영향을 주지 않도록 로그만 남김
+            print(f"1688 응답 녹화 실패 ({api_endpoint}): {str(e)}")
+
+
+class ReplayStore1688:
+    """녹화된 응답 재생 (같은 요청이면 해당 응답, 없으면 엔드포인트 응답을 순환 재생)"""
+
+    def __init__(self):
+        self._by_request = {}
+        self._by_endpoint = defaultdict(list)
+        self._cycles = {}
+
+    @classmethod
+    def load(cls, replay_dir: str):
+        store = cls()
+        for file_name in sorted(os.listdir(replay_dir)):
+            if not file_name.endswith(".jsonl"):
+                continue
+            with open(os.path.join(replay_dir, file_name), encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        store.add(json.loads(line))
+        return store
+
+    def add(self, recorded: dict):
+        response = (recorded["status_code"], recorded["body"])
+        self._by_request[(recorded["endpoint"], recorded["request_key"])] = response
+        self._by_endpoint[recorded["endpoint"]].append(response)
+        self._cycles.pop(recorded["endpoint"], None)
+
+    def lookup(self, api_endpoint: str, params: dict):
+        """(status_code, body) 또는 None"""
+        response = self._by_request.get((api_endpoint, _request_key(params)))
+        if response is not None:
+            return response
+
+        if not self._by_endpoint.get(api_endpoint):
+            return None
+        if api_endpoint not in self._cycles:
+            self._cycles[api_endpoint] = itertools.cycle(self._by_endpoint[api_endpoint])
+        return next(self._cycles[api_endpoint])
+
+    def endpoints(self) -> dict:
+        return {endpoint: len(responses) for endpoint, responses in self._by_endpoint.items()}
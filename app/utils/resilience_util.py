@@ -0,0 +1,149 @@
+import asyncio
+import random
+import time
+from collections import defaultdict
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 호출하지 않고 즉시 실패"""
+
+    def __init__(self, name: str):
+        super().__init__(f"서킷 브레이커 차단 중: {name}")
+        self.name = name
+
+
+class TransientError(Exception):
+    """재시도 가능한 일시적 오류 (타임아웃, 5xx, 호출 한도 초과 등)"""
+
+    def __init__(self, message: str, throttled: bool = False):
+        super().__init__(message)
+        self.throttled = throttled  # 호출 한도 초과로 요청이 거절됨 (처리되지 않았으므로 재호출 안전)
+
+
+class ResilienceMetrics:
+    """재시도 / 서킷 차단 횟수 집계"""
+
+    def __init__(self):
+        self.retries = defaultdict(int)
+        self.trips = defaultdict(int)
+        self.short_circuits = defaultdict(int)
+
+    def snapshot(self) -> dict:
+        return {
+            "retries": dict(self.retries),
+            "trips": dict(self.trips),
+            "short_circuits": dict(self.short_circuits),
+        }
+
+
+class CircuitBreaker:
+    """
+    연속 실패 failure_threshold회 이상이면 OPEN (즉시 실패)
+    reset_timeout초 후 HALF_OPEN으로 1건 시험 호출 → 성공 시 CLOSED, 실패 시 다시 OPEN
+    """
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float, metrics: ResilienceMetrics = None):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.metrics = metrics
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+
+    def allow(self) -> bool:
+        """호출 허용 여부"""
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            self._trial_in_flight = False
+
+        if self.state == self.HALF_OPEN:
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+
+        return True
+
+    def check(self):
+        """호출 불가 시 CircuitOpenError 발생"""
+        if not self.allow():
+            if self.metrics:
+                self.metrics.short_circuits[self.name] += 1
+            raise CircuitOpenError(self.name)
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def release(self):
+        """결과 판정 없이 시험 호출 슬롯만 반환 (업스트림 장애가 아닌 오류)"""
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                print(f"⚠️ 서킷 브레이커 OPEN: {self.name} (연속 실패 {self.failures}회)")
+                if self.metrics:
+                    self.metrics.trips[self.name] += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+
+class CircuitBreakerRegistry:
+    """이름별 서킷 브레이커 보관"""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float, metrics: ResilienceMetrics = None):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.metrics = metrics
+        self._breakers = {}
+
+    def get(self, name: str) -> CircuitBreaker:
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name, self.failure_threshold, self.reset_timeout, self.metrics)
+            self._breakers[name] = breaker
+        return breaker
+
+    def states(self) -> dict:
+        return {name: breaker.state for name, breaker in self._breakers.items()}
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """지수 백오프 + full jitter (attempt는 0부터)"""
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+async def retry_async(func, retries: int, base_delay: float, max_delay: float,
+                      is_retryable=lambda e: isinstance(e, TransientError), on_retry=None):
+    """
+    일시적 오류에 대해 지수 백오프(jitter)로 재시도
+
+    Args:
+        func: 인자 없는 코루틴 함수
+        retries: 최대 재시도 횟수 (총 시도 = retries + 1)
+        is_retryable: 재시도 대상 예외 판별 함수
+        on_retry: 재시도 직전 호출 (attempt, exception)
+    """
+    attempt = 0
+    while True:
+        try:
+            return await func()
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            if attempt >= retries or not is_retryable(e):
+                raise
+            if on_retry:
+                on_retry(attempt, e)
+            await asyncio.sleep(backoff_delay(attempt, base_delay, max_delay))
+            attempt += 1
@@ -0,0 +1,178 @@
+# app/utils/translation_util.py
+# 번역 서비스: 메모리 LRU → DB 메모 테이블 → 번역 백엔드 순으로 조회
+from app.core.config import TRANSLATION_CONFIG
+from app.core.database import SessionLocal
+from app.modules.common.models import ComTranslationCache
+from app.utils.cache_util import TTLCache
+from googletrans import Translator
+from typing import List, Optional
+import hashlib
+import json
+
+
+class GoogleTranslateBackend:
+    """googletrans 백엔드 (Translator 1개를 재사용, 목록 입력 시 일괄 번역)"""
+
+    def __init__(self):
+        self._translator = None
+
+    def _get_translator(self):
+        if self._translator is None:
+            self._translator = Translator(
+                raise_exception=True,
+                list_operation_max_concurrency=TRANSLATION_CONFIG.BACKEND_CONCURRENCY
+            )
+        return self._translator
+
+    async def translate_many(self, texts: List[str], src: str, dest: str) -> List[str]:
+        results = await self._get_translator().translate(list(texts), src=src, dest=dest)
+        return [result.text for result in results]
+
+
+class LocalDictionaryBackend:
+    """로컬 사전 백엔드 (오프라인 테스트용, 사전에 없는 문장은 원문 반환)"""
+
+    def __init__(self, dictionary: dict = None):
+        self.dictionary = dict(dictionary or {})
+
+    @classmethod
+    def from_file(cls, path: str):
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    async def translate_many(self, texts: List[str], src: str, dest: str) -> List[str]:
+        return [self.dictionary.get(text, text) for text in texts]
+
+
+def _build_backend():
+    if TRANSLATION_CONFIG.BACKEND == "local":
+        if TRANSLATION_CONFIG.LOCAL_DICTIONARY_PATH:
+            return LocalDictionaryBackend.from_file(TRANSLATION_CONFIG.LOCAL_DICTIONARY_PATH)
+        return LocalDictionaryBackend()
+    return GoogleTranslateBackend()
+
+
+class TRANSLATION_SERVICE:
+    """번역 서비스 (백엔드 교체 가능: set_backend)"""
+    _backend = None
+    _memory = TTLCache(TRANSLATION_CONFIG.MEMORY_MAX_ENTRIES, TRANSLATION_CONFIG.MEMORY_TTL_SECONDS)
+    stats = {"db_hits": 0, "backend_calls": 0, "backend_texts": 0, "backend_failures": 0}
+
+    @classmethod
+    def get_backend(cls):
+        if cls._backend is None:
+            cls._backend = _build_backend()
+        return cls._backend
+
+    @classmethod
+    def set_backend(cls, backend):
+        """번역 백엔드 교체 (translate_many(texts, src, dest) 코루틴을 가진 객체)"""
+        cls._backend = backend
+        cls._memory.clear()
+
+    @staticmethod
+    def text_hash(text: str, src: str, dest: str) -> str:
+        return hashlib.sha256(f"{src}|{dest}|{text}".encode("utf-8")).hexdigest()
+
+    @classmethod
+    def _load_memos(cls, hashes: List[str]) -> dict:
+        if not hashes:
+            return {}
+
+        db = SessionLocal()
+        try:
+            rows = db.query(ComTranslationCache.text_hash, ComTranslationCache.translated_text).filter(
+                ComTranslationCache.text_hash.in_(hashes)
+            ).all()
+            return {text_hash: translated for text_hash, translated in rows}
+        except Exception as e:
+            print(f"번역 메모 조회 실패: {str(e)}")
+            return {}
+        finally:
+            db.close()
+
+    @classmethod
+    def _save_memos(cls, memos: List[dict]):
+        if not memos:
+            return
+
+        db = SessionLocal()
+        try:
+            for memo in memos:
+                db.merge(ComTranslationCache(**memo))
+            db.commit()
+        except Exception as e:
+            # 메모 저장 실패는 번역 결과에 영향 없음 (동시 저장 충돌 등)
+            db.rollback()
+            print(f"번역 메모 저장 실패: {str(e)}")
+        finally:
+            db.close()
+
+    @classmethod
+    async def translate_many(cls, texts: List[str], src: str = "zh-cn", dest: str = "ko") -> List[str]:
+        """
+        여러 문장 일괄 번역 (입력 순서대로 반환)
+
+        중복 / 캐시 적중 문장은 백엔드를 호출하지 않으며, 백엔드 실패 시 원문을 반환하고 메모하지 않는다.
+        """
+        translated = {}
+        pending = {}  # text_hash -> text
+
+        for text in texts:
+            if not text or not text.strip():
+                continue
+            text_hash = cls.text_hash(text, src, dest)
+            if text_hash in translated or text_hash in pending:
+                continue
+
+            cached = cls._memory.get(text_hash)
+            if cached is not None:
+                translated[text_hash] = cached
+            else:
+                pending[text_hash] = text
+
+        memos = cls._load_memos(list(pending.keys()))
+        for text_hash, translated_text in memos.items():
+            cls.stats["db_hits"] += 1
+            translated[text_hash] = translated_text
+            cls._memory.set(text_hash, translated_text)
+            pending.pop(text_hash, None)
+
+        pending_items = list(pending.items())
+        for start in range(0, len(pending_items), TRANSLATION_CONFIG.BATCH_SIZE):
+            chunk = pending_items[start:start + TRANSLATION_CONFIG.BATCH_SIZE]
+            cls.stats["backend_calls"] += 1
+            cls.stats["backend_texts"] += len(chunk)
+
+            try:
+                results = await cls.get_backend().translate_many([text for _, text in chunk], src, dest)
+            except Exception as e:
+                cls.stats["backend_failures"] += 1
+                print(f"번역 실패: {str(e)}")
+                continue
+
+            new_memos = []
+            for (text_hash, text), translated_text in zip(chunk, results):
+                translated[text_hash] = translated_text
+                cls._memory.set(text_hash, translated_text)
+                new_memos.append({
+                    "text_hash": text_hash,
+                    "src_lang": src,
+                    "dest_lang": dest,
+                    "source_text": text,
+                    "translated_text": translated_text
+                })
+            cls._save_memos(new_memos)
+
+        return [translated.get(cls.text_hash(text, src, dest), text) if text else text for text in texts]
+
+    @classmethod
+    async def translate(cls, text: Optional[str], src: str = "zh-cn", dest: str = "ko") -> Optional[str]:
+        """단일 문장 번역 (실패 시 원문 반환)"""
+        if not text:
+            return text
+        return (await cls.translate_many([text], src, dest))[0]
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        return {"memory": cls._memory.stats(), **cls.stats}
@@ -0,0 +1,50 @@
+# 1688 메시지 푸시 로컬 발신기 (개발 / 테스트용)
+# 실행 예: python -m app.utils.webhook_1688_sender http://localhost:8000 1 123456789 BX1234567890 SIGN
+from app.core.config_1688 import ALIBABA_1688_API_CONFIG
+import httpx
+import json
+import sys
+import time
+
+
+def build_1688_logistics_message(order_id: str, logistics_id: str, status: str) -> dict:
+    """LOGISTICS_BUYER_VIEW_TRACE 형식의 테스트 메시지 생성"""
+    return {
+        "msgId": int(time.time() * 1000),
+        "gmtBorn": int(time.time() * 1000),
+        "type": "LOGISTICS_BUYER_VIEW_TRACE",
+        "userInfo": "local-sender",
+        "data": {
+            "OrderLogisticsTracingModel": {
+                "logisticsId": logistics_id,
+                "statusChanged": status,
+                "orderLogsItems": [{"orderId": order_id}]
+            }
+        }
+    }
+
+
+def build_1688_push_form(app_secret: str, message_data: dict) -> dict:
+    """1688과 동일한 방식으로 서명한 푸시 요청 form 생성"""
+    message = json.dumps(message_data, ensure_ascii=False)
+    config = {"app_secret": app_secret, "account_no": "local", "login_id": "local-sender"}
+    signature = ALIBABA_1688_API_CONFIG.generate_signature("", {"message": message}, config)
+    return {"message": message, "_aop_signature": signature}
+
+
+def send_1688_push(base_url: str, account_info_no_1688: int, app_secret: str, message_data: dict) -> httpx.Response:
+    """로컬 서버의 1688 webhook 엔드포인트로 메시지 전송"""
+    form = build_1688_push_form(app_secret, message_data)
+    return httpx.post(f"{base_url.rstrip('/')}/webhooks/1688/{account_info_no_1688}", data=form, timeout=10.0)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 6:
+        print("usage: python -m app.utils.webhook_1688_sender <base_url> <account_no> <order_id> <logistics_id> <status> [app_secret]")
+        sys.exit(1)
+
+    base_url, account_no, order_id, logistics_id, status = sys.argv[1:6]
+    secret = sys.argv[6] if len(sys.argv) > 6 else input("app_secret: ")
+
+    response = send_1688_push(base_url, int(account_no), secret, build_1688_logistics_message(order_id, logistics_id, status))
+    print(response.status_code, response.text)
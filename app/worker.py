@@ -0,0 +1,72 @@
+# app/worker.py
+# 스케줄러 / 백그라운드 작업 전용 프로세스
+# 실행: python -m app.worker  (API 프로세스는 SCHEDULER_RUN_IN_API=false 로 실행)
+from app.core.database import SessionLocal
+from app.core.config_1688 import ALIBABA_1688_API_CONFIG
+from app.core.http_client_1688 import HTTP_CLIENT_1688
+from app.core.http_client_cj import HTTP_CLIENT_CJ
+from app.utils.cj_logistics_util import CJ_TOKEN_MANAGER
+from app.scheduler.jobs import register_jobs
+from app.modules.job.service import JOB_WORKER_POOL
+from app.modules.purchase import service as purchase_service
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+import asyncio
+import signal
+
+
+async def main():
+    print("Worker starting...")
+
+    db = SessionLocal()
+    try:
+        ALIBABA_1688_API_CONFIG.load_all_configs(db)
+        print("✅ 1688 API config loaded")
+    finally:
+        db.close()
+
+    ALIBABA_1688_API_CONFIG.start_watcher(SessionLocal)
+
+    # 작업 큐 처리 함수 등록
+    purchase_service.register_job_handlers()
+
+    HTTP_CLIENT_1688.start()
+    print("✅ 1688 HTTP client started")
+
+    # CJ대한통운 공용 HTTP 클라이언트 + 토큰 선제 갱신
+    HTTP_CLIENT_CJ.start()
+    CJ_TOKEN_MANAGER.start_refresher(SessionLocal)
+
+    scheduler = AsyncIOScheduler()
+    register_jobs(scheduler)
+    scheduler.start()
+    print("APScheduler started")
+
+    JOB_WORKER_POOL.start()
+    print("✅ Job queue workers started")
+
+    # 종료 시그널 대기
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:  # Windows
+            pass
+
+    try:
+        await stop_event.wait()
+    finally:
+        print("Worker shutting down...")
+        scheduler.shutdown()
+        await JOB_WORKER_POOL.stop()
+        await ALIBABA_1688_API_CONFIG.stop_watcher()
+        await CJ_TOKEN_MANAGER.stop_refresher()
+        await HTTP_CLIENT_1688.close()
+        await HTTP_CLIENT_CJ.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
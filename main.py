@@ -3,18 +3,25 @@ from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from app.core.dependencies import get_current_user_global
-from app.core.database import Base, engine, get_db
+from app.core.database import Base, engine, get_db, SessionLocal
 from app.core.config_1688 import ALIBABA_1688_API_CONFIG
+from app.core.http_client_1688 import HTTP_CLIENT_1688
+from app.core.http_client_cj import HTTP_CLIENT_CJ
+from app.utils.cj_logistics_util import CJ_TOKEN_MANAGER
 from app.modules.auth.router import auth_router
 from app.modules.dashboard.router import dashboard_router
 from app.modules.setting.router import setting_router
 from app.modules.common.router import common_router
 from app.modules.purchase.router import purchase_router
+from app.modules.webhook.router import webhook_router
+from app.modules.job.router import job_router
+from app.modules.system.router import system_router
+from app.modules.job.service import JOB_WORKER_POOL
+from app.modules.purchase import service as purchase_service
 from app.core.exceptions import setup_global_exception_handlers
-from app.scheduler import scheduler_1688
+from app.core.config import SCHEDULER_CONFIG
+from app.scheduler.jobs import register_jobs
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
-from apscheduler.triggers.interval import IntervalTrigger
 from contextlib import asynccontextmanager
 import platform
 import os
@@ -33,21 +40,40 @@ async def lifespan(app: FastAPI):
     finally:
         db.close()
 
-    # 스케줄러 작업 등록
-    scheduler.add_job(
-        func=scheduler_1688.sync_1688_order_status,  # 1688 구매 상태 배치 (함수만 전달, () 제거)
-        trigger=IntervalTrigger(hours=2),
-        id='sync_1688_order_status',  # 고유한 ID
-        name='1688 주문 상태 동기화'
-    )
+    # 1688 계정 설정 변경 감시 (재시작 없이 토큰 교체 반영)
+    ALIBABA_1688_API_CONFIG.start_watcher(SessionLocal)
+
+    # 1688 공용 HTTP 클라이언트 (keep-alive 커넥션 풀)
+    HTTP_CLIENT_1688.start()
+    print("✅ 1688 HTTP client started")
+
+    # CJ대한통운 공용 HTTP 클라이언트 + 토큰 선제 갱신
+    HTTP_CLIENT_CJ.start()
+    CJ_TOKEN_MANAGER.start_refresher(SessionLocal)
+
+    # 작업 큐 처리 함수 등록 (작업 등록 시 유형 검증에도 사용하므로 워커 실행 여부와 무관)
+    purchase_service.register_job_handlers()
+
+    # 스케줄러 작업 등록 (SCHEDULER_RUN_IN_API=false면 python -m app.worker 에서 실행)
+    if SCHEDULER_CONFIG.RUN_IN_API:
+        register_jobs(scheduler)
+        scheduler.start()
+        print("APScheduler started")
 
-    scheduler.start()
-    print("APScheduler started")
+        JOB_WORKER_POOL.start()
+        print("✅ Job queue workers started")
 
     yield
 
     print("Application shutting down...")
-    scheduler.shutdown()
+    if scheduler.running:
+        scheduler.shutdown()
+    await JOB_WORKER_POOL.stop()
+    await ALIBABA_1688_API_CONFIG.stop_watcher()
+    await CJ_TOKEN_MANAGER.stop_refresher()
+    await HTTP_CLIENT_1688.close()
+    await HTTP_CLIENT_CJ.close()
+    print("1688 HTTP client closed")
 
 
 def create_app():
@@ -102,6 +128,9 @@ def create_app():
     app.include_router(setting_router, prefix="/setting", tags=["setting"])
     app.include_router(common_router, prefix="/common", tags=["common"])
     app.include_router(purchase_router, prefix="/purchase", tags=["purchase"])
+    app.include_router(webhook_router, prefix="/webhooks", tags=["webhooks"])
+    app.include_router(job_router, prefix="/jobs", tags=["jobs"])
+    app.include_router(system_router, prefix="/system", tags=["system"])
 
     return app
 